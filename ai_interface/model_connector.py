@@ -2,8 +2,11 @@ from google import genai
 import os
 import logging
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
+from file_operations.file_lock import merge_into_json_file
+from pipeline_profiler import profile_span, record_transfer
 
 class AIResponseLogger:
     def __init__(self):
@@ -29,43 +32,68 @@ class AIResponseLogger:
         self.interaction_logger.info(f"AI_RESPONSE: {ai_response}")
 
 class ResponseCacheManager:
-    def __init__(self, cache_file_name: str = "ai_response_cache.json"):
+    def __init__(self, cache_file_name: str = "ai_response_cache.json", shared: bool = False):
         self.cache_file_path = Path(cache_file_name)
+        self.shared = shared
         self.response_cache = {}
+        self.loaded_modification_time = None
+        self.cache_lock = threading.Lock()
         self._load_existing_cache()
         
     def _load_existing_cache(self) -> None:
         if self.cache_file_path.exists():
             try:
+                self.loaded_modification_time = self.cache_file_path.stat().st_mtime
                 with open(self.cache_file_path, "r", encoding="utf-8") as cache_file:
-                    self.response_cache = json.load(cache_file)
+                    self.response_cache = {**self.response_cache, **json.load(cache_file)}
             except Exception as cache_error:
                 print(f"Warning: Failed to load AI response cache - {cache_error}")
-                self.response_cache = {}
                 
+    def _cache_file_changed(self) -> bool:
+        try:
+            return self.cache_file_path.stat().st_mtime != self.loaded_modification_time
+        except OSError:
+            return False
+            
     def get_cached_response(self, user_prompt: str) -> str:
-        return self.response_cache.get(user_prompt)
-        
+        with self.cache_lock:
+            cached_response = self.response_cache.get(user_prompt)
+            if cached_response is None and self.shared and self._cache_file_changed():
+                self._load_existing_cache()
+                cached_response = self.response_cache.get(user_prompt)
+            return cached_response
+            
     def cache_response(self, user_prompt: str, ai_response: str) -> None:
-        self.response_cache[user_prompt] = ai_response
-        try:
-            with open(self.cache_file_path, "w", encoding="utf-8") as cache_file:
-                json.dump(self.response_cache, cache_file, indent=2, ensure_ascii=False)
-        except Exception as save_error:
-            print(f"Warning: Failed to save AI response cache - {save_error}")
+        with self.cache_lock:
+            self.response_cache[user_prompt] = ai_response
+            try:
+                if self.shared:
+                    self.response_cache = merge_into_json_file(self.cache_file_path, {user_prompt: ai_response})
+                    self.loaded_modification_time = self.cache_file_path.stat().st_mtime
+                else:
+                    with open(self.cache_file_path, "w", encoding="utf-8") as cache_file:
+                        json.dump(self.response_cache, cache_file, indent=2, ensure_ascii=False)
+            except Exception as save_error:
+                print(f"Warning: Failed to save AI response cache - {save_error}")
 
 class LanguageModelConnector:
-    def __init__(self):
+    def __init__(self, cache_manager: ResponseCacheManager = None, request_throttle=None):
         self.logger = AIResponseLogger()
-        self.cache_manager = ResponseCacheManager()
+        self.cache_manager = cache_manager or ResponseCacheManager()
+        self.request_throttle = request_throttle
         self.api_key = os.environ.get('GEMINI_API_KEY')
+        self.ai_client = None
+        self.client_lock = threading.Lock()
         
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY environment variable must be set")
             
     def _create_ai_client(self):
-        return genai.Client(api_key=self.api_key)
-        
+        with self.client_lock:
+            if self.ai_client is None:
+                self.ai_client = genai.Client(api_key=self.api_key)
+            return self.ai_client
+            
     def generate_response(self, user_prompt: str, enable_caching: bool = True) -> str:
         self.logger.log_request(user_prompt)
         
@@ -75,6 +103,9 @@ class LanguageModelConnector:
                 self.logger.log_response(cached_response)
                 return cached_response
                 
+        if self.request_throttle:
+            self.request_throttle.wait_for_request_slot()
+            
         try:
             ai_client = self._create_ai_client()
             model_response = ai_client.models.generate_content(
@@ -96,11 +127,26 @@ class LanguageModelConnector:
             raise RuntimeError(error_message)
 
 _model_connector_instance = None
+_model_connector_lock = threading.Lock()
+
+def install_model_connector(model_connector):
+    global _model_connector_instance
+    
+    with _model_connector_lock:
+        previous_connector = _model_connector_instance
+        _model_connector_instance = model_connector
+    return previous_connector
 
 def query_language_model(user_prompt: str, use_cache: bool = True) -> str:
     global _model_connector_instance
     
-    if _model_connector_instance is None:
-        _model_connector_instance = LanguageModelConnector()
-        
-    return _model_connector_instance.generate_response(user_prompt, enable_caching=use_cache)
+    with _model_connector_lock:
+        if _model_connector_instance is None:
+            _model_connector_instance = LanguageModelConnector()
+            
+    prompt_bytes = len(user_prompt.encode("utf-8"))
+    with profile_span("query_language_model", "llm", prompt_bytes=prompt_bytes, use_cache=use_cache) as span_arguments:
+        generated_text = _model_connector_instance.generate_response(user_prompt, enable_caching=use_cache)
+        span_arguments["response_bytes"] = len(generated_text.encode("utf-8"))
+    record_transfer(bytes_in=span_arguments["response_bytes"], bytes_out=prompt_bytes, model_call=True)
+    return generated_text
@@ -0,0 +1,27 @@
+import time
+from pathlib import Path
+from typing import Union
+from file_operations.file_lock import InterProcessFileLock
+
+class InterProcessRequestThrottle:
+    def __init__(self, state_file_path: Union[str, Path], requests_per_minute: int):
+        self.state_file_path = Path(state_file_path)
+        self.requests_per_minute = requests_per_minute
+        
+    def wait_for_request_slot(self) -> float:
+        if self.requests_per_minute <= 0:
+            return 0.0
+            
+        request_interval = 60.0 / self.requests_per_minute
+        with InterProcessFileLock(self.state_file_path.with_name(self.state_file_path.name + ".lock")):
+            try:
+                next_free_slot = float(self.state_file_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                next_free_slot = 0.0
+            scheduled_time = max(time.time(), next_free_slot)
+            self.state_file_path.write_text(repr(scheduled_time + request_interval), encoding="utf-8")
+            
+        waiting_seconds = scheduled_time - time.time()
+        if waiting_seconds > 0:
+            time.sleep(waiting_seconds)
+        return max(0.0, waiting_seconds)
@@ -0,0 +1,98 @@
+import re
+import time
+import threading
+from typing import List
+
+FILE_LISTING_PATTERN = re.compile(r"^\s*- (\d+) #", re.M)
+CONCEPT_LISTING_PATTERN = re.compile(r"^-? ?(\d+) # ", re.M)
+EDGE_PATTERN = re.compile(r"^- Edge (\d+):", re.M)
+CHAPTER_NUMBER_PATTERN = re.compile(r"This is Chapter (\d+)")
+OUTLINE_ENTRY_PATTERN = re.compile(r"^(\d+)\. ", re.M)
+DRAFT_LINK_PATTERN = re.compile(r"^- (\[[^\]]+\]\(concept_\d+\.md\))", re.M)
+
+class SimulatedModelConnector:
+    def __init__(self, latency_seconds: float = 0.0, seconds_per_kilobyte: float = 0.0, concept_count: int = 5, chapter_paragraphs: int = 6):
+        self.latency_seconds = latency_seconds
+        self.seconds_per_kilobyte = seconds_per_kilobyte
+        self.concept_count = concept_count
+        self.chapter_paragraphs = chapter_paragraphs
+        self.request_count = 0
+        self.prompt_characters = 0
+        self.response_characters = 0
+        self.statistics_lock = threading.Lock()
+        
+    def generate_response(self, user_prompt: str, enable_caching: bool = True) -> str:
+        simulated_delay = self.latency_seconds + self.seconds_per_kilobyte * len(user_prompt) / 1024
+        if simulated_delay > 0:
+            time.sleep(simulated_delay)
+            
+        generated_text = self._respond(user_prompt)
+        with self.statistics_lock:
+            self.request_count += 1
+            self.prompt_characters += len(user_prompt)
+            self.response_characters += len(generated_text)
+        return generated_text
+        
+    def _respond(self, user_prompt: str) -> str:
+        if "Produce a compact digest" in user_prompt:
+            return "Purpose: Provides a component of the project.\nKey symbols: `def run()`: entry point.\nDependencies: standard library."
+        if "most crucial architectural concepts" in user_prompt:
+            return self._concepts_response(user_prompt)
+        if "derived from the import graph" in user_prompt:
+            edge_numbers = EDGE_PATTERN.findall(user_prompt)
+            label_lines = [f"  - edge: {edge_number}\n    label: Uses" for edge_number in edge_numbers]
+            return "```yaml\nsummary: |\n  A simulated project.\nlabels:\n" + "\n".join(label_lines) + "\n```"
+        if "ordered from the import graph" in user_prompt or "Translate the tutorial structure" in user_prompt:
+            return "```yaml\n" + user_prompt.split("```yaml\n", 1)[1].split("```", 1)[0] + "```"
+        if "from_abstraction" in user_prompt:
+            concept_indices = self._concept_indices(user_prompt, "Concept Index and Names", "Detailed Context")
+            relationship_lines = [
+                f"  - from_abstraction: {concept_index}\n    to_abstraction: {concept_indices[(position + 1) % len(concept_indices)]}\n    label: Uses"
+                for position, concept_index in enumerate(concept_indices)
+            ]
+            return "```yaml\nsummary: |\n  A simulated project.\nrelationships:\n" + "\n".join(relationship_lines) + "\n```"
+        if "determine the optimal sequence" in user_prompt:
+            concept_indices = self._concept_indices(user_prompt, "Available Concepts", "Project context")
+            return "```yaml\n" + "\n".join(f"- {concept_index} # concept" for concept_index in concept_indices) + "\n```"
+        if "write a short outline for every chapter" in user_prompt:
+            outline_entries = [
+                f"- chapter: {chapter_number}\n  outline: |\n    - Introduces chapter {chapter_number}."
+                for chapter_number in OUTLINE_ENTRY_PATTERN.findall(user_prompt)
+            ]
+            return "```yaml\n" + "\n".join(outline_entries) + "\n```"
+        if "Translate the following tutorial chapter" in user_prompt:
+            return user_prompt.split("Chapter to translate:", 1)[1].strip()
+        chapter_match = CHAPTER_NUMBER_PATTERN.search(user_prompt)
+        if chapter_match:
+            return self._chapter_response(f"# Chapter {chapter_match.group(1)}: Simulated Concept")
+        if "drafted before the chapter order is known" in user_prompt:
+            return self._chapter_response("# Simulated Concept", DRAFT_LINK_PATTERN.search(user_prompt))
+        return "```yaml\n[]\n```"
+        
+    def _concepts_response(self, user_prompt: str) -> str:
+        file_listing = user_prompt.split("Available file indices and paths:", 1)[-1].split("Structure the response", 1)[0]
+        file_indices = [int(file_index) for file_index in FILE_LISTING_PATTERN.findall(file_listing)] or [0]
+        concept_count = min(self.concept_count, len(file_indices))
+        concept_lines = ["```yaml"]
+        for concept_number in range(concept_count):
+            concept_lines += [
+                f"- name: |\n    Simulated Concept {concept_number}",
+                "  description: |\n    A part of the project that handles one responsibility.",
+                "  file_indices:",
+            ]
+            concept_lines += [f"    - {file_index} # file" for file_index in file_indices[concept_number::concept_count][:5] or file_indices[:1]]
+        return "\n".join(concept_lines) + "\n```"
+        
+    def _concept_indices(self, user_prompt: str, section_start: str, section_end: str) -> List[int]:
+        concept_section = user_prompt.split(section_start, 1)[-1].split(section_end, 1)[0]
+        return [int(concept_index) for concept_index in CONCEPT_LISTING_PATTERN.findall(concept_section)] or [0]
+        
+    def _chapter_response(self, chapter_heading: str, related_link=None) -> str:
+        paragraph_text = "This section walks through the concept step by step, explaining how the pieces fit together. " * 4
+        chapter_sections = [chapter_heading, ""]
+        for section_number in range(self.chapter_paragraphs):
+            chapter_sections += [f"## Section {section_number + 1}", "", paragraph_text.strip(), ""]
+        if related_link:
+            chapter_sections += [f"See also {related_link.group(1)}.", ""]
+        chapter_sections += ["```python", "def example():", "    return 42", "```", ""]
+        return "\n".join(chapter_sections)
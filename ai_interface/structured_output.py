@@ -0,0 +1,128 @@
+import re
+import json
+import yaml
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+from ai_interface.model_connector import query_language_model
+
+FENCED_BLOCK_PATTERN = re.compile(r"```[ \t]*([A-Za-z0-9_+-]*)[^\n]*\n(.*?)(?:\n[ \t]*```|\Z)", re.S)
+STRUCTURE_START_PATTERN = re.compile(r"^\s*(?:-\s|-$|[\[{]|[A-Za-z_][\w -]*:)")
+UNQUOTED_COLON_VALUE_PATTERN = re.compile(r"^(\s*(?:-\s+)?[A-Za-z_][\w-]*:[ \t]+)([^'\"|>&*!\s\[{#][^\n]*?:\s[^\n]*)$", re.M)
+INDEX_REFERENCE_PATTERN = re.compile(r"^\s*(?:index\s*|idx\s*|#\s*)?[\[(]?\s*(-?\d+)", re.I)
+MAX_TRUNCATED_LINES = 20
+
+class StructuredOutputError(ValueError):
+    pass
+
+def extract_structured_block(response_text: str) -> str:
+    fenced_blocks = FENCED_BLOCK_PATTERN.findall(response_text or "")
+    for block_language, block_body in fenced_blocks:
+        if block_language.lower() in ("yaml", "yml", "json"):
+            return block_body.strip()
+    if fenced_blocks:
+        return fenced_blocks[0][1].strip()
+    return (response_text or "").strip()
+
+def load_structured_data(block_text: str, allow_truncation: bool = True) -> Any:
+    first_error = None
+    for candidate_text, dropped_lines in _repair_candidates(block_text, allow_truncation):
+        for load_candidate in (yaml.safe_load, json.loads):
+            try:
+                parsed_data = load_candidate(candidate_text)
+            except Exception as load_error:
+                first_error = first_error or load_error
+                continue
+            if isinstance(parsed_data, (list, dict)):
+                if dropped_lines:
+                    print(f"Warning: Structured output was parsed after dropping its last {dropped_lines} line(s), which may have lost entries")
+                return parsed_data
+    raise StructuredOutputError(f"Response is not valid YAML or JSON: {first_error}")
+
+def parse_index_reference(index_value: Any, upper_bound: int) -> Optional[int]:
+    if isinstance(index_value, bool):
+        return None
+    if isinstance(index_value, int):
+        parsed_index = index_value
+    elif isinstance(index_value, float) and index_value.is_integer():
+        parsed_index = int(index_value)
+    else:
+        index_match = INDEX_REFERENCE_PATTERN.match(str(index_value))
+        if not index_match:
+            return None
+        parsed_index = int(index_match.group(1))
+    return parsed_index if 0 <= parsed_index < upper_bound else None
+
+def coerce_list(parsed_data: Any) -> List[Any]:
+    if isinstance(parsed_data, list):
+        return parsed_data
+    if isinstance(parsed_data, dict):
+        list_values = [value for value in parsed_data.values() if isinstance(value, list)]
+        if len(list_values) == 1:
+            return list_values[0]
+    raise StructuredOutputError("Expected a list in the structured response")
+
+def first_present(entry: dict, *field_names: str) -> Any:
+    for field_name in field_names:
+        if entry.get(field_name) is not None:
+            return entry[field_name]
+    return None
+
+def parse_structured_response(ai_response: str, normalize_result: Callable[[Any], Any], allow_truncation: bool = True) -> Any:
+    return normalize_result(load_structured_data(extract_structured_block(ai_response), allow_truncation))
+
+def query_structured_output(prompt: str, normalize_result: Callable[[Any], Any], use_cache: bool = True, repair_attempts: int = 1) -> Any:
+    original_response = ai_response = query_language_model(prompt, use_cache=use_cache)
+    try:
+        return parse_structured_response(ai_response, normalize_result, allow_truncation=False)
+    except Exception as parse_error:
+        latest_error = parse_error
+        
+    format_example = _extract_format_example(prompt)
+    for _ in range(repair_attempts):
+        print(f"Structured output could not be repaired locally ({latest_error}), requesting a corrected version...")
+        repair_prompt = _build_repair_prompt(ai_response, latest_error, format_example)
+        try:
+            ai_response = query_language_model(repair_prompt, use_cache=use_cache)
+            return parse_structured_response(ai_response, normalize_result, allow_truncation=False)
+        except Exception as repair_error:
+            latest_error = repair_error
+            
+    try:
+        return parse_structured_response(original_response, normalize_result, allow_truncation=True)
+    except Exception:
+        raise StructuredOutputError(str(latest_error))
+
+def _repair_candidates(block_text: str, allow_truncation: bool = True) -> Iterator[Tuple[str, int]]:
+    candidate_text = block_text.replace("\t", "    ").strip()
+    yield candidate_text, 0
+    
+    candidate_lines = candidate_text.splitlines()
+    structure_start = next((position for position, line in enumerate(candidate_lines) if STRUCTURE_START_PATTERN.match(line)), 0)
+    candidate_text = "\n".join(candidate_lines[structure_start:])
+    candidate_text = UNQUOTED_COLON_VALUE_PATTERN.sub(lambda match: match.group(1) + json.dumps(match.group(2).strip()), candidate_text)
+    candidate_text = re.sub(r",(\s*[\]}])", r"\1", candidate_text)
+    yield candidate_text, 0
+    
+    if not allow_truncation:
+        return
+    candidate_lines = candidate_text.splitlines()
+    for dropped_lines in range(1, min(MAX_TRUNCATED_LINES, len(candidate_lines) - 1) + 1):
+        yield "\n".join(candidate_lines[:-dropped_lines]), dropped_lines
+
+def _extract_format_example(prompt: str) -> str:
+    fenced_blocks = FENCED_BLOCK_PATTERN.findall(prompt)
+    if not fenced_blocks:
+        return ""
+    block_language, block_body = fenced_blocks[-1]
+    return f"```{block_language}\n{block_body.strip()}\n```"
+
+def _build_repair_prompt(ai_response: str, parse_error: Exception, format_example: str) -> str:
+    format_section = f"\nThe expected format is:\n\n{format_example}\n" if format_example else ""
+    return f"""
+The following output was supposed to be structured YAML but could not be used:
+
+{ai_response.strip()}
+
+Problem: {parse_error}
+{format_section}
+Return only the corrected YAML inside a ```yaml fenced block. Keep the original content; fix only the structure.
+"""
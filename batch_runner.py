@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from file_operations.file_lock import InterProcessFileLock
+from ai_interface.model_connector import LanguageModelConnector, ResponseCacheManager, install_model_connector
+from ai_interface.request_throttle import InterProcessRequestThrottle
+from workflow_checkpoints import default_run_directory
+from tutorial_builder import parse_command_arguments, setup_authentication, initialize_workspace_configuration
+from pipeline_orchestrator import DocumentationWorkflow
+
+DEFAULT_BATCH_WORKERS = 4
+DEFAULT_REPORT_PATH = "batch_report.jsonl"
+DEFAULT_RESPONSE_CACHE_PATH = "ai_response_cache.json"
+
+_batch_worker_settings: Dict[str, Any] = {}
+
+def load_batch_manifest(manifest_path: str) -> List[Dict[str, Any]]:
+    manifest_entries = []
+    with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+        for line_number, manifest_line in enumerate(manifest_file, 1):
+            manifest_line = manifest_line.strip()
+            if not manifest_line or manifest_line.startswith("#"):
+                continue
+            if manifest_line.startswith("{"):
+                manifest_entry = json.loads(manifest_line)
+            elif "://" in manifest_line or manifest_line.startswith("git@"):
+                manifest_entry = {"repo": manifest_line}
+            else:
+                manifest_entry = {"dir": manifest_line}
+                
+            if not manifest_entry.get("repo") and not manifest_entry.get("dir"):
+                raise ValueError(f"{manifest_path}:{line_number}: each entry needs a 'repo' or 'dir'")
+            manifest_entries.append(manifest_entry)
+    return manifest_entries
+
+def build_entry_arguments(manifest_entry: Dict[str, Any], shared_options: List[str]) -> List[str]:
+    entry_arguments = ["--repo", manifest_entry["repo"]] if manifest_entry.get("repo") else ["--dir", manifest_entry["dir"]]
+    if manifest_entry.get("name"):
+        entry_arguments += ["--name", manifest_entry["name"]]
+    return entry_arguments + list(shared_options) + [str(option) for option in manifest_entry.get("options", [])]
+
+def compute_entry_key(entry_arguments: List[str]) -> str:
+    return hashlib.sha256(json.dumps(entry_arguments).encode("utf-8")).hexdigest()[:16]
+
+def load_batch_report(report_path: str) -> Dict[str, Dict[str, Any]]:
+    latest_records = {}
+    if not os.path.exists(report_path):
+        return latest_records
+    with open(report_path, "r", encoding="utf-8") as report_file:
+        for report_line in report_file:
+            try:
+                report_record = json.loads(report_line)
+            except ValueError:
+                continue
+            latest_records[report_record["key"]] = report_record
+    return latest_records
+
+def append_report_record(report_path: str, report_record: Dict[str, Any]) -> None:
+    with InterProcessFileLock(report_path + ".lock"):
+        with open(report_path, "a", encoding="utf-8") as report_file:
+            report_file.write(json.dumps(report_record, ensure_ascii=False) + "\n")
+
+def initialize_batch_worker(worker_settings: Dict[str, Any]) -> None:
+    _batch_worker_settings.update(worker_settings)
+    _batch_worker_settings["connector_installed"] = False
+
+def _install_batch_model_connector() -> None:
+    request_throttle = None
+    if _batch_worker_settings["requests_per_minute"] > 0:
+        request_throttle = InterProcessRequestThrottle(
+            _batch_worker_settings["throttle_state_path"], _batch_worker_settings["requests_per_minute"]
+        )
+    install_model_connector(LanguageModelConnector(
+        cache_manager=ResponseCacheManager(_batch_worker_settings["response_cache_path"], shared=True),
+        request_throttle=request_throttle,
+    ))
+    _batch_worker_settings["connector_installed"] = True
+
+def run_batch_entry(batch_entry: Dict[str, Any]) -> Dict[str, Any]:
+    append_report_record(_batch_worker_settings["report_path"], {
+        "key": batch_entry["key"], "source": batch_entry["source"], "status": "started",
+        "worker_pid": os.getpid(), "started_at": datetime.now().isoformat(timespec="seconds"),
+    })
+    entry_record = {"key": batch_entry["key"], "source": batch_entry["source"], "log": batch_entry["log_path"]}
+    start_time = time.perf_counter()
+    
+    with open(batch_entry["log_path"], "a", encoding="utf-8") as log_file, contextlib.redirect_stdout(log_file), contextlib.redirect_stderr(log_file):
+        try:
+            if not _batch_worker_settings["connector_installed"]:
+                _install_batch_model_connector()
+            parsed_args = parse_command_arguments(batch_entry["arguments"])
+            parsed_args.run_dir = parsed_args.run_dir or default_run_directory(parsed_args.output, parsed_args.repo or os.path.abspath(parsed_args.dir))
+            parsed_args.resume = parsed_args.resume or batch_entry["resume"]
+            workspace_config = initialize_workspace_configuration(parsed_args, setup_authentication(parsed_args))
+            if _batch_worker_settings["requests_per_minute"] > 0:
+                workspace_config["model_requests_per_minute"] = _batch_worker_settings["requests_per_minute"]
+                
+            DocumentationWorkflow().execute(workspace_config)
+            entry_record.update({
+                "status": "completed",
+                "output": workspace_config["final_documentation_path"],
+                "language_outputs": workspace_config.get("language_documentation_paths") or {},
+                "file_count": len(workspace_config.get("discovered_files") or []),
+                "chapter_count": len(workspace_config.get("generated_chapters") or []),
+            })
+        except SystemExit as exit_error:
+            entry_record.update({"status": "failed", "error": f"Invalid options {batch_entry['arguments']} (exit code {exit_error.code}, see log)"})
+        except Exception as entry_error:
+            print(f"\nBatch entry failed: {type(entry_error).__name__}: {entry_error}")
+            entry_record.update({"status": "failed", "error": f"{type(entry_error).__name__}: {entry_error}"})
+            
+    entry_record["seconds"] = round(time.perf_counter() - start_time, 2)
+    entry_record["finished_at"] = datetime.now().isoformat(timespec="seconds")
+    append_report_record(_batch_worker_settings["report_path"], entry_record)
+    return entry_record
+
+def run_batch(manifest_path: str, shared_options: List[str], worker_count: int = DEFAULT_BATCH_WORKERS, report_path: str = DEFAULT_REPORT_PATH,
+              log_directory: Optional[str] = None, response_cache_path: str = DEFAULT_RESPONSE_CACHE_PATH, requests_per_minute: int = 0) -> int:
+    report_path = os.path.abspath(report_path)
+    log_directory = log_directory or os.path.join(os.path.dirname(report_path), "batch_logs")
+    os.makedirs(log_directory, exist_ok=True)
+    
+    previous_records = load_batch_report(report_path)
+    pending_entries = []
+    completed_count = 0
+    for manifest_entry in load_batch_manifest(manifest_path):
+        entry_arguments = build_entry_arguments(manifest_entry, shared_options)
+        entry_key = compute_entry_key(entry_arguments)
+        previous_record = previous_records.get(entry_key)
+        if previous_record and previous_record["status"] == "completed":
+            completed_count += 1
+            continue
+            
+        entry_source = manifest_entry.get("repo") or manifest_entry["dir"]
+        log_name = manifest_entry.get("name") or os.path.basename(entry_source.rstrip("/\\")).replace(".git", "") or "project"
+        pending_entries.append({
+            "key": entry_key,
+            "source": entry_source,
+            "arguments": entry_arguments,
+            "resume": previous_record is not None,
+            "log_path": os.path.join(log_directory, f"{log_name}-{entry_key}.log"),
+        })
+        
+    print(f"📋 {len(pending_entries)} repositories to document ({completed_count} already completed in {report_path})")
+    if not pending_entries:
+        return 0
+        
+    worker_settings = {
+        "report_path": report_path,
+        "response_cache_path": os.path.abspath(response_cache_path),
+        "requests_per_minute": requests_per_minute,
+        "throttle_state_path": report_path + ".throttle",
+    }
+    failed_count = 0
+    batch_start_time = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=max(1, worker_count), mp_context=multiprocessing.get_context("spawn"),
+        initializer=initialize_batch_worker, initargs=(worker_settings,)
+    ) as batch_pool:
+        entry_futures = {batch_pool.submit(run_batch_entry, batch_entry): batch_entry for batch_entry in pending_entries}
+        for finished_count, entry_future in enumerate(as_completed(entry_futures), 1):
+            batch_entry = entry_futures[entry_future]
+            try:
+                entry_record = entry_future.result()
+            except BrokenProcessPool as pool_error:
+                entry_record = {"key": batch_entry["key"], "source": batch_entry["source"], "status": "failed", "error": f"Worker process died: {pool_error}", "seconds": 0.0}
+                append_report_record(report_path, entry_record)
+                
+            if entry_record["status"] == "completed":
+                print(f"✅ [{finished_count}/{len(pending_entries)}] {entry_record['source']} ({entry_record['seconds']:.1f}s) -> {entry_record['output']}")
+            else:
+                failed_count += 1
+                print(f"❌ [{finished_count}/{len(pending_entries)}] {entry_record['source']} ({entry_record['seconds']:.1f}s): {entry_record['error']}")
+                
+    print(f"🏁 Batch finished in {time.perf_counter() - batch_start_time:.1f}s: {len(pending_entries) - failed_count} completed, {failed_count} failed (report: {report_path})")
+    return failed_count
+
+def parse_batch_arguments(argument_list: Optional[List[str]] = None):
+    argument_parser = argparse.ArgumentParser(
+        description="Document many repositories or local directories in one run, sharing the AI response cache and rate limit",
+        epilog="Arguments after '--' are passed to every repository, e.g. -- --max-abstractions 8 --file-summaries"
+    )
+    argument_parser.add_argument("manifest", help="File with one repository URL, local path or JSON object ({\"repo\"|\"dir\", \"name\", \"options\": [...]}) per line")
+    argument_parser.add_argument("--workers", type=int, default=DEFAULT_BATCH_WORKERS, help=f"Repositories documented in parallel, one process each (default: {DEFAULT_BATCH_WORKERS})")
+    argument_parser.add_argument("--report", default=DEFAULT_REPORT_PATH, help=f"JSON Lines report of per-repository status and timing; completed entries are skipped on restart (default: {DEFAULT_REPORT_PATH})")
+    argument_parser.add_argument("--log-dir", help="Directory for per-repository logs (default: batch_logs next to the report)")
+    argument_parser.add_argument("--cache-file", default=DEFAULT_RESPONSE_CACHE_PATH, help=f"AI response cache shared by all workers (default: {DEFAULT_RESPONSE_CACHE_PATH})")
+    argument_parser.add_argument("--model-rpm", type=int, default=0, help="Requests-per-minute limit applied across all workers together (default: 0, unlimited)")
+    
+    argument_list = sys.argv[1:] if argument_list is None else list(argument_list)
+    repository_options = []
+    if "--" in argument_list:
+        separator_position = argument_list.index("--")
+        argument_list, repository_options = argument_list[:separator_position], argument_list[separator_position + 1:]
+        
+    parsed_args = argument_parser.parse_args(argument_list)
+    parsed_args.repository_options = repository_options
+    return parsed_args
+
+def main() -> int:
+    parsed_args = parse_batch_arguments()
+    try:
+        failed_count = run_batch(
+            parsed_args.manifest, parsed_args.repository_options, parsed_args.workers, parsed_args.report,
+            parsed_args.log_dir, parsed_args.cache_file, parsed_args.model_rpm
+        )
+    except KeyboardInterrupt:
+        print("\n⚠️  Batch cancelled; completed repositories are kept in the report and skipped on the next run.")
+        return 1
+    return 1 if failed_count else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
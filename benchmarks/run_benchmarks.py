@@ -0,0 +1,289 @@
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import contextlib
+import multiprocessing
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic_repository import generate_synthetic_repository
+from pipeline_profiler import peak_resident_memory_bytes
+
+DEFAULT_BASELINE_PATH = Path(__file__).resolve().parent / "baselines.json"
+DEFAULT_SIZES = {
+    "scan_local_directory": [100, 1000, 10000],
+    "pattern_matching": [100, 1000, 10000],
+    "documentation_workflow": [100, 1000],
+}
+NODE_PROMPT_BENCHMARKS = {
+    "file_summary_prompts": "FileSummarizer",
+    "concept_prompts": "ConceptIdentifier",
+    "relationship_prompts": "RelationshipAnalyzer",
+    "chapter_order_prompts": "ChapterOrganizer",
+    "chapter_draft_prompts": "SpeculativeChapterDrafter",
+    "chapter_prompts": "ContentGenerator",
+}
+DEFAULT_SIZES.update({benchmark_name: [100, 1000] for benchmark_name in NODE_PROMPT_BENCHMARKS})
+FULL_SIZES = [100, 1000, 10000, 100000]
+COMPARED_METRICS = {"seconds": "time_threshold", "peak_rss_mb": "memory_threshold"}
+MINIMUM_SIGNIFICANT_CHANGE = {"seconds": 0.05, "peak_rss_mb": 5.0}
+
+def _collect_relative_paths(repository_directory: str) -> List[str]:
+    relative_paths = []
+    for current_directory, _, file_names in os.walk(repository_directory):
+        for file_name in file_names:
+            relative_paths.append(os.path.relpath(os.path.join(current_directory, file_name), repository_directory))
+    return relative_paths
+
+def benchmark_scan_local_directory(repository_directory: str, work_directory: str) -> Callable[[], Dict[str, Any]]:
+    from file_operations.filesystem_explorer import explore_local_directory
+    from tutorial_builder import SUPPORTED_FILE_EXTENSIONS, IGNORED_DIRECTORIES
+    
+    def run_case():
+        scan_results = explore_local_directory(
+            repository_directory, SUPPORTED_FILE_EXTENSIONS, IGNORED_DIRECTORIES, max_file_size=100000, use_relative_paths=True
+        )
+        scanned_files = scan_results["files"]
+        return {"items": len(scanned_files), "bytes": sum(len(content) for content in scanned_files.values())}
+    return run_case
+
+def benchmark_pattern_matching(repository_directory: str, work_directory: str) -> Callable[[], Dict[str, Any]]:
+    from file_operations.filesystem_explorer import FilePatternChecker
+    from file_operations.repository_scanner import FilePatternMatcher
+    from tutorial_builder import SUPPORTED_FILE_EXTENSIONS, IGNORED_DIRECTORIES
+    
+    relative_paths = _collect_relative_paths(repository_directory)
+    local_checker = FilePatternChecker(SUPPORTED_FILE_EXTENSIONS, IGNORED_DIRECTORIES)
+    remote_matcher = FilePatternMatcher(SUPPORTED_FILE_EXTENSIONS, IGNORED_DIRECTORIES)
+    
+    def run_case():
+        accepted_count = 0
+        for relative_path in relative_paths:
+            file_name = os.path.basename(relative_path)
+            accepted_count += local_checker.matches_criteria(relative_path, file_name)
+            accepted_count += remote_matcher.should_include_file(relative_path, file_name)
+        return {"items": 2 * len(relative_paths), "accepted": accepted_count}
+    return run_case
+
+def benchmark_documentation_workflow(repository_directory: str, work_directory: str) -> Callable[[], Dict[str, Any]]:
+    from ai_interface.model_connector import install_model_connector
+    from ai_interface.simulated_connector import SimulatedModelConnector
+    from pipeline_orchestrator import DocumentationWorkflow
+    from tutorial_builder import initialize_workspace_configuration, parse_command_arguments
+    
+    os.environ["FILE_SUMMARY_CACHE"] = os.path.join(work_directory, "file_summary_cache.json")
+    
+    def run_case():
+        output_directory = tempfile.mkdtemp(dir=work_directory)
+        trace_path = os.path.join(output_directory, "profile.json")
+        simulated_connector = SimulatedModelConnector()
+        install_model_connector(simulated_connector)
+        parsed_args = parse_command_arguments(["--dir", repository_directory, "--output", output_directory, "--no-cache", "--profile", trace_path])
+        workspace_config = initialize_workspace_configuration(parsed_args, None)
+        try:
+            DocumentationWorkflow().execute(workspace_config)
+            with open(trace_path, "r", encoding="utf-8") as trace_file:
+                trace_events = json.load(trace_file)["traceEvents"]
+        finally:
+            shutil.rmtree(output_directory, ignore_errors=True)
+        stage_seconds = {
+            trace_event["name"]: round(trace_event["dur"] / 1e6, 4)
+            for trace_event in trace_events if trace_event.get("cat") == "stage"
+        }
+        return {
+            "items": len(workspace_config["discovered_files"]),
+            "model_calls": simulated_connector.request_count,
+            "prompt_chars": simulated_connector.prompt_characters,
+            "stage_seconds": stage_seconds,
+        }
+    return run_case
+
+def _prepare_node_workspace(repository_directory: str, work_directory: str) -> Dict[str, Any]:
+    from ai_interface.model_connector import install_model_connector
+    from ai_interface.simulated_connector import SimulatedModelConnector
+    from pipeline_orchestrator import DocumentationWorkflow
+    from tutorial_builder import initialize_workspace_configuration, parse_command_arguments
+    
+    output_directory = tempfile.mkdtemp(dir=work_directory)
+    os.environ["FILE_SUMMARY_CACHE"] = os.path.join(output_directory, "file_summary_cache.json")
+    install_model_connector(SimulatedModelConnector())
+    parsed_args = parse_command_arguments([
+        "--dir", repository_directory, "--output", output_directory, "--no-cache", "--file-summaries", "--speculative-chapters"
+    ])
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            workspace_config = initialize_workspace_configuration(parsed_args, None)
+            DocumentationWorkflow().execute(workspace_config)
+    finally:
+        shutil.rmtree(output_directory, ignore_errors=True)
+    return workspace_config
+
+def benchmark_node_prompts(node_class_name: str) -> Callable[[str, str], Callable[[], Dict[str, Any]]]:
+    def prepare_case(repository_directory: str, work_directory: str) -> Callable[[], Dict[str, Any]]:
+        import documentation_processors
+        from ai_interface.model_connector import install_model_connector
+        from ai_interface.simulated_connector import SimulatedModelConnector
+        
+        prepared_workspace = _prepare_node_workspace(repository_directory, work_directory)
+        node_class = getattr(documentation_processors, node_class_name)
+        os.environ["FILE_SUMMARY_CACHE"] = os.path.join(work_directory, "unwritten_file_summary_cache.json")
+        
+        def run_case():
+            workspace_config = dict(prepared_workspace, speculative_chapter_drafts={})
+            simulated_connector = SimulatedModelConnector()
+            install_model_connector(simulated_connector)
+            processing_node = node_class()
+            processing_node._exec(processing_node.prep(workspace_config))
+            return {
+                "items": len(workspace_config["discovered_files"]),
+                "model_calls": simulated_connector.request_count,
+                "prompt_chars": simulated_connector.prompt_characters,
+            }
+        return run_case
+    return prepare_case
+
+BENCHMARKS = {
+    "scan_local_directory": benchmark_scan_local_directory,
+    "pattern_matching": benchmark_pattern_matching,
+    "documentation_workflow": benchmark_documentation_workflow,
+    **{benchmark_name: benchmark_node_prompts(node_class_name) for benchmark_name, node_class_name in NODE_PROMPT_BENCHMARKS.items()},
+}
+
+def prepare_repository(work_directory: str, file_count: int, seed: int) -> str:
+    repository_directory = os.path.join(work_directory, f"synthetic-{file_count}-{seed}")
+    marker_path = os.path.join(repository_directory, ".synthetic_complete")
+    if not os.path.exists(marker_path):
+        shutil.rmtree(repository_directory, ignore_errors=True)
+        print(f"Generating synthetic repository with {file_count} files...")
+        generation_stats = generate_synthetic_repository(repository_directory, file_count, seed)
+        with open(marker_path, "w", encoding="utf-8") as marker_file:
+            json.dump(generation_stats, marker_file)
+    return repository_directory
+
+def _run_isolated_case(benchmark_name: str, repository_directory: str, work_directory: str, repeats: int) -> Dict[str, Any]:
+    case_runner = BENCHMARKS[benchmark_name](repository_directory, work_directory)
+    latencies = []
+    case_details = {}
+    for _ in range(repeats):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start_time = time.perf_counter()
+            case_details = case_runner()
+            latencies.append(time.perf_counter() - start_time)
+    peak_rss = peak_resident_memory_bytes()
+    return {"latencies": latencies, "details": case_details, "peak_rss_mb": round(peak_rss / (1024 * 1024), 1) if peak_rss else None}
+
+def run_benchmark_case(benchmark_name: str, file_count: int, work_directory: str, repeats: int, seed: int) -> Dict[str, Any]:
+    repository_directory = prepare_repository(work_directory, file_count, seed)
+    process_context = multiprocessing.get_context("spawn")
+    with process_context.Pool(1) as isolated_pool:
+        case_result = isolated_pool.apply(_run_isolated_case, (benchmark_name, repository_directory, work_directory, repeats))
+        
+    median_seconds = statistics.median(case_result["latencies"])
+    case_details = case_result["details"]
+    return {
+        "benchmark": benchmark_name,
+        "files": file_count,
+        "seconds": round(median_seconds, 4),
+        "min_seconds": round(min(case_result["latencies"]), 4),
+        "throughput_per_second": round(case_details.get("items", 0) / median_seconds, 1) if median_seconds else None,
+        "peak_rss_mb": case_result["peak_rss_mb"],
+        "details": case_details,
+    }
+
+def compare_with_baseline(results: List[Dict[str, Any]], baselines: Dict[str, Dict[str, float]], thresholds: Dict[str, float]) -> List[str]:
+    regressions = []
+    for result in results:
+        baseline = baselines.get(f"{result['benchmark']}@{result['files']}")
+        if not baseline:
+            continue
+        for metric_name, threshold_name in COMPARED_METRICS.items():
+            baseline_value = baseline.get(metric_name)
+            current_value = result.get(metric_name)
+            if not baseline_value or current_value is None:
+                continue
+            change_ratio = current_value / baseline_value - 1
+            result.setdefault("baseline_change", {})[metric_name] = round(change_ratio, 3)
+            if change_ratio > thresholds[threshold_name] and current_value - baseline_value >= MINIMUM_SIGNIFICANT_CHANGE[metric_name]:
+                regressions.append(
+                    f"{result['benchmark']}@{result['files']}: {metric_name} {current_value} vs baseline {baseline_value} "
+                    f"(+{change_ratio:.0%}, limit +{thresholds[threshold_name]:.0%})"
+                )
+    return regressions
+
+def format_results_table(results: List[Dict[str, Any]]) -> str:
+    table_lines = [f"{'Benchmark':<26}{'Files':>8}{'Median s':>10}{'Min s':>9}{'Items/s':>12}{'Peak RSS':>10}{'vs base':>9}"]
+    for result in results:
+        baseline_change = result.get("baseline_change", {}).get("seconds")
+        change_text = f"{baseline_change:+.0%}" if baseline_change is not None else "-"
+        table_lines.append(
+            f"{result['benchmark']:<26}{result['files']:>8}{result['seconds']:>10.3f}{result['min_seconds']:>9.3f}"
+            f"{result['throughput_per_second'] or 0:>12.1f}{str(result['peak_rss_mb']) + 'MB':>10}{change_text:>9}"
+        )
+        for stage_name, stage_seconds in result["details"].get("stage_seconds", {}).items():
+            table_lines.append(f"    {stage_name:<30}{stage_seconds:>10.3f}")
+    return "\n".join(table_lines)
+
+def parse_benchmark_arguments(argument_list: Optional[List[str]] = None):
+    argument_parser = argparse.ArgumentParser(description="Benchmark the documentation pipeline on synthetic repositories")
+    argument_parser.add_argument("--benchmarks", nargs="+", choices=sorted(BENCHMARKS), default=list(BENCHMARKS), help="Benchmarks to run (default: all)")
+    argument_parser.add_argument("--sizes", type=int, nargs="+", help="Repository sizes in files (default: a quick per-benchmark set)")
+    argument_parser.add_argument("--full", action="store_true", help=f"Run every benchmark at {', '.join(map(str, FULL_SIZES))} files")
+    argument_parser.add_argument("--repeats", type=int, default=3, help="Timed repetitions per case; the median is reported (default: 3)")
+    argument_parser.add_argument("--seed", type=int, default=0, help="Seed for synthetic repository generation (default: 0)")
+    argument_parser.add_argument("--work-dir", default=os.path.join(tempfile.gettempdir(), "codestory-benchmarks"), help="Where synthetic repositories are generated and reused")
+    argument_parser.add_argument("--baseline", default=str(DEFAULT_BASELINE_PATH), help="Baseline file to compare against (default: benchmarks/baselines.json)")
+    argument_parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline instead of comparing")
+    argument_parser.add_argument("--time-threshold", type=float, default=0.30, help="Allowed median time increase over baseline (default: 0.30)")
+    argument_parser.add_argument("--memory-threshold", type=float, default=0.20, help="Allowed peak RSS increase over baseline (default: 0.20)")
+    argument_parser.add_argument("--report", help="Write the full results as JSON to this path")
+    return argument_parser.parse_args(argument_list)
+
+def main(argument_list: Optional[List[str]] = None) -> int:
+    parsed_args = parse_benchmark_arguments(argument_list)
+    os.makedirs(parsed_args.work_dir, exist_ok=True)
+    
+    results = []
+    for benchmark_name in parsed_args.benchmarks:
+        benchmark_sizes = parsed_args.sizes or (FULL_SIZES if parsed_args.full else DEFAULT_SIZES[benchmark_name])
+        for file_count in benchmark_sizes:
+            print(f"Running {benchmark_name} on {file_count} files...")
+            repeats = 1 if benchmark_name == "documentation_workflow" and file_count >= 10000 else parsed_args.repeats
+            results.append(run_benchmark_case(benchmark_name, file_count, parsed_args.work_dir, repeats, parsed_args.seed))
+            
+    baseline_path = Path(parsed_args.baseline)
+    regressions = []
+    if parsed_args.save_baseline:
+        baselines = json.loads(baseline_path.read_text(encoding="utf-8")) if baseline_path.exists() else {}
+        for result in results:
+            baselines[f"{result['benchmark']}@{result['files']}"] = {metric_name: result[metric_name] for metric_name in COMPARED_METRICS}
+        baseline_path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"Saved baseline for {len(results)} cases to {baseline_path}")
+    elif baseline_path.exists():
+        thresholds = {"time_threshold": parsed_args.time_threshold, "memory_threshold": parsed_args.memory_threshold}
+        regressions = compare_with_baseline(results, json.loads(baseline_path.read_text(encoding="utf-8")), thresholds)
+        
+    print()
+    print(format_results_table(results))
+    if parsed_args.report:
+        with open(parsed_args.report, "w", encoding="utf-8") as report_file:
+            json.dump({"results": results, "regressions": regressions}, report_file, indent=2)
+            
+    if regressions:
+        print("\nPerformance regressions:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
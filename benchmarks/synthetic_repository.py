@@ -0,0 +1,150 @@
+import os
+import random
+from typing import Dict, List, Tuple
+
+LANGUAGE_WEIGHTS = (
+    ("python", ".py", 35),
+    ("javascript", ".js", 20),
+    ("typescript", ".ts", 10),
+    ("go", ".go", 10),
+    ("java", ".java", 10),
+    ("c", ".c", 5),
+    ("markdown", ".md", 10),
+)
+FILES_PER_PACKAGE = 40
+IGNORED_FILE_SHARE = 0.08
+IGNORED_DIRECTORY_NAMES = ("node_modules", "build", "docs", ".git")
+
+def _python_source(module_name: str, imported_modules: List[str], function_count: int) -> str:
+    source_lines = [f'"""Synthetic module {module_name}."""', "import os"]
+    source_lines += [f"from {imported_module} import helper_0" for imported_module in imported_modules]
+    source_lines.append("")
+    source_lines.append(f"class {module_name.split('.')[-1].title().replace('_', '')}Service:")
+    source_lines.append("    def __init__(self, settings):")
+    source_lines.append("        self.settings = settings")
+    source_lines.append("")
+    for function_number in range(function_count):
+        source_lines += [
+            f"def helper_{function_number}(values, scale={function_number + 1}):",
+            f'    """Scale values for step {function_number}."""',
+            "    total = 0",
+            "    for value in values:",
+            "        total += value * scale",
+            "    return total",
+            "",
+        ]
+    return "\n".join(source_lines) + "\n"
+
+def _script_source(imported_modules: List[str], function_count: int) -> str:
+    source_lines = [f"import {{ helper0 }} from './{imported_module}';" for imported_module in imported_modules]
+    source_lines.append("")
+    source_lines.append("export class Controller {")
+    source_lines.append("  constructor(options) { this.options = options; }")
+    source_lines.append("}")
+    for function_number in range(function_count):
+        source_lines += [
+            f"export function helper{function_number}(values) {{",
+            f"  return values.map((value) => value * {function_number + 1});",
+            "}",
+            "",
+        ]
+    return "\n".join(source_lines) + "\n"
+
+def _go_source(package_name: str, imported_packages: List[str], function_count: int) -> str:
+    source_lines = [f"package {package_name}", "", "import ("]
+    source_lines += [f'\t"example.com/synthetic/{imported_package}"' for imported_package in imported_packages]
+    source_lines += [")", "", "type Handler struct {", "\tName string", "}", ""]
+    for function_number in range(function_count):
+        source_lines += [
+            f"func Helper{function_number}(values []int) int {{",
+            "\ttotal := 0",
+            "\tfor _, value := range values {",
+            f"\t\ttotal += value * {function_number + 1}",
+            "\t}",
+            "\treturn total",
+            "}",
+            "",
+        ]
+    return "\n".join(source_lines) + "\n"
+
+def _java_source(package_name: str, class_name: str, imported_classes: List[str], function_count: int) -> str:
+    source_lines = [f"package {package_name};", ""]
+    source_lines += [f"import {imported_class};" for imported_class in imported_classes]
+    source_lines += ["", f"public class {class_name} {{"]
+    for function_number in range(function_count):
+        source_lines += [
+            f"    public static int helper{function_number}(int[] values) {{",
+            "        int total = 0;",
+            f"        for (int value : values) {{ total += value * {function_number + 1}; }}",
+            "        return total;",
+            "    }",
+            "",
+        ]
+    source_lines.append("}")
+    return "\n".join(source_lines) + "\n"
+
+def _c_source(included_headers: List[str], function_count: int) -> str:
+    source_lines = ["#include <stdio.h>"] + [f'#include "{included_header}"' for included_header in included_headers]
+    source_lines.append("")
+    for function_number in range(function_count):
+        source_lines += [
+            f"int helper_{function_number}(const int *values, int count) {{",
+            "    int total = 0;",
+            f"    for (int i = 0; i < count; i++) total += values[i] * {function_number + 1};",
+            "    return total;",
+            "}",
+            "",
+        ]
+    return "\n".join(source_lines) + "\n"
+
+def _markdown_source(document_name: str, section_count: int) -> str:
+    document_lines = [f"# {document_name}", ""]
+    for section_number in range(section_count):
+        document_lines += [f"## Section {section_number}", "", "This section describes part of the synthetic project.", ""]
+    return "\n".join(document_lines) + "\n"
+
+def generate_synthetic_repository(root_directory: str, file_count: int, seed: int = 0, functions_per_file: int = 6) -> Dict[str, int]:
+    random_generator = random.Random(seed)
+    language_choices = [(language, extension) for language, extension, _ in LANGUAGE_WEIGHTS]
+    language_weights = [weight for _, _, weight in LANGUAGE_WEIGHTS]
+    generated_modules: Dict[str, List[Tuple[str, str]]] = {language: [] for language, _ in language_choices}
+    written_bytes = 0
+    ignored_count = 0
+    
+    for file_number in range(file_count):
+        language, extension = random_generator.choices(language_choices, weights=language_weights)[0]
+        package_name = f"pkg_{file_number // FILES_PER_PACKAGE:04d}"
+        module_name = f"module_{file_number:06d}"
+        relative_directory = package_name
+        if random_generator.random() < IGNORED_FILE_SHARE:
+            relative_directory = os.path.join(random_generator.choice(IGNORED_DIRECTORY_NAMES), package_name)
+            ignored_count += 1
+            
+        earlier_modules = generated_modules[language]
+        imported_modules = random_generator.sample(earlier_modules, min(len(earlier_modules), random_generator.randint(0, 3)))
+        function_count = max(1, int(random_generator.gauss(functions_per_file, functions_per_file / 3)))
+        
+        if language == "python":
+            file_content = _python_source(f"{package_name}.{module_name}", [f"{package}.{module}" for package, module in imported_modules], function_count)
+        elif language in ("javascript", "typescript"):
+            file_content = _script_source([f"../{package}/{module}" for package, module in imported_modules], function_count)
+        elif language == "go":
+            file_content = _go_source(package_name, sorted({package for package, _ in imported_modules}), function_count)
+        elif language == "java":
+            class_name = module_name.title().replace("_", "")
+            file_content = _java_source(package_name, class_name, [f"{package}.{module.title().replace('_', '')}" for package, module in imported_modules], function_count)
+            module_name = class_name
+        elif language == "c":
+            file_content = _c_source([f"../{package}/{module}.c" for package, module in imported_modules], function_count)
+        else:
+            file_content = _markdown_source(module_name, function_count)
+            
+        target_directory = os.path.join(root_directory, relative_directory)
+        os.makedirs(target_directory, exist_ok=True)
+        with open(os.path.join(target_directory, module_name + extension), "w", encoding="utf-8") as source_file:
+            source_file.write(file_content)
+        written_bytes += len(file_content)
+        if relative_directory == package_name:
+            generated_modules[language].append((package_name, module_name))
+            
+    return {"files": file_count, "ignored_files": ignored_count, "bytes": written_bytes}
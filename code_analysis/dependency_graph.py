@@ -0,0 +1,120 @@
+import posixpath
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+SCRIPT_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx")
+
+def build_file_dependency_graph(file_collection: List[Tuple[str, str]], symbol_index: List[Dict[str, Any]]) -> List[List[int]]:
+    normalized_paths = [path.replace("\\", "/") for path, _ in file_collection]
+    index_by_path = {path: index for index, path in enumerate(normalized_paths)}
+    indices_by_suffix = defaultdict(list)
+    indices_by_directory_suffix = defaultdict(list)
+    
+    for file_index, file_path in enumerate(normalized_paths):
+        path_parts = file_path.split("/")
+        for start in range(len(path_parts)):
+            indices_by_suffix["/".join(path_parts[start:])].append(file_index)
+            if start < len(path_parts) - 1:
+                indices_by_directory_suffix["/".join(path_parts[start:-1])].append(file_index)
+                
+    def unique_suffix_match(candidate_suffixes):
+        for candidate_suffix in candidate_suffixes:
+            matching_indices = indices_by_suffix.get(candidate_suffix, [])
+            if len(matching_indices) == 1:
+                return matching_indices
+        return []
+        
+    dependency_graph = []
+    for file_index, file_path in enumerate(normalized_paths):
+        file_entry = symbol_index[file_index] if file_index < len(symbol_index) else {}
+        language = file_entry.get("language")
+        file_directory = posixpath.dirname(file_path)
+        dependencies = set()
+        
+        for imported_name in file_entry.get("imports", []):
+            if language == "python":
+                if imported_name.startswith("."):
+                    relative_level = len(imported_name) - len(imported_name.lstrip("."))
+                    base_directory = file_directory
+                    for _ in range(relative_level - 1):
+                        base_directory = posixpath.dirname(base_directory)
+                    module_path = posixpath.join(base_directory, imported_name.lstrip(".").replace(".", "/"))
+                    resolved = [index_by_path[candidate] for candidate in (f"{module_path}.py", f"{module_path}/__init__.py") if candidate in index_by_path]
+                else:
+                    module_path = imported_name.replace(".", "/")
+                    resolved = unique_suffix_match([f"{module_path}.py", f"{module_path}/__init__.py", f"{module_path}.pyi"])
+            elif language == "javascript" and imported_name.startswith("."):
+                module_path = posixpath.normpath(posixpath.join(file_directory, imported_name))
+                candidates = [module_path] + [module_path + extension for extension in SCRIPT_EXTENSIONS]
+                candidates += [f"{module_path}/index{extension}" for extension in SCRIPT_EXTENSIONS]
+                resolved = [index_by_path[candidate] for candidate in candidates if candidate in index_by_path][:1]
+            elif language == "go":
+                package_parts = imported_name.split("/")
+                resolved = []
+                for start in range(len(package_parts)):
+                    resolved = indices_by_directory_suffix.get("/".join(package_parts[start:]), [])
+                    if resolved:
+                        break
+                resolved = [index for index in resolved if normalized_paths[index].endswith(".go")]
+            elif language == "java":
+                resolved = unique_suffix_match([imported_name.replace(".", "/") + ".java"])
+            elif language == "c":
+                same_directory_path = posixpath.normpath(posixpath.join(file_directory, imported_name))
+                resolved = [index_by_path[same_directory_path]] if same_directory_path in index_by_path else unique_suffix_match([imported_name])
+            else:
+                resolved = []
+            dependencies.update(index for index in resolved if index != file_index)
+            
+        dependency_graph.append(sorted(dependencies))
+    return dependency_graph
+
+def build_concept_dependency_edges(concepts: List[Dict[str, Any]], file_dependency_graph: List[List[int]]) -> List[Dict[str, int]]:
+    concepts_by_file = defaultdict(set)
+    for concept_index, concept in enumerate(concepts):
+        for file_index in concept.get("files", []):
+            concepts_by_file[file_index].add(concept_index)
+            
+    edge_weights = defaultdict(int)
+    for concept_index, concept in enumerate(concepts):
+        for file_index in concept.get("files", []):
+            if file_index >= len(file_dependency_graph):
+                continue
+            for dependency_index in file_dependency_graph[file_index]:
+                for dependency_concept in concepts_by_file.get(dependency_index, ()):
+                    if dependency_concept != concept_index:
+                        edge_weights[(concept_index, dependency_concept)] += 1
+                        
+    return [
+        {"from": from_index, "to": to_index, "weight": weight}
+        for (from_index, to_index), weight in sorted(edge_weights.items(), key=lambda item: (-item[1], item[0]))
+    ]
+
+def dependency_teaching_order(concept_count: int, dependency_edges: List[Dict[str, int]]) -> List[int]:
+    remaining_dependencies = {index: set() for index in range(concept_count)}
+    dependents_count = defaultdict(int)
+    for edge in dependency_edges:
+        remaining_dependencies[edge["from"]].add(edge["to"])
+        dependents_count[edge["to"]] += edge.get("weight", 1)
+        
+    teaching_order = []
+    while remaining_dependencies:
+        ready_concepts = [index for index, dependencies in remaining_dependencies.items() if not dependencies]
+        if not ready_concepts:
+            fewest_dependencies = min(len(dependencies) for dependencies in remaining_dependencies.values())
+            ready_concepts = [index for index, dependencies in remaining_dependencies.items() if len(dependencies) == fewest_dependencies]
+        next_concept = min(ready_concepts, key=lambda index: (-dependents_count[index], index))
+        
+        teaching_order.append(next_concept)
+        del remaining_dependencies[next_concept]
+        for dependencies in remaining_dependencies.values():
+            dependencies.discard(next_concept)
+            
+    return teaching_order
+
+def describe_dependency_edges(concepts: List[Dict[str, Any]], dependency_edges: List[Dict[str, int]], limit: Optional[int] = None) -> str:
+    edge_lines = []
+    for edge_number, edge in enumerate(dependency_edges[:limit]):
+        from_name = concepts[edge["from"]]["name"].strip()
+        to_name = concepts[edge["to"]]["name"].strip()
+        edge_lines.append(f"- Edge {edge_number}: {edge['from']} ({from_name}) imports from {edge['to']} ({to_name}) [{edge['weight']} import(s)]")
+    return "\n".join(edge_lines)
@@ -0,0 +1,121 @@
+import re
+import math
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+TOKEN_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+IDENTIFIER_PART_PATTERN = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
+STOP_WORDS = {
+    "the", "and", "for", "with", "that", "this", "from", "into", "are", "was", "not", "but", "you", "your",
+    "def", "return", "self", "import", "class", "none", "true", "false", "const", "let", "var", "function",
+    "public", "private", "static", "void", "int", "str", "string", "new", "elif", "else", "while", "pass",
+    "like", "its", "has", "have", "will", "can", "each", "all", "any", "how", "what", "when", "which", "also",
+}
+DEFAULT_CHUNK_LINES = 80
+PREFERRED_FILE_BOOST = 1.5
+
+def tokenize_text(text: str) -> List[str]:
+    tokens = []
+    for identifier in TOKEN_PATTERN.findall(text):
+        lowered_identifier = identifier.lower()
+        identifier_parts = [part.lower() for chunk in identifier.split("_") for part in IDENTIFIER_PART_PATTERN.findall(chunk)]
+        if len(identifier_parts) > 1 and lowered_identifier not in STOP_WORDS:
+            tokens.append(lowered_identifier)
+        tokens.extend(part for part in identifier_parts if len(part) >= 3 and part not in STOP_WORDS)
+    return tokens
+
+def split_into_chunks(file_content: str, file_entry: Optional[Dict[str, Any]] = None, max_lines: int = DEFAULT_CHUNK_LINES) -> List[Tuple[int, int]]:
+    line_count = file_content.count("\n") + 1
+    boundaries = sorted({
+        symbol["start_line"] for symbol in (file_entry or {}).get("symbols", [])
+        if not symbol.get("parent") and 1 < symbol["start_line"] <= line_count
+    })
+    
+    chunk_ranges = []
+    segment_start = 1
+    for segment_end in [boundary - 1 for boundary in boundaries] + [line_count]:
+        while segment_end - segment_start + 1 > max_lines:
+            chunk_ranges.append((segment_start, segment_start + max_lines - 1))
+            segment_start += max_lines
+        if segment_end >= segment_start:
+            chunk_ranges.append((segment_start, segment_end))
+        segment_start = segment_end + 1
+        
+    merged_ranges = []
+    for chunk_start, chunk_end in chunk_ranges:
+        if merged_ranges and chunk_end - merged_ranges[-1][0] + 1 <= max_lines // 2:
+            merged_ranges[-1] = (merged_ranges[-1][0], chunk_end)
+        else:
+            merged_ranges.append((chunk_start, chunk_end))
+    return merged_ranges
+
+class LexicalIndex:
+    def __init__(self, file_collection: List[Tuple[str, str]], symbol_index: Optional[List[Dict[str, Any]]] = None, k1: float = 1.2, b: float = 0.75):
+        self.file_collection = file_collection
+        self.k1 = k1
+        self.b = b
+        self.chunks = []
+        self.chunk_lengths = []
+        self.postings = defaultdict(list)
+        
+        for file_index, (file_path, file_content) in enumerate(file_collection):
+            file_entry = symbol_index[file_index] if symbol_index and file_index < len(symbol_index) else None
+            source_lines = file_content.splitlines()
+            path_tokens = tokenize_text(file_path)
+            for start_line, end_line in split_into_chunks(file_content, file_entry):
+                chunk_text = "\n".join(source_lines[start_line - 1:end_line])
+                term_counts = Counter(tokenize_text(chunk_text) + path_tokens)
+                chunk_id = len(self.chunks)
+                self.chunks.append((file_index, start_line, end_line, chunk_text))
+                self.chunk_lengths.append(sum(term_counts.values()))
+                for term, term_count in term_counts.items():
+                    self.postings[term].append((chunk_id, term_count))
+                    
+        self.average_length = (sum(self.chunk_lengths) / len(self.chunk_lengths)) if self.chunk_lengths else 0.0
+        
+    def search(self, query_text: str, preferred_files: Iterable[int] = ()) -> List[Tuple[float, int]]:
+        chunk_scores = defaultdict(float)
+        chunk_count = len(self.chunks)
+        for term in set(tokenize_text(query_text)):
+            term_postings = self.postings.get(term)
+            if not term_postings:
+                continue
+            inverse_frequency = math.log(1 + (chunk_count - len(term_postings) + 0.5) / (len(term_postings) + 0.5))
+            for chunk_id, term_count in term_postings:
+                length_ratio = self.chunk_lengths[chunk_id] / self.average_length if self.average_length else 1.0
+                saturation = term_count * (self.k1 + 1) / (term_count + self.k1 * (1 - self.b + self.b * length_ratio))
+                chunk_scores[chunk_id] += inverse_frequency * saturation
+                
+        preferred_file_set: Set[int] = set(preferred_files)
+        ranked_chunks = [
+            (score * (PREFERRED_FILE_BOOST if self.chunks[chunk_id][0] in preferred_file_set else 1.0), chunk_id)
+            for chunk_id, score in chunk_scores.items()
+        ]
+        ranked_chunks.sort(key=lambda entry: (-entry[0], entry[1]))
+        return ranked_chunks
+        
+    def select_context(self, query_text: str, budget_chars: int, preferred_files: Iterable[int] = ()) -> Dict[str, str]:
+        selected_chunk_ids = []
+        remaining_chars = budget_chars
+        for _, chunk_id in self.search(query_text, preferred_files):
+            chunk_size = len(self.chunks[chunk_id][3])
+            if chunk_size > remaining_chars:
+                continue
+            selected_chunk_ids.append(chunk_id)
+            remaining_chars -= chunk_size
+            if remaining_chars < budget_chars * 0.02:
+                break
+                
+        merged_sections = []
+        for chunk_id in sorted(selected_chunk_ids, key=lambda chunk_id: self.chunks[chunk_id][:2]):
+            file_index, start_line, end_line, chunk_text = self.chunks[chunk_id]
+            if merged_sections and merged_sections[-1][0] == file_index and merged_sections[-1][2] + 1 == start_line:
+                previous_section = merged_sections[-1]
+                merged_sections[-1] = (file_index, previous_section[1], end_line, previous_section[3] + "\n" + chunk_text)
+            else:
+                merged_sections.append((file_index, start_line, end_line, chunk_text))
+                
+        return {
+            f"{file_index} # {self.file_collection[file_index][0]} (lines {start_line}-{end_line})": chunk_text
+            for file_index, start_line, end_line, chunk_text in merged_sections
+        }
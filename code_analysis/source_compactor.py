@@ -0,0 +1,202 @@
+import os
+import re
+import io
+import ast
+import json
+import hashlib
+import tokenize
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from code_analysis.symbol_index import detect_language
+from file_operations.file_lock import merge_into_json_file
+
+HASH_COMMENT_LANGUAGES = {"python", "shell", "yaml", "make"}
+SLASH_COMMENT_LANGUAGES = {"javascript", "go", "java", "c"}
+DASH_COMMENT_LANGUAGES = {"sql", "lua", "haskell"}
+LICENSE_KEYWORDS = re.compile(r"licen[cs]e|copyright|spdx-license|permission is hereby granted|all rights reserved", re.I)
+BANNER_FILL_PATTERN = r"\s*[-=*#_~+/\\.]{4,}\s*(?:\*/)?\s*$"
+HASH_BANNER_PATTERN = re.compile(r"^\s*#+" + BANNER_FILL_PATTERN)
+SLASH_BANNER_PATTERN = re.compile(r"^\s*(?://+|/\*+|\*+)" + BANNER_FILL_PATTERN)
+DASH_BANNER_PATTERN = re.compile(r"^\s*--+" + BANNER_FILL_PATTERN)
+BLANK_RUN_PATTERN = re.compile(r"\n{3,}")
+LICENSE_SCAN_LINES = 80
+COMPACTION_RULES_VERSION = 2
+
+def detect_comment_language(file_path: str) -> Optional[str]:
+    language = detect_language(file_path)
+    if language:
+        return language
+    lowered_path = file_path.lower()
+    if lowered_path.endswith((".sh", ".bash", ".toml", ".cfg", ".ini")):
+        return "shell"
+    if lowered_path.endswith((".yaml", ".yml")):
+        return "yaml"
+    if lowered_path.endswith(("makefile", "dockerfile")):
+        return "make"
+    if lowered_path.endswith(".sql"):
+        return "sql"
+    if lowered_path.endswith(".lua"):
+        return "lua"
+    if lowered_path.endswith((".hs", ".lhs")):
+        return "haskell"
+    return None
+
+class CompactionCache:
+    def __init__(self, cache_file_name: str = "source_compaction_cache.json"):
+        self.cache_file_path = Path(os.getenv("SOURCE_COMPACTION_CACHE", cache_file_name))
+        self.cached_sources = {}
+        if self.cache_file_path.exists():
+            try:
+                with open(self.cache_file_path, "r", encoding="utf-8") as cache_file:
+                    self.cached_sources = json.load(cache_file)
+            except Exception as cache_error:
+                print(f"Warning: Failed to load source compaction cache - {cache_error}")
+                
+    @staticmethod
+    def content_hash(file_path: str, file_content: str, drop_trivial_bodies: bool) -> str:
+        language = detect_comment_language(file_path) or "other"
+        cache_source = f"{COMPACTION_RULES_VERSION}\0{language}\0{drop_trivial_bodies}\0{file_content}"
+        return hashlib.sha256(cache_source.encode("utf-8", errors="ignore")).hexdigest()
+        
+    def get_compacted_source(self, content_hash: str) -> Optional[str]:
+        return self.cached_sources.get(content_hash)
+        
+    def store_compacted_sources(self, new_sources: Dict[str, str]) -> None:
+        if not new_sources:
+            return
+        self.cached_sources.update(new_sources)
+        try:
+            self.cached_sources = merge_into_json_file(self.cache_file_path, new_sources)
+        except Exception as save_error:
+            print(f"Warning: Failed to save source compaction cache - {save_error}")
+
+def compact_source(file_path: str, file_content: str, drop_trivial_bodies: bool = False) -> str:
+    language = detect_comment_language(file_path)
+    compacted_content = file_content
+    if language == "python" and drop_trivial_bodies:
+        compacted_content = _collapse_trivial_python_bodies(compacted_content)
+    if language in HASH_COMMENT_LANGUAGES or language in SLASH_COMMENT_LANGUAGES or language in DASH_COMMENT_LANGUAGES:
+        compacted_content = _strip_license_header(compacted_content, language)
+        compacted_content = _strip_banner_lines(compacted_content, language)
+    compacted_content = "\n".join(line.rstrip() for line in compacted_content.split("\n"))
+    compacted_content = BLANK_RUN_PATTERN.sub("\n\n", compacted_content).strip("\n") + "\n"
+    return compacted_content
+
+def compact_file_collection(
+    file_collection: List[Tuple[str, str]], drop_trivial_bodies: bool = False, compaction_cache: Optional[CompactionCache] = None
+) -> Tuple[List[Tuple[str, str]], Dict[str, Tuple[int, int]]]:
+    compacted_collection = []
+    new_sources = {}
+    size_report = defaultdict(lambda: [0, 0])
+    for file_path, file_content in file_collection:
+        content_hash = CompactionCache.content_hash(file_path, file_content, drop_trivial_bodies) if compaction_cache else None
+        compacted_content = compaction_cache.get_compacted_source(content_hash) if compaction_cache else None
+        if compacted_content is None:
+            compacted_content = compact_source(file_path, file_content, drop_trivial_bodies)
+            if compaction_cache:
+                new_sources[content_hash] = compacted_content
+        compacted_collection.append((file_path, compacted_content))
+        language_totals = size_report[detect_comment_language(file_path) or "other"]
+        language_totals[0] += len(file_content)
+        language_totals[1] += len(compacted_content)
+    if compaction_cache:
+        compaction_cache.store_compacted_sources(new_sources)
+    return compacted_collection, {language: tuple(totals) for language, totals in size_report.items()}
+
+def format_compaction_report(size_report: Dict[str, Tuple[int, int]]) -> str:
+    report_lines = []
+    original_total = sum(original for original, _ in size_report.values())
+    compacted_total = sum(compacted for _, compacted in size_report.values())
+    for language, (original_size, compacted_size) in sorted(size_report.items(), key=lambda item: -item[1][0]):
+        reduction = 100.0 * (original_size - compacted_size) / original_size if original_size else 0.0
+        report_lines.append(f"  - {language}: {original_size} -> {compacted_size} chars (-{reduction:.1f}%)")
+    total_reduction = 100.0 * (original_total - compacted_total) / original_total if original_total else 0.0
+    report_lines.insert(0, f"Prompt source compaction: {original_total} -> {compacted_total} chars (-{total_reduction:.1f}%)")
+    return "\n".join(report_lines)
+
+def _strip_license_header(file_content: str, language: str) -> str:
+    content_lines = file_content.split("\n")
+    header_start = 0
+    while header_start < len(content_lines) and (content_lines[header_start].startswith("#!") or not content_lines[header_start].strip()):
+        header_start += 1
+        
+    header_end = header_start
+    if language in SLASH_COMMENT_LANGUAGES and header_start < len(content_lines) and content_lines[header_start].lstrip().startswith("/*"):
+        while header_end < len(content_lines) and "*/" not in content_lines[header_end]:
+            header_end += 1
+        header_end += 1
+    else:
+        comment_prefix = "#" if language in HASH_COMMENT_LANGUAGES else "--" if language in DASH_COMMENT_LANGUAGES else "//"
+        while header_end < len(content_lines) and content_lines[header_end].lstrip().startswith(comment_prefix):
+            header_end += 1
+            
+    header_text = "\n".join(content_lines[header_start:header_end])
+    if header_end - header_start > 1 and header_end <= LICENSE_SCAN_LINES and LICENSE_KEYWORDS.search(header_text):
+        return "\n".join(content_lines[:header_start] + content_lines[header_end:])
+    return file_content
+
+def _python_string_lines(file_content: str) -> Set[int]:
+    string_lines = set()
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(file_content).readline):
+            if token.type == tokenize.STRING or token.type == getattr(tokenize, "FSTRING_MIDDLE", None):
+                string_lines.update(range(token.start[0], token.end[0] + 1))
+    except (tokenize.TokenError, SyntaxError):
+        return set()
+    return string_lines
+
+def _strip_banner_lines(file_content: str, language: str) -> str:
+    if language in HASH_COMMENT_LANGUAGES:
+        banner_pattern = HASH_BANNER_PATTERN
+    elif language in DASH_COMMENT_LANGUAGES:
+        banner_pattern = DASH_BANNER_PATTERN
+    else:
+        banner_pattern = SLASH_BANNER_PATTERN
+    protected_lines = _python_string_lines(file_content) if language == "python" else set()
+    return "\n".join(
+        line for line_number, line in enumerate(file_content.split("\n"), 1)
+        if line_number in protected_lines or not banner_pattern.match(line)
+    )
+
+def _is_trivial_statement(statement: ast.stmt) -> bool:
+    if isinstance(statement, ast.Pass):
+        return True
+    if isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Constant):
+        return True
+    if isinstance(statement, ast.Return):
+        return statement.value is None or isinstance(statement.value, (ast.Constant, ast.Name, ast.Attribute))
+    if isinstance(statement, ast.Raise):
+        return True
+    if isinstance(statement, (ast.Assign, ast.AnnAssign)):
+        targets = statement.targets if isinstance(statement, ast.Assign) else [statement.target]
+        return (
+            all(isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name) and target.value.id == "self" for target in targets)
+            and isinstance(statement.value, (ast.Name, ast.Constant))
+        )
+    return False
+
+def _collapse_trivial_python_bodies(file_content: str) -> str:
+    try:
+        module_tree = ast.parse(file_content)
+    except (SyntaxError, ValueError, RecursionError):
+        return file_content
+        
+    content_lines = file_content.split("\n")
+    collapsed_ranges = []
+    for node in ast.walk(module_tree):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        function_body = node.body
+        if ast.get_docstring(node) is not None:
+            function_body = function_body[1:]
+        if len(function_body) < 2 or not all(_is_trivial_statement(statement) for statement in function_body):
+            continue
+        body_start = function_body[0].lineno
+        body_end = function_body[-1].end_lineno
+        indentation = content_lines[body_start - 1][:len(content_lines[body_start - 1]) - len(content_lines[body_start - 1].lstrip())]
+        collapsed_ranges.append((body_start, body_end, f"{indentation}...  # {len(function_body)} trivial statements omitted"))
+        
+    for body_start, body_end, replacement_line in sorted(collapsed_ranges, reverse=True):
+        content_lines[body_start - 1:body_end] = [replacement_line]
+    return "\n".join(content_lines)
@@ -0,0 +1,297 @@
+import os
+import re
+import ast
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+LANGUAGE_BY_EXTENSION = {
+    ".py": "python", ".pyi": "python", ".pyx": "python",
+    ".js": "javascript", ".jsx": "javascript", ".ts": "javascript", ".tsx": "javascript",
+    ".go": "go", ".java": "java",
+    ".c": "c", ".cc": "c", ".cpp": "c", ".h": "c",
+    ".md": "markdown", ".rst": "markdown",
+}
+
+REGEX_IMPORT_PATTERNS = {
+    "javascript": [
+        re.compile(r"^\s*import\s+(?:[^'\"]*?\s+from\s+)?['\"]([^'\"]+)['\"]", re.M),
+        re.compile(r"require\(\s*['\"]([^'\"]+)['\"]\s*\)"),
+    ],
+    "go": [
+        re.compile(r"^\s*import\s+(?:\w+\s+)?\"([^\"]+)\"", re.M),
+        re.compile(r"^\s+(?:\w+\s+)?\"([^\"]+)\"\s*$", re.M),
+    ],
+    "java": [re.compile(r"^\s*import\s+(?:static\s+)?([\w.]+(?:\.\*)?)\s*;", re.M)],
+    "c": [re.compile(r"^\s*#\s*include\s*[<\"]([^>\"]+)[>\"]", re.M)],
+}
+
+REGEX_SYMBOL_PATTERNS = {
+    "javascript": [
+        ("class", re.compile(r"^[ \t]*(?:export\s+)?(?:default\s+)?(?:abstract\s+)?class\s+(\w+)[^{\n]*", re.M)),
+        ("interface", re.compile(r"^[ \t]*(?:export\s+)?(?:interface|type)\s+(\w+)[^{=\n]*", re.M)),
+        ("function", re.compile(r"^[ \t]*(?:export\s+)?(?:default\s+)?(?:async\s+)?function\s*\*?\s*(\w+)\s*(?:<[^>\n]*>)?\([^)]*\)[^{\n]*", re.M)),
+        ("function", re.compile(r"^[ \t]*(?:export\s+)?(?:const|let|var)\s+(\w+)\s*(?::[^=\n]+)?=\s*(?:async\s+)?(?:\([^)]*\)|\w+)\s*(?::[^=\n]+)?=>", re.M)),
+        ("method", re.compile(r"^[ \t]+(?:public\s+|private\s+|protected\s+|static\s+|async\s+|readonly\s+)*(?!if\b|for\b|while\b|switch\b|catch\b|return\b)(\w+)\s*\([^)\n]*\)\s*(?::\s*[^{\n]+)?\{", re.M)),
+    ],
+    "go": [
+        ("type", re.compile(r"^type\s+(\w+)\s+[^\n{]*", re.M)),
+        ("function", re.compile(r"^func\s+(?:\([^)]*\)\s*)?(\w+)\s*\([^\n{]*", re.M)),
+    ],
+    "java": [
+        ("class", re.compile(r"^[ \t]*(?:(?:public|private|protected|abstract|final|static)\s+)*(?:class|interface|enum|record)\s+(\w+)[^{\n]*", re.M)),
+        ("method", re.compile(r"^[ \t]+(?:(?:public|private|protected|abstract|final|static|synchronized|native|default)\s+)+(?:<[^>\n]+>\s+)?[\w<>\[\], ?]+\s+(\w+)\s*\([^)\n]*\)[^;{\n]*", re.M)),
+    ],
+    "c": [
+        ("type", re.compile(r"^(?:typedef\s+)?(?:struct|class|enum|union)\s+(\w+)[^;\n]*$", re.M)),
+        ("function", re.compile(r"^(?!\s)(?!return\b|else\b|if\b|while\b|for\b|switch\b)[\w:*&<>, ]+?[\s*&]+([\w:~]+)\s*\([^;{]*\)\s*(?:const\s*)?(?:noexcept\s*)?\{?\s*$", re.M)),
+    ],
+    "markdown": [
+        ("section", re.compile(r"^(#{1,3}\s+.+)$", re.M)),
+    ],
+}
+
+FENCED_CODE_PATTERN = re.compile(r"^(```|~~~).*?^\1", re.M | re.S)
+COMMENT_LINE_PATTERN = re.compile(r"^\s*(?://+|/?\*+|#(?!include))\s?(.*?)\s*(?:\*/)?$")
+IDENTIFIER_PART_PATTERN = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
+MAX_DOC_CHARS = 160
+
+def detect_language(file_path: str) -> Optional[str]:
+    return LANGUAGE_BY_EXTENSION.get(os.path.splitext(file_path)[1].lower())
+
+def build_symbol_index(file_collection: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    symbol_index = []
+    for file_path, file_content in file_collection:
+        language = detect_language(file_path)
+        try:
+            if language == "python":
+                file_entry = _index_python_source(file_content)
+            elif language in REGEX_SYMBOL_PATTERNS:
+                file_entry = _index_with_patterns(file_content, language)
+            else:
+                file_entry = {"imports": [], "symbols": []}
+        except (SyntaxError, ValueError, RecursionError):
+            file_entry = {"imports": [], "symbols": []}
+        file_entry["language"] = language
+        symbol_index.append(file_entry)
+    return symbol_index
+
+def render_file_outline(file_entry: Dict[str, Any]) -> str:
+    outline_lines = []
+    if file_entry.get("doc"):
+        outline_lines.append(f'"""{file_entry["doc"]}"""')
+    if file_entry.get("imports"):
+        outline_lines.append("imports: " + ", ".join(file_entry["imports"]))
+    for symbol in file_entry.get("symbols", []):
+        indentation = "    " if symbol.get("parent") else ""
+        symbol_line = f"{indentation}{symbol['signature']}"
+        if symbol.get("doc"):
+            symbol_line += f"  # {symbol['doc']}"
+        outline_lines.append(symbol_line)
+    return "\n".join(outline_lines)
+
+def extract_query_terms(*text_fragments: str) -> Set[str]:
+    query_terms = set()
+    for text_fragment in text_fragments:
+        for word in re.findall(r"[A-Za-z_][A-Za-z0-9_]*", text_fragment or ""):
+            query_terms.update(part.lower() for part in _identifier_parts(word) if len(part) >= 4)
+            if len(word) >= 4:
+                query_terms.add(word.lower())
+    return query_terms
+
+def extract_relevant_symbols(file_content: str, file_entry: Dict[str, Any], query_terms: Set[str], max_chars: int = 6000) -> str:
+    source_lines = file_content.splitlines()
+    symbols = file_entry.get("symbols", [])
+    
+    def symbol_matches(symbol):
+        name_parts = {part.lower() for part in _identifier_parts(symbol["name"])} | {symbol["name"].lower()}
+        return bool(name_parts & query_terms)
+        
+    matched_symbols = [symbol for symbol in symbols if symbol_matches(symbol)]
+    matched_parents = {symbol["name"] for symbol in matched_symbols if not symbol.get("parent")}
+    selected_symbols = [
+        symbol for symbol in matched_symbols
+        if not symbol.get("parent") or symbol["parent"] not in matched_parents
+    ]
+    
+    excerpt_sections = []
+    if file_entry.get("imports"):
+        excerpt_sections.append("imports: " + ", ".join(file_entry["imports"]))
+        
+    remaining_chars = max_chars
+    included_names = set()
+    for symbol in selected_symbols:
+        symbol_source = "\n".join(source_lines[symbol["start_line"] - 1:symbol["end_line"]])
+        if len(symbol_source) > remaining_chars:
+            continue
+        excerpt_sections.append(symbol_source)
+        included_names.add((symbol.get("parent"), symbol["name"]))
+        remaining_chars -= len(symbol_source)
+        
+    other_definitions = [
+        ("    " if symbol.get("parent") else "") + symbol["signature"]
+        for symbol in symbols
+        if (symbol.get("parent"), symbol["name"]) not in included_names and symbol.get("parent") not in matched_parents
+    ]
+    if other_definitions:
+        excerpt_sections.append("# Other definitions (signatures only):\n" + "\n".join(other_definitions))
+        
+    return "[Relevant symbols - other source omitted for brevity]\n" + "\n\n".join(excerpt_sections)
+
+def _identifier_parts(identifier: str) -> List[str]:
+    return [part for chunk in identifier.split("_") for part in IDENTIFIER_PART_PATTERN.findall(chunk)]
+
+def _short_doc(docstring: Optional[str]) -> str:
+    if not docstring:
+        return ""
+    first_paragraph = docstring.strip().split("\n\n")[0]
+    return " ".join(first_paragraph.split())[:MAX_DOC_CHARS]
+
+def _index_python_source(file_content: str) -> Dict[str, Any]:
+    module_tree = ast.parse(file_content)
+    imports = []
+    symbols = []
+    
+    for node in ast.walk(module_tree):
+        if isinstance(node, ast.Import):
+            imports.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            module_name = "." * node.level + (node.module or "")
+            imports.append(module_name)
+            
+    def describe_function(function_node, parent_name=None):
+        prefix = "async def" if isinstance(function_node, ast.AsyncFunctionDef) else "def"
+        signature = f"{prefix} {function_node.name}({ast.unparse(function_node.args)})"
+        if function_node.returns is not None:
+            signature += f" -> {ast.unparse(function_node.returns)}"
+        return {
+            "kind": "method" if parent_name else "function",
+            "name": function_node.name,
+            "parent": parent_name,
+            "signature": signature,
+            "doc": _short_doc(ast.get_docstring(function_node)),
+            "start_line": min([function_node.lineno] + [decorator.lineno for decorator in function_node.decorator_list]),
+            "end_line": function_node.end_lineno,
+        }
+        
+    for node in module_tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            symbols.append(describe_function(node))
+        elif isinstance(node, ast.ClassDef):
+            base_names = ", ".join(ast.unparse(base) for base in node.bases)
+            symbols.append({
+                "kind": "class",
+                "name": node.name,
+                "parent": None,
+                "signature": f"class {node.name}({base_names})" if base_names else f"class {node.name}",
+                "doc": _short_doc(ast.get_docstring(node)),
+                "start_line": min([node.lineno] + [decorator.lineno for decorator in node.decorator_list]),
+                "end_line": node.end_lineno,
+            })
+            for member in node.body:
+                if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    symbols.append(describe_function(member, node.name))
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                if isinstance(target, ast.Name) and target.id.isupper():
+                    symbols.append({
+                        "kind": "constant",
+                        "name": target.id,
+                        "parent": None,
+                        "signature": target.id,
+                        "doc": "",
+                        "start_line": node.lineno,
+                        "end_line": node.end_lineno,
+                    })
+                    
+    return {
+        "doc": _short_doc(ast.get_docstring(module_tree)),
+        "imports": list(dict.fromkeys(imports)),
+        "symbols": symbols,
+    }
+
+def _index_with_patterns(file_content: str, language: str) -> Dict[str, Any]:
+    imports = []
+    for import_pattern in REGEX_IMPORT_PATTERNS.get(language, []):
+        imports.extend(import_pattern.findall(file_content))
+        
+    line_starts = [0]
+    for match in re.finditer("\n", file_content):
+        line_starts.append(match.end())
+    source_lines = file_content.splitlines()
+    
+    def line_number(offset):
+        low, high = 0, len(line_starts) - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if line_starts[middle] <= offset:
+                low = middle
+            else:
+                high = middle - 1
+        return low + 1
+        
+    searchable_content = file_content
+    if language == "markdown":
+        searchable_content = FENCED_CODE_PATTERN.sub(lambda match: "\n" * match.group(0).count("\n"), file_content)
+        
+    symbols = []
+    seen_lines = set()
+    for symbol_kind, symbol_pattern in REGEX_SYMBOL_PATTERNS[language]:
+        for match in symbol_pattern.finditer(searchable_content):
+            start_line = line_number(match.start(1))
+            if start_line in seen_lines:
+                continue
+            seen_lines.add(start_line)
+            symbols.append({
+                "kind": symbol_kind,
+                "name": match.group(1).lstrip("#").strip() if symbol_kind == "section" else match.group(1),
+                "parent": None,
+                "signature": " ".join(match.group(0).strip().rstrip("{").split()),
+                "doc": _preceding_comment(source_lines, start_line) if language != "markdown" else "",
+                "start_line": start_line,
+                "end_line": start_line,
+            })
+            
+    symbols.sort(key=lambda symbol: symbol["start_line"])
+    for position, symbol in enumerate(symbols):
+        next_start = symbols[position + 1]["start_line"] - 1 if position + 1 < len(symbols) else len(source_lines)
+        if language == "markdown":
+            symbol["end_line"] = next_start
+        else:
+            symbol["end_line"] = _block_end_line(source_lines, symbol["start_line"], next_start)
+            
+    enclosing_types = []
+    for symbol in symbols:
+        while enclosing_types and enclosing_types[-1]["end_line"] < symbol["start_line"]:
+            enclosing_types.pop()
+        if enclosing_types and symbol["kind"] in ("method", "function"):
+            symbol["parent"] = enclosing_types[-1]["name"]
+            symbol["kind"] = "method"
+        if symbol["kind"] in ("class", "interface", "type"):
+            enclosing_types.append(symbol)
+            
+    return {"imports": list(dict.fromkeys(imports)), "symbols": symbols}
+
+def _block_end_line(source_lines: List[str], start_line: int, fallback_line: int) -> int:
+    brace_depth = 0
+    opened = False
+    for line_number in range(start_line, min(len(source_lines), start_line + 2000) + 1):
+        line_text = source_lines[line_number - 1]
+        if not opened and line_number > start_line and not line_text.lstrip().startswith("{"):
+            return start_line
+        brace_depth += line_text.count("{") - line_text.count("}")
+        if "{" in line_text:
+            opened = True
+        if opened and brace_depth <= 0:
+            return line_number
+    return max(start_line, fallback_line) if opened else start_line
+
+def _preceding_comment(source_lines: List[str], start_line: int) -> str:
+    comment_lines = []
+    line_number = start_line - 1
+    while line_number >= 1:
+        comment_match = COMMENT_LINE_PATTERN.match(source_lines[line_number - 1])
+        if not comment_match or not source_lines[line_number - 1].strip():
+            break
+        comment_lines.insert(0, comment_match.group(1))
+        line_number -= 1
+    return _short_doc("\n".join(line for line in comment_lines if line))
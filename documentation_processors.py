@@ -1,22 +1,132 @@
 import os
 import re
+import json
+import hashlib
+import threading
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Any, Optional
 from pocketflow import Node, BatchNode
 from file_operations.repository_scanner import scan_github_repository
 from ai_interface.model_connector import query_language_model
+from ai_interface.structured_output import (
+    StructuredOutputError, coerce_list, first_present, parse_index_reference,
+    parse_structured_response, query_structured_output,
+)
 from file_operations.filesystem_explorer import explore_local_directory
+from file_operations.file_lock import merge_into_json_file
+from code_analysis.symbol_index import build_symbol_index, extract_query_terms, extract_relevant_symbols, render_file_outline
+from code_analysis.lexical_index import LexicalIndex
+from code_analysis.source_compactor import CompactionCache, compact_file_collection, format_compaction_report
+from code_analysis.dependency_graph import (
+    build_concept_dependency_edges, build_file_dependency_graph, dependency_teaching_order, describe_dependency_edges,
+)
+from workflow_checkpoints import WorkflowCheckpointStore
+from pipeline_profiler import attribute_to_current_stage, profile_span, record_transfer
 
-def extract_file_content_by_indices(file_collection: List[Tuple[str, str]], target_indices: List[int]) -> Dict[str, str]:
+SYMBOL_FOCUS_MIN_CHARS = 6000
+MAX_LABELED_DEPENDENCY_EDGES = 40
+OUTLINE_FALLBACK_CHARS = 1500
+SPECULATIVE_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(concept_(\d+)\.md\)")
+LEXICAL_INDEX_LOCK = threading.Lock()
+
+def speculative_chapter_filename(concept_index: int) -> str:
+    return f"concept_{concept_index}.md"
+
+def extract_file_content_by_indices(
+    file_collection: List[Tuple[str, str]],
+    target_indices: List[int],
+    file_summaries: Optional[List[Optional[str]]] = None,
+    context_budget_chars: Optional[int] = None,
+    symbol_index: Optional[List[Dict[str, Any]]] = None,
+    query_terms: Optional[Set[str]] = None
+) -> Dict[str, str]:
     content_mapping = {}
     for index in target_indices:
         if 0 <= index < len(file_collection):
             file_path, file_content = file_collection[index]
+            if symbol_index and query_terms and index < len(symbol_index) and len(file_content) > SYMBOL_FOCUS_MIN_CHARS:
+                file_content = extract_relevant_symbols(file_content, symbol_index[index], query_terms)
             content_mapping[f"{index} # {file_path}"] = file_content
+            
+    if not file_summaries or not context_budget_chars:
+        return content_mapping
+        
+    total_size = sum(len(content) for content in content_mapping.values())
+    if total_size <= context_budget_chars:
+        return content_mapping
+        
+    for index_path in sorted(content_mapping, key=lambda key: len(content_mapping[key]), reverse=True):
+        if total_size <= context_budget_chars:
+            break
+        file_index = int(index_path.split(" # ")[0])
+        file_summary = file_summaries[file_index] if file_index < len(file_summaries) else None
+        if not file_summary:
+            continue
+        summarized_content = f"[File digest - full source omitted for brevity]\n{file_summary}"
+        total_size -= len(content_mapping[index_path]) - len(summarized_content)
+        content_mapping[index_path] = summarized_content
+        
     return content_mapping
 
+def build_chapter_lexical_index(workspace_config: Dict[str, Any]) -> Optional[LexicalIndex]:
+    if not workspace_config.get("retrieval_context_budget_chars", 0):
+        return None
+    discovered_files = workspace_config["discovered_files"]
+    lexical_index_cache = workspace_config.setdefault("lexical_index_cache", {})
+    with LEXICAL_INDEX_LOCK:
+        lexical_index = lexical_index_cache.get("index")
+        if lexical_index is None or lexical_index.file_collection is not discovered_files:
+            lexical_index = LexicalIndex(discovered_files, workspace_config.get("symbol_index"))
+            lexical_index_cache["index"] = lexical_index
+            print(f"Built lexical index over {len(lexical_index.chunks)} source chunks for chapter context selection.")
+    return lexical_index
+
+def select_chapter_source_context(workspace_config: Dict[str, Any], concept_details: Dict[str, Any], lexical_index: Optional[LexicalIndex]) -> Dict[str, str]:
+    related_file_indices = concept_details.get("files", [])
+    if lexical_index:
+        return lexical_index.select_context(
+            f"{concept_details['name']}\n{concept_details['description']}",
+            workspace_config.get("retrieval_context_budget_chars", 0), related_file_indices
+        )
+    symbol_index = workspace_config.get("symbol_index") if workspace_config.get("use_symbol_context", False) else None
+    return extract_file_content_by_indices(
+        workspace_config["discovered_files"], related_file_indices,
+        workspace_config.get("file_summaries"), workspace_config.get("file_context_budget_chars"),
+        symbol_index, extract_query_terms(concept_details["name"], concept_details["description"])
+    )
+
+class FileSummaryCache:
+    def __init__(self, cache_file_name: str = "file_summary_cache.json"):
+        self.cache_file_path = Path(os.getenv("FILE_SUMMARY_CACHE", cache_file_name))
+        self.cached_summaries = {}
+        if self.cache_file_path.exists():
+            try:
+                with open(self.cache_file_path, "r", encoding="utf-8") as cache_file:
+                    self.cached_summaries = json.load(cache_file)
+            except Exception as cache_error:
+                print(f"Warning: Failed to load file summary cache - {cache_error}")
+                
+    @staticmethod
+    def content_hash(file_content: str) -> str:
+        return hashlib.sha256(file_content.encode("utf-8", errors="ignore")).hexdigest()
+        
+    def get_summary(self, content_hash: str) -> Optional[str]:
+        return self.cached_summaries.get(content_hash)
+        
+    def store_summaries(self, new_summaries: Dict[str, str]) -> None:
+        if not new_summaries:
+            return
+        self.cached_summaries.update(new_summaries)
+        try:
+            self.cached_summaries = merge_into_json_file(self.cache_file_path, new_summaries)
+        except Exception as save_error:
+            print(f"Warning: Failed to save file summary cache - {save_error}")
+
 class CodebaseRetriever(Node):
+    checkpoint_keys = ("discovered_files", "project_identifier", "symbol_index", "file_dependency_graph")
+    
     def prep(self, workspace_config):
         repository_url = workspace_config.get("source_repository")
         local_path = workspace_config.get("local_filesystem_path")
@@ -41,46 +151,294 @@ class CodebaseRetriever(Node):
             "exclusion_patterns": file_exclusion_patterns,
             "file_size_limit": size_limit_bytes,
             "use_relative_paths": True,
+            "download_mode": workspace_config.get("remote_download_mode", "tree"),
+            "download_workers": workspace_config.get("remote_download_workers", 8),
+            "use_github_cache": workspace_config.get("enable_github_cache", True),
+            "use_mirror_cache": workspace_config.get("enable_mirror_cache", False),
+            "oversized_file_mode": workspace_config.get("oversized_file_mode", "skip"),
         }
         
     def exec(self, preparation_result):
         if preparation_result["repository_url"]:
             print(f"Scanning remote repository: {preparation_result['repository_url']}...")
-            scan_results = scan_github_repository(
-                repo_url=preparation_result["repository_url"],
-                token=preparation_result["api_token"],
-                include_patterns=preparation_result["inclusion_patterns"],
-                exclude_patterns=preparation_result["exclusion_patterns"],
-                max_file_size=preparation_result["file_size_limit"],
-                use_relative_paths=preparation_result["use_relative_paths"],
-            )
+            with profile_span("scan_github_repository", "scanner", download_mode=preparation_result["download_mode"]) as span_arguments:
+                scan_results = scan_github_repository(
+                    repo_url=preparation_result["repository_url"],
+                    token=preparation_result["api_token"],
+                    include_patterns=preparation_result["inclusion_patterns"],
+                    exclude_patterns=preparation_result["exclusion_patterns"],
+                    max_file_size=preparation_result["file_size_limit"],
+                    use_relative_paths=preparation_result["use_relative_paths"],
+                    download_mode=preparation_result["download_mode"],
+                    max_concurrent_downloads=preparation_result["download_workers"],
+                    use_response_cache=preparation_result["use_github_cache"],
+                    use_mirror_cache=preparation_result["use_mirror_cache"],
+                    oversized_file_mode=preparation_result["oversized_file_mode"],
+                )
         else:
             print(f"Exploring local directory: {preparation_result['local_directory']}...")
-            scan_results = explore_local_directory(
-                directory=preparation_result["local_directory"],
-                include_patterns=preparation_result["inclusion_patterns"],
-                exclude_patterns=preparation_result["exclusion_patterns"],
-                max_file_size=preparation_result["file_size_limit"],
-                use_relative_paths=preparation_result["use_relative_paths"]
-            )
-            
+            with profile_span("explore_local_directory", "scanner") as span_arguments:
+                scan_results = explore_local_directory(
+                    directory=preparation_result["local_directory"],
+                    include_patterns=preparation_result["inclusion_patterns"],
+                    exclude_patterns=preparation_result["exclusion_patterns"],
+                    max_file_size=preparation_result["file_size_limit"],
+                    use_relative_paths=preparation_result["use_relative_paths"],
+                    oversized_file_mode=preparation_result["oversized_file_mode"]
+                )
+                
         discovered_files = list(scan_results.get("files", {}).items())
+        scanned_bytes = sum(len(file_content.encode("utf-8")) for _, file_content in discovered_files)
+        span_arguments.update(file_count=len(discovered_files), bytes_read=scanned_bytes)
+        record_transfer(bytes_in=scanned_bytes)
         if not discovered_files:
             raise ValueError("No files were successfully retrieved from the source")
         print(f"Successfully retrieved {len(discovered_files)} files.")
         return discovered_files
         
     def post(self, workspace_config, preparation_result, execution_result):
+        if workspace_config.get("compact_prompt_sources", False):
+            execution_result, size_report = compact_file_collection(
+                execution_result, workspace_config.get("drop_trivial_function_bodies", False), CompactionCache()
+            )
+            print(format_compaction_report(size_report))
+            
         workspace_config["discovered_files"] = execution_result
+        graph_structure_enabled = workspace_config.get("structure_mode", "llm") == "graph"
+        symbol_index_needed = (
+            graph_structure_enabled
+            or workspace_config.get("use_symbol_context", False)
+            or workspace_config.get("retrieval_context_budget_chars", 0) > 0
+        )
+        workspace_config["symbol_index"] = build_symbol_index(execution_result) if symbol_index_needed else None
+        workspace_config["file_dependency_graph"] = (
+            build_file_dependency_graph(execution_result, workspace_config["symbol_index"]) if graph_structure_enabled else None
+        )
+        workspace_config["lexical_index_cache"] = {}
+
+class FileSummarizer(BatchNode):
+    checkpoint_keys = ("file_summaries",)
+    
+    def prep(self, workspace_config):
+        file_collection = workspace_config["discovered_files"]
+        workspace_config["file_summaries"] = [None] * len(file_collection)
+        
+        if not workspace_config.get("enable_file_summaries", False):
+            return []
+            
+        self.summary_cache = FileSummaryCache()
+        self.summary_workers = workspace_config.get("file_summary_workers", 8)
+        
+        summary_items = []
+        for index, (path, content) in enumerate(file_collection):
+            content_hash = FileSummaryCache.content_hash(content)
+            cached_summary = self.summary_cache.get_summary(content_hash)
+            if cached_summary:
+                workspace_config["file_summaries"][index] = cached_summary
+            else:
+                summary_items.append({
+                    "file_index": index,
+                    "file_path": path,
+                    "file_content": content,
+                    "content_hash": content_hash,
+                })
+                
+        print(f"File digests: {len(file_collection) - len(summary_items)} cached, {len(summary_items)} to generate...")
+        return summary_items
+        
+    def _exec(self, items):
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, self.summary_workers)) as summary_pool:
+            return list(summary_pool.map(attribute_to_current_stage(lambda item: Node._exec(self, item)), items))
+            
+    def exec(self, summary_item):
+        summary_prompt = f"""
+Produce a compact digest of the source file `{summary_item["file_path"]}` for use as context in later analysis.
+
+Source:
+{summary_item["file_content"]}
+
+Respond in plain text (no Markdown fences) with at most 15 lines:
+Purpose: one or two sentences describing what the file is responsible for.
+Key symbols: one line per important class, function or constant, each with its signature, e.g. `def load(path: str) -> Config`: loads settings.
+Dependencies: the most important imports or collaborators.
+"""
+        file_summary = query_language_model(summary_prompt, use_cache=False)
+        return file_summary.strip()
+        
+    def exec_fallback(self, prep_res, exc):
+        print(f"Warning: Could not summarize {prep_res['file_path']}: {exc}")
+        return None
+        
+    def post(self, workspace_config, preparation_result, execution_result_list):
+        new_summaries = {}
+        for summary_item, file_summary in zip(preparation_result, execution_result_list):
+            if file_summary:
+                workspace_config["file_summaries"][summary_item["file_index"]] = file_summary
+                new_summaries[summary_item["content_hash"]] = file_summary
+                
+        if preparation_result:
+            self.summary_cache.store_summaries(new_summaries)
+            print(f"Generated {len(new_summaries)} file digests.")
+
+DOCUMENTATION_MANIFEST_NAME = ".codestory_manifest.json"
+CHAPTER_TRANSLATION_ATTEMPTS = 3
+
+def chapter_output_filename(chapter_number: int, concept_name: str) -> str:
+    sanitized_name = "".join(c if c.isalnum() else "_" for c in concept_name).lower()
+    return f"{chapter_number:02d}_{sanitized_name}.md"
+
+def documentation_output_directory(workspace_config: Dict[str, Any]) -> str:
+    output_directory = os.path.join(workspace_config.get("documentation_output_path", "output"), workspace_config["project_identifier"])
+    if len(workspace_config.get("target_languages") or []) > 1:
+        language_directory = re.sub(r"[^\w-]+", "_", workspace_config.get("target_language", "english").lower())
+        return os.path.join(output_directory, language_directory)
+    return output_directory
+
+def normalize_chapter_heading(chapter_content: str, chapter_number: int, concept_name: str) -> str:
+    expected_heading = f"# Chapter {chapter_number}: {concept_name}"
+    if not chapter_content.strip().startswith(f"# Chapter {chapter_number}"):
+        content_lines = chapter_content.strip().split("\n")
+        if content_lines and content_lines[0].strip().startswith("#"):
+            content_lines[0] = expected_heading
+            chapter_content = "\n".join(content_lines)
+        else:
+            chapter_content = f"{expected_heading}\n\n{chapter_content}"
+    return chapter_content
+
+def build_file_fingerprints(file_collection: List[Tuple[str, str]]) -> List[List[str]]:
+    return [[path, FileSummaryCache.content_hash(content)] for path, content in file_collection]
+
+class ChangeDetector(Node):
+    checkpoint_keys = (
+        "identified_concepts", "concept_relationships", "chapter_sequence",
+        "previous_generated_chapters", "chapters_to_regenerate",
+    )
+    
+    def prep(self, workspace_config):
+        workspace_config["previous_generated_chapters"] = None
+        workspace_config["chapters_to_regenerate"] = None
+        
+        if not workspace_config.get("incremental_regeneration", False):
+            return None
+            
+        manifest_path = os.path.join(documentation_output_directory(workspace_config), DOCUMENTATION_MANIFEST_NAME)
+        if not os.path.exists(manifest_path):
+            print("No previous documentation manifest found, running full generation.")
+            return None
+            
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+                previous_manifest = json.load(manifest_file)
+        except Exception as manifest_error:
+            print(f"Warning: Failed to load documentation manifest - {manifest_error}")
+            return None
+            
+        return {
+            "previous_manifest": previous_manifest,
+            "current_fingerprints": build_file_fingerprints(workspace_config["discovered_files"]),
+            "settings_fingerprint": WorkflowCheckpointStore.compute_fingerprint(workspace_config),
+        }
+        
+    def exec(self, preparation_result):
+        if not preparation_result:
+            return None
+            
+        previous_manifest = preparation_result["previous_manifest"]
+        previous_fingerprints = previous_manifest.get("file_fingerprints", [])
+        current_fingerprints = preparation_result["current_fingerprints"]
+        
+        if previous_manifest.get("settings_fingerprint") != preparation_result["settings_fingerprint"]:
+            print("Generation settings changed since the previous run, running full generation.")
+            return None
+            
+        previous_paths = [path for path, _ in previous_fingerprints]
+        current_paths = [path for path, _ in current_fingerprints]
+        if previous_paths != current_paths:
+            print("Files were added or removed since the previous run, running full generation.")
+            return None
+            
+        changed_indices = {
+            index for index, (previous_entry, current_entry) in enumerate(zip(previous_fingerprints, current_fingerprints))
+            if previous_entry[1] != current_entry[1]
+        }
+        
+        concepts_data = previous_manifest["identified_concepts"]
+        chapters_to_regenerate = [
+            position for position, concept_index in enumerate(previous_manifest["chapter_sequence"])
+            if changed_indices.intersection(concepts_data[concept_index]["files"])
+        ]
+        
+        print(f"Structure unchanged: {len(changed_indices)} changed files affect {len(chapters_to_regenerate)} of {len(previous_manifest['chapter_sequence'])} chapters.")
+        return {
+            "identified_concepts": concepts_data,
+            "concept_relationships": previous_manifest["concept_relationships"],
+            "chapter_sequence": previous_manifest["chapter_sequence"],
+            "previous_generated_chapters": previous_manifest["generated_chapters"],
+            "chapters_to_regenerate": chapters_to_regenerate,
+        }
+        
+    def post(self, workspace_config, preparation_result, execution_result):
+        if not execution_result:
+            return None
+        workspace_config.update(execution_result)
+        return "reuse_structure"
+
+def partition_files_for_analysis(file_collection: List[Tuple[str, str]], chunk_budget_chars: int) -> List[List[int]]:
+    directory_groups = {}
+    for index, (path, content) in enumerate(file_collection):
+        directory_groups.setdefault(os.path.dirname(path), []).append(index)
+        
+    file_chunks = []
+    current_chunk = []
+    current_size = 0
+    
+    for directory in sorted(directory_groups):
+        group_indices = directory_groups[directory]
+        group_size = sum(len(file_collection[index][1]) + len(file_collection[index][0]) for index in group_indices)
+        
+        if current_chunk and current_size + group_size > chunk_budget_chars:
+            file_chunks.append(current_chunk)
+            current_chunk = []
+            current_size = 0
+            
+        for index in group_indices:
+            path, content = file_collection[index]
+            entry_size = len(content) + len(path)
+            if current_chunk and current_size + entry_size > chunk_budget_chars:
+                file_chunks.append(current_chunk)
+                current_chunk = []
+                current_size = 0
+            current_chunk.append(index)
+            current_size += entry_size
+            
+    if current_chunk:
+        file_chunks.append(current_chunk)
+        
+    return file_chunks
 
 class ConceptIdentifier(Node):
+    checkpoint_keys = ("identified_concepts",)
+    
     def prep(self, workspace_config):
         file_collection = workspace_config["discovered_files"]
         project_name = workspace_config["project_identifier"]
         target_language = workspace_config.get("target_language", "english")
         caching_enabled = workspace_config.get("enable_ai_caching", True)
         max_concepts = workspace_config.get("maximum_concept_count", 10)
+        context_budget = workspace_config.get("concept_context_budget_chars", 500000)
+        map_workers = workspace_config.get("concept_map_workers", 4)
+        symbol_index = workspace_config.get("symbol_index")
         
+        if workspace_config.get("use_symbol_context", False) and symbol_index:
+            outlined_collection = []
+            for (path, content), file_entry in zip(file_collection, symbol_index):
+                file_outline = render_file_outline(file_entry)
+                outlined_collection.append((path, file_outline or content[:OUTLINE_FALLBACK_CHARS]))
+            print(f"Using symbol outline for concept analysis ({sum(len(content) for _, content in outlined_collection)} chars)")
+            file_collection = outlined_collection
+            
         def build_analysis_context(files_data):
             full_context = ""
             file_metadata = []
@@ -90,20 +448,110 @@ class ConceptIdentifier(Node):
                 file_metadata.append((index, path))
             return full_context, file_metadata
             
-        analysis_context, file_metadata = build_analysis_context(file_collection)
-        file_listing_text = "\n".join([f"- {idx} # {path}" for idx, path in file_metadata])
+        total_context_size = sum(len(path) + len(content) for path, content in file_collection)
+        
+        analysis_chunks = []
+        if total_context_size > context_budget:
+            for chunk_indices in partition_files_for_analysis(file_collection, context_budget):
+                chunk_context, chunk_metadata = build_analysis_context([file_collection[index] for index in chunk_indices])
+                chunk_listing = "\n".join([f"- {idx} # {path}" for idx, path in chunk_metadata])
+                analysis_chunks.append((chunk_context, chunk_listing, chunk_indices))
+            print(f"Codebase exceeds single-prompt budget ({total_context_size} chars), analyzing {len(analysis_chunks)} chunks...")
+            analysis_context = ""
+        else:
+            analysis_context, file_metadata = build_analysis_context(file_collection)
+            
+        file_paths = [path for path, _ in file_collection]
+        file_listing_text = "\n".join([f"- {idx} # {path}" for idx, path in enumerate(file_paths)])
         
         return (
             analysis_context, file_listing_text, len(file_collection),
-            project_name, target_language, caching_enabled, max_concepts
+            project_name, target_language, caching_enabled, max_concepts,
+            analysis_chunks, file_paths, map_workers
         )
         
     def exec(self, preparation_result):
-        (context, file_listing, file_count, project_name, 
-         language, use_cache, max_concepts) = preparation_result
-        
+        (context, file_listing, file_count, project_name,
+         language, use_cache, max_concepts,
+         analysis_chunks, file_paths, map_workers) = preparation_result
+         
         print(f"Identifying core concepts using AI analysis...")
         
+        if analysis_chunks:
+            validated_concepts = self._identify_concepts_by_chunks(
+                analysis_chunks, file_paths, project_name, language, use_cache, max_concepts, map_workers
+            )
+        else:
+            analysis_prompt = self._build_concept_prompt(context, file_listing, project_name, language, max_concepts)
+            validated_concepts = query_structured_output(
+                analysis_prompt,
+                lambda parsed_data: self._normalize_concepts(parsed_data, file_count),
+                use_cache=(use_cache and self.cur_retry == 0)
+            )
+            
+        print(f"Successfully identified {len(validated_concepts)} core concepts.")
+        print(f"📚 Will generate {len(validated_concepts)} tutorial chapters")
+        return validated_concepts
+        
+    def _identify_concepts_by_chunks(self, analysis_chunks, file_paths, project_name, language, use_cache, max_concepts, map_workers):
+        chunk_count = len(analysis_chunks)
+        
+        def extract_chunk_concepts(chunk_position):
+            chunk_context, chunk_listing, chunk_indices = analysis_chunks[chunk_position]
+            scope_note = (
+                f"NOTE: This is part {chunk_position + 1} of {chunk_count} of the codebase. "
+                f"Only identify concepts that are visible in the files below.\n\n"
+            )
+            chunk_prompt = self._build_concept_prompt(
+                chunk_context, chunk_listing, project_name, language, max_concepts, scope_note
+            )
+            
+            for attempt in range(self.max_retries):
+                try:
+                    chunk_concepts = query_structured_output(
+                        chunk_prompt,
+                        lambda parsed_data: self._normalize_concepts(parsed_data, len(chunk_indices)),
+                        use_cache=(use_cache and attempt == 0)
+                    )
+                    break
+                except Exception as chunk_error:
+                    if attempt == self.max_retries - 1:
+                        raise chunk_error
+                    print(f"Retrying concept extraction for chunk {chunk_position + 1}: {chunk_error}")
+                    
+            for concept in chunk_concepts:
+                concept["files"] = [chunk_indices[local_index] for local_index in concept["files"]]
+            return chunk_concepts
+            
+        with ThreadPoolExecutor(max_workers=max(1, map_workers)) as chunk_pool:
+            chunk_results = list(chunk_pool.map(attribute_to_current_stage(extract_chunk_concepts), range(chunk_count)))
+            
+        candidate_concepts = [concept for chunk_concepts in chunk_results for concept in chunk_concepts]
+        print(f"Merging {len(candidate_concepts)} candidate concepts from {chunk_count} chunks...")
+        
+        referenced_indices = sorted({index for concept in candidate_concepts for index in concept["files"]})
+        candidate_listing = "\n".join(
+            f"- Candidate {position}: {concept['name'].strip()}\n"
+            f"  Description: {concept['description'].strip()}\n"
+            f"  Files: [{', '.join(map(str, concept['files']))}]"
+            for position, concept in enumerate(candidate_concepts)
+        )
+        referenced_listing = "\n".join(f"- {index} # {file_paths[index]}" for index in referenced_indices)
+        
+        reduce_context = (
+            "The codebase was analyzed in parts. Candidate concepts found in each part:\n"
+            f"{candidate_listing}\n\n"
+            "Merge candidates that describe the same concept (combining their file indices), "
+            "drop minor ones, and keep the most crucial concepts for the whole project.\n"
+        )
+        reduce_prompt = self._build_concept_prompt(reduce_context, referenced_listing, project_name, language, max_concepts)
+        return query_structured_output(
+            reduce_prompt,
+            lambda parsed_data: self._normalize_concepts(parsed_data, len(file_paths)),
+            use_cache=(use_cache and self.cur_retry == 0)
+        )
+        
+    def _build_concept_prompt(self, context, file_listing, project_name, language, max_concepts, scope_note=""):
         language_directive = ""
         name_language_note = ""
         description_language_note = ""
@@ -113,13 +561,13 @@ class ConceptIdentifier(Node):
             name_language_note = f" (must be in {language.capitalize()})"
             description_language_note = f" (must be in {language.capitalize()})"
             
-        analysis_prompt = f"""
+        return f"""
 For the software project `{project_name}`:
 
 Source Code Analysis Context:
 {context}
 
-{language_directive}Examine the provided codebase thoroughly.
+{scope_note}{language_directive}Examine the provided codebase thoroughly.
 Identify the 5-{max_concepts} most crucial architectural concepts that newcomers should understand.
 
 For each concept, specify:
@@ -149,57 +597,41 @@ Structure the response as YAML:
     - 5 # path/to/interface.js
 ```"""
 
-        ai_response = query_language_model(analysis_prompt, use_cache=(use_cache and self.cur_retry == 0))
-        
-        yaml_content = ai_response.strip().split("```yaml")[1].split("```")[0].strip()
-        parsed_concepts = yaml.safe_load(yaml_content)
-        
-        if not isinstance(parsed_concepts, list):
-            raise ValueError("AI response format is invalid - expected list structure")
-            
+    def _normalize_concepts(self, parsed_data, file_count):
         validated_concepts = []
-        for concept_item in parsed_concepts:
-            required_fields = ["name", "description", "file_indices"]
-            if not isinstance(concept_item, dict) or not all(field in concept_item for field in required_fields):
-                raise ValueError(f"Concept missing required fields: {concept_item}")
+        for concept_item in coerce_list(parsed_data):
+            if not isinstance(concept_item, dict):
+                continue
                 
-            if not all(isinstance(concept_item[field], str) for field in ["name", "description"]):
-                raise ValueError(f"Name and description must be strings: {concept_item}")
+            concept_name = first_present(concept_item, "name", "title")
+            concept_description = first_present(concept_item, "description", "summary")
+            index_entries = first_present(concept_item, "file_indices", "files", "file_index")
+            if concept_name is None or concept_description is None:
+                continue
                 
-            if not isinstance(concept_item["file_indices"], list):
-                raise ValueError(f"File indices must be a list: {concept_item}")
-                
-            processed_indices = []
-            for index_entry in concept_item["file_indices"]:
-                try:
-                    if isinstance(index_entry, int):
-                        file_index = index_entry
-                    elif isinstance(index_entry, str) and "#" in index_entry:
-                        file_index = int(index_entry.split("#")[0].strip())
-                    else:
-                        file_index = int(str(index_entry).strip())
-                        
-                    if not (0 <= file_index < file_count):
-                        raise ValueError(f"File index {file_index} out of range for concept {concept_item['name']}")
-                    processed_indices.append(file_index)
-                except (ValueError, TypeError):
-                    raise ValueError(f"Cannot parse index entry: {index_entry} in concept {concept_item['name']}")
-                    
-            concept_item["files"] = sorted(list(set(processed_indices)))
+            if not isinstance(index_entries, list):
+                index_entries = [] if index_entries is None else [index_entries]
+            processed_indices = {
+                file_index for file_index in (parse_index_reference(entry, file_count) for entry in index_entries)
+                if file_index is not None
+            }
+            
             validated_concepts.append({
-                "name": concept_item["name"],
-                "description": concept_item["description"],
-                "files": concept_item["files"],
+                "name": str(concept_name),
+                "description": str(concept_description),
+                "files": sorted(processed_indices),
             })
             
-        print(f"Successfully identified {len(validated_concepts)} core concepts.")
-        print(f"📚 Will generate {len(validated_concepts)} tutorial chapters")
+        if not validated_concepts:
+            raise StructuredOutputError("No concept in the response has both a name and a description")
         return validated_concepts
         
     def post(self, workspace_config, preparation_result, execution_result):
         workspace_config["identified_concepts"] = execution_result
 
 class RelationshipAnalyzer(Node):
+    checkpoint_keys = ("concept_relationships", "concept_dependency_edges")
+    
     def prep(self, workspace_config):
         concepts_data = workspace_config["identified_concepts"]
         file_collection = workspace_config["discovered_files"]
@@ -220,9 +652,23 @@ class RelationshipAnalyzer(Node):
             concept_descriptions.append(f"{index} # {concept['name']}")
             all_referenced_indices.update(concept["files"])
             
+        dependency_edges = []
+        if workspace_config.get("structure_mode", "llm") == "graph" and workspace_config.get("file_dependency_graph"):
+            dependency_edges = build_concept_dependency_edges(concepts_data, workspace_config["file_dependency_graph"])
+            print(f"Import graph yields {len(dependency_edges)} concept dependency edges.")
+            
+        if dependency_edges:
+            return (
+                analysis_context, "\n".join(concept_descriptions), concepts_count,
+                project_name, target_language, caching_enabled, dependency_edges, concepts_data
+            )
+            
         analysis_context += "\nRelevant Source Code (Indexed by File):\n"
+        symbol_index = workspace_config.get("symbol_index") if workspace_config.get("use_symbol_context", False) else None
         relevant_file_content = extract_file_content_by_indices(
-            file_collection, sorted(list(all_referenced_indices))
+            file_collection, sorted(list(all_referenced_indices)),
+            workspace_config.get("file_summaries"), workspace_config.get("file_context_budget_chars"),
+            symbol_index, extract_query_terms(*(concept["name"] + " " + concept["description"] for concept in concepts_data))
         )
         
         file_context_section = "\n\n".join(
@@ -233,12 +679,15 @@ class RelationshipAnalyzer(Node):
         
         return (
             analysis_context, "\n".join(concept_descriptions), concepts_count,
-            project_name, target_language, caching_enabled
+            project_name, target_language, caching_enabled, dependency_edges, concepts_data
         )
         
     def exec(self, preparation_result):
-        (context, concept_listing, concepts_count, project_name, language, use_cache) = preparation_result
+        (context, concept_listing, concepts_count, project_name, language, use_cache, dependency_edges, concepts_data) = preparation_result
         
+        if dependency_edges:
+            return self._label_dependency_edges(context, concepts_data, dependency_edges, project_name, language, use_cache)
+            
         print(f"Analyzing concept relationships using AI...")
         
         language_directive = ""
@@ -288,54 +737,145 @@ relationships:
 Provide the YAML response:
 """
 
-        ai_response = query_language_model(relationship_prompt, use_cache=(use_cache and self.cur_retry == 0))
+        relationship_result = query_structured_output(
+            relationship_prompt,
+            lambda parsed_data: self._normalize_relationships(parsed_data, concepts_count),
+            use_cache=(use_cache and self.cur_retry == 0)
+        )
         
-        yaml_content = ai_response.strip().split("```yaml")[1].split("```")[0].strip()
-        relationship_data = yaml.safe_load(yaml_content)
+        print("Successfully analyzed project structure and concept relationships.")
+        return relationship_result
         
-        required_keys = ["summary", "relationships"]
-        if not isinstance(relationship_data, dict) or not all(key in relationship_data for key in required_keys):
-            raise ValueError("AI response missing required keys ('summary', 'relationships')")
+    def _normalize_relationships(self, parsed_data, concepts_count):
+        if not isinstance(parsed_data, dict):
+            raise StructuredOutputError("Expected a mapping with 'summary' and 'relationships'")
             
-        if not isinstance(relationship_data["summary"], str):
-            raise ValueError("Summary field must be a string")
-        if not isinstance(relationship_data["relationships"], list):
-            raise ValueError("Relationships field must be a list")
+        project_summary = parsed_data.get("summary")
+        if not isinstance(project_summary, str) or not project_summary.strip():
+            raise StructuredOutputError("Response is missing the project 'summary'")
             
+        relationship_entries = parsed_data.get("relationships")
+        if not isinstance(relationship_entries, list):
+            raise StructuredOutputError("Response is missing the 'relationships' list")
+            
+        validated_relationships = self._parse_relationship_entries(relationship_entries, concepts_count)
+        if concepts_count > 1 and not validated_relationships:
+            raise StructuredOutputError("Response contains no relationships between valid concept indices")
+            
+        return {
+            "summary": project_summary,
+            "details": validated_relationships,
+        }
+        
+    def _parse_relationship_entries(self, relationship_entries, concepts_count):
         validated_relationships = []
-        for relationship in relationship_data["relationships"]:
-            required_rel_fields = ["from_abstraction", "to_abstraction", "label"]
-            if not isinstance(relationship, dict) or not all(field in relationship for field in required_rel_fields):
-                raise ValueError(f"Relationship missing required fields: {relationship}")
-                
-            if not isinstance(relationship["label"], str):
-                raise ValueError(f"Relationship label must be string: {relationship}")
-                
-            try:
-                from_index = int(str(relationship["from_abstraction"]).split("#")[0].strip())
-                to_index = int(str(relationship["to_abstraction"]).split("#")[0].strip())
-                
-                if not (0 <= from_index < concepts_count and 0 <= to_index < concepts_count):
-                    raise ValueError(f"Invalid relationship indices: from={from_index}, to={to_index}")
-                    
-                validated_relationships.append({
-                    "from": from_index,
-                    "to": to_index,
-                    "label": relationship["label"],
-                })
-            except (ValueError, TypeError):
-                raise ValueError(f"Cannot parse relationship indices: {relationship}")
+        for relationship in relationship_entries:
+            if not isinstance(relationship, dict):
+                continue
+            from_index = parse_index_reference(first_present(relationship, "from_abstraction", "from"), concepts_count)
+            to_index = parse_index_reference(first_present(relationship, "to_abstraction", "to"), concepts_count)
+            if from_index is None or to_index is None:
+                continue
                 
+            validated_relationships.append({
+                "from": from_index,
+                "to": to_index,
+                "label": str(relationship.get("label") or "Related to"),
+            })
+        return validated_relationships
+        
+    def _label_dependency_edges(self, concept_context, concepts_data, dependency_edges, project_name, language, use_cache):
+        labeled_edges = dependency_edges[:MAX_LABELED_DEPENDENCY_EDGES]
+        connected_concepts = {edge["from"] for edge in labeled_edges} | {edge["to"] for edge in labeled_edges}
+        unconnected_concepts = [
+            f"{index} # {concept['name'].strip()}" for index, concept in enumerate(concepts_data)
+            if index not in connected_concepts
+        ]
+        print(f"Labeling {len(labeled_edges)} import-graph relationships using AI...")
+        
+        language_directive = ""
+        language_hint = ""
+        if language.lower() != "english":
+            language_directive = f"IMPORTANT: Generate `summary` and `label` fields in **{language.capitalize()}** language exclusively.\n\n"
+            language_hint = f" (in {language.capitalize()})"
+            
+        unconnected_note = ""
+        if unconnected_concepts:
+            unconnected_note = (
+                "These concepts have no import edges; add at most one `additional_relationships` entry for each "
+                "if a real interaction exists:\n" + "\n".join(f"- {entry}" for entry in unconnected_concepts) + "\n\n"
+            )
+            
+        labeling_prompt = f"""
+For project `{project_name}`:
+
+{concept_context}
+The following dependencies between concepts were derived from the import graph (source concept imports from target concept):
+{describe_dependency_edges(concepts_data, labeled_edges)}
+
+{unconnected_note}{language_directive}Please provide:
+1. A beginner-friendly `summary` of the project's purpose{language_hint}. Use markdown **bold** and *italic* for key terms.
+2. For every edge, a `label` describing the interaction **in just a few words**{language_hint} (e.g., "Configures", "Stores data in").
+
+Format as YAML:
+
+```yaml
+summary: |
+  Clear, accessible project explanation{language_hint}.
+labels:
+  - edge: 0
+    label: "Uses"
+  - edge: 1
+    label: "Reads settings from"
+additional_relationships:
+  - from_abstraction: 3 # ConceptName
+    to_abstraction: 0 # ConceptName
+    label: "Feeds"
+```"""
+
+        relationship_result = query_structured_output(
+            labeling_prompt,
+            lambda parsed_data: self._normalize_edge_labels(parsed_data, labeled_edges, len(concepts_data)),
+            use_cache=(use_cache and self.cur_retry == 0)
+        )
         print("Successfully analyzed project structure and concept relationships.")
+        return relationship_result
+        
+    def _normalize_edge_labels(self, parsed_data, labeled_edges, concepts_count):
+        if not isinstance(parsed_data, dict):
+            raise StructuredOutputError("Expected a mapping with 'summary' and 'labels'")
+            
+        project_summary = parsed_data.get("summary")
+        if not isinstance(project_summary, str) or not project_summary.strip():
+            raise StructuredOutputError("Response is missing the project 'summary'")
+            
+        edge_labels = {}
+        for label_entry in parsed_data.get("labels") or []:
+            if isinstance(label_entry, dict) and label_entry.get("label"):
+                edge_number = parse_index_reference(label_entry.get("edge"), len(labeled_edges))
+                if edge_number is not None:
+                    edge_labels[edge_number] = str(label_entry["label"])
+                    
+        validated_relationships = [
+            {"from": edge["from"], "to": edge["to"], "label": edge_labels.get(edge_number, "Depends on")}
+            for edge_number, edge in enumerate(labeled_edges)
+        ]
+        additional_entries = parsed_data.get("additional_relationships")
+        if isinstance(additional_entries, list):
+            validated_relationships.extend(self._parse_relationship_entries(additional_entries, concepts_count))
+            
         return {
-            "summary": relationship_data["summary"],
+            "summary": project_summary,
             "details": validated_relationships,
         }
         
     def post(self, workspace_config, preparation_result, execution_result):
         workspace_config["concept_relationships"] = execution_result
+        workspace_config["concept_dependency_edges"] = preparation_result[6]
 
 class ChapterOrganizer(Node):
+    checkpoint_keys = ("chapter_sequence",)
+    
     def prep(self, workspace_config):
         concepts_data = workspace_config["identified_concepts"]
         relationships_data = workspace_config["concept_relationships"]
@@ -364,14 +904,22 @@ class ChapterOrganizer(Node):
         if target_language.lower() != "english":
             input_language_note = f" (Names might be in {target_language.capitalize()})"
             
+        proposed_order = None
+        dependency_edges = workspace_config.get("concept_dependency_edges")
+        if workspace_config.get("structure_mode", "llm") == "graph" and dependency_edges:
+            proposed_order = dependency_teaching_order(len(concepts_data), dependency_edges)
+            
         return (
             concept_listing, context_description, len(concepts_data),
-            project_name, input_language_note, caching_enabled
+            project_name, input_language_note, caching_enabled, proposed_order, concepts_data
         )
         
     def exec(self, preparation_result):
-        (concept_listing, context, concepts_count, project_name, language_note, use_cache) = preparation_result
+        (concept_listing, context, concepts_count, project_name, language_note, use_cache, proposed_order, concepts_data) = preparation_result
         
+        if proposed_order:
+            return self._confirm_teaching_order(proposed_order, concepts_data, project_name, language_note, use_cache)
+            
         print("Determining optimal chapter sequence using AI...")
         
         ordering_prompt = f"""
@@ -398,49 +946,130 @@ Return the ordered concept indices with names for clarity, using format `idx # C
 Provide the YAML sequence:
 """
 
-        ai_response = query_language_model(ordering_prompt, use_cache=(use_cache and self.cur_retry == 0))
+        processed_sequence = query_structured_output(
+            ordering_prompt,
+            lambda parsed_data: self._normalize_sequence(parsed_data, concepts_count),
+            use_cache=(use_cache and self.cur_retry == 0)
+        )
         
-        yaml_content = ai_response.strip().split("```yaml")[1].split("```")[0].strip()
-        ordered_sequence = yaml.safe_load(yaml_content)
+        print(f"Determined chapter sequence (indices): {processed_sequence}")
+        print(f"📖 Chapter generation order: {len(processed_sequence)} chapters total")
+        return processed_sequence
         
-        if not isinstance(ordered_sequence, list):
-            raise ValueError("AI response must be a list of ordered indices")
-            
-        processed_sequence = []
-        seen_indices = set()
+    def _confirm_teaching_order(self, proposed_order, concepts_data, project_name, language_note, use_cache):
+        print(f"Confirming import-graph chapter order {proposed_order} using AI...")
+        proposed_listing = "\n".join(f"- {index} # {concepts_data[index]['name'].strip()}" for index in proposed_order)
         
-        for sequence_entry in ordered_sequence:
-            try:
-                if isinstance(sequence_entry, int):
-                    concept_index = sequence_entry
-                elif isinstance(sequence_entry, str) and "#" in sequence_entry:
-                    concept_index = int(sequence_entry.split("#")[0].strip())
-                else:
-                    concept_index = int(str(sequence_entry).strip())
-                    
-                if not (0 <= concept_index < concepts_count):
-                    raise ValueError(f"Index {concept_index} out of valid range")
-                if concept_index in seen_indices:
-                    raise ValueError(f"Duplicate index {concept_index} in sequence")
-                    
+        confirmation_prompt = f"""
+For a tutorial about project `{project_name}`, the concepts below were ordered from the import graph so that each concept comes after the concepts it depends on{language_note}:
+
+```yaml
+{proposed_listing}
+```
+
+Keep this order unless a change clearly helps beginners (for example, introducing a user-facing entry point first). Return the complete final order in the same `idx # ConceptName` format:
+
+```yaml
+- 2 # FoundationalElement
+- 0 # CoreComponent
+```"""
+
+        processed_sequence = query_structured_output(
+            confirmation_prompt,
+            lambda parsed_data: self._normalize_sequence(parsed_data, len(concepts_data)),
+            use_cache=(use_cache and self.cur_retry == 0)
+        )
+        print(f"Determined chapter sequence (indices): {processed_sequence}")
+        print(f"📖 Chapter generation order: {len(processed_sequence)} chapters total")
+        return processed_sequence
+        
+    def _normalize_sequence(self, parsed_data, concepts_count):
+        processed_sequence = []
+        for sequence_entry in coerce_list(parsed_data):
+            concept_index = parse_index_reference(sequence_entry, concepts_count)
+            if concept_index is not None and concept_index not in processed_sequence:
                 processed_sequence.append(concept_index)
-                seen_indices.add(concept_index)
-                
-            except (ValueError, TypeError):
-                raise ValueError(f"Cannot parse sequence entry: {sequence_entry}")
                 
-        if len(processed_sequence) != concepts_count:
-            missing_indices = set(range(concepts_count)) - seen_indices
-            raise ValueError(f"Sequence length mismatch. Missing indices: {missing_indices}")
+        if not processed_sequence:
+            raise StructuredOutputError("Response contains no valid concept indices")
             
-        print(f"Determined chapter sequence (indices): {processed_sequence}")
-        print(f"📖 Chapter generation order: {len(processed_sequence)} chapters total")
+        missing_indices = [index for index in range(concepts_count) if index not in processed_sequence]
+        if missing_indices:
+            print(f"Appending concepts missing from the AI ordering: {missing_indices}")
+            processed_sequence.extend(missing_indices)
         return processed_sequence
         
     def post(self, workspace_config, preparation_result, execution_result):
         workspace_config["chapter_sequence"] = execution_result
 
+class RollingChapterContext:
+    def __init__(self, max_context_chars: int):
+        self.max_context_chars = max_context_chars
+        self.per_chapter_chars = max(500, max_context_chars // 4)
+        self.chapter_digests = []
+        
+    def add_chapter(self, chapter_content: str) -> None:
+        self.chapter_digests.append(self.summarize_chapter(chapter_content, self.per_chapter_chars))
+        
+    def render(self) -> str:
+        rendered_digests = []
+        remaining_chars = self.max_context_chars
+        
+        for digest in reversed(self.chapter_digests):
+            if len(digest) + 5 <= remaining_chars:
+                rendered_digests.append(digest)
+                remaining_chars -= len(digest) + 5
+                continue
+                
+            heading_line = digest.split("\n", 1)[0]
+            if len(heading_line) + 5 <= remaining_chars:
+                rendered_digests.append(heading_line)
+                remaining_chars -= len(heading_line) + 5
+            else:
+                rendered_digests.append("(Earlier chapters omitted for brevity.)")
+                break
+                
+        return "\n---\n".join(reversed(rendered_digests))
+        
+    @staticmethod
+    def summarize_chapter(chapter_content: str, max_chars: int) -> str:
+        digest_lines = []
+        inside_code_block = False
+        awaiting_paragraph = True
+        
+        for line in chapter_content.splitlines():
+            stripped_line = line.strip()
+            if stripped_line.startswith("```"):
+                inside_code_block = not inside_code_block
+                continue
+            if inside_code_block or not stripped_line:
+                continue
+                
+            if stripped_line.startswith("#"):
+                digest_lines.append(stripped_line)
+                awaiting_paragraph = True
+            elif awaiting_paragraph:
+                first_sentence = re.split(r"(?<=[.!?।])\s", stripped_line, maxsplit=1)[0]
+                digest_lines.append(first_sentence[:200])
+                awaiting_paragraph = False
+                
+        return "\n".join(digest_lines)[:max_chars]
+
 class ContentGenerator(BatchNode):
+    checkpoint_keys = ("generated_chapters",)
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.retry_state = threading.local()
+        
+    @property
+    def cur_retry(self):
+        return getattr(self.retry_state, "cur_retry", 0)
+        
+    @cur_retry.setter
+    def cur_retry(self, retry_number):
+        self.retry_state.cur_retry = retry_number
+        
     def prep(self, workspace_config):
         chapter_sequence = workspace_config["chapter_sequence"]
         concepts_data = workspace_config["identified_concepts"]
@@ -450,6 +1079,11 @@ class ContentGenerator(BatchNode):
         caching_enabled = workspace_config.get("enable_ai_caching", True)
         
         self.completed_chapters = []
+        self.chapter_workers = max(1, workspace_config.get("chapter_generation_workers", 1))
+        checkpoint_directory = workspace_config.get("checkpoint_directory")
+        self.checkpoint_store = WorkflowCheckpointStore(checkpoint_directory) if checkpoint_directory else None
+        previous_context_limit = workspace_config.get("previous_context_max_chars", 12000)
+        self.rolling_context = RollingChapterContext(previous_context_limit) if previous_context_limit else None
         
         all_chapter_entries = []
         chapter_metadata = {}
@@ -458,8 +1092,7 @@ class ContentGenerator(BatchNode):
             if 0 <= concept_index < len(concepts_data):
                 chapter_number = position + 1
                 concept_name = concepts_data[concept_index]["name"]
-                sanitized_filename = "".join(c if c.isalnum() else "_" for c in concept_name).lower()
-                chapter_filename = f"{chapter_number:02d}_{sanitized_filename}.md"
+                chapter_filename = chapter_output_filename(chapter_number, concept_name)
                 
                 all_chapter_entries.append(f"{chapter_number}. [{concept_name}]({chapter_filename})")
                 chapter_metadata[concept_index] = {
@@ -470,43 +1103,149 @@ class ContentGenerator(BatchNode):
                 
         complete_chapter_index = "\n".join(all_chapter_entries)
         
-        processing_items = []
+        previous_generated_chapters = workspace_config.get("previous_generated_chapters")
+        chapters_to_regenerate = workspace_config.get("chapters_to_regenerate")
+        
+        speculative_drafts = workspace_config.get("speculative_chapter_drafts") or {}
+        drafted_concepts = {
+            int(concept_key) for concept_key, draft in speculative_drafts.items()
+            if draft and int(concept_key) < len(concepts_data) and draft["concept_name"] == concepts_data[int(concept_key)]["name"]
+        }
+        
+        chapter_plans = []
         for position, concept_index in enumerate(chapter_sequence):
-            if 0 <= concept_index < len(concepts_data):
-                concept_details = concepts_data[concept_index]
-                related_file_indices = concept_details.get("files", [])
-                related_file_content = extract_file_content_by_indices(file_collection, related_file_indices)
-                
-                previous_chapter_info = None
-                if position > 0:
-                    prev_index = chapter_sequence[position - 1]
-                    previous_chapter_info = chapter_metadata[prev_index]
-                    
-                next_chapter_info = None
-                if position < len(chapter_sequence) - 1:
-                    next_index = chapter_sequence[position + 1]
-                    next_chapter_info = chapter_metadata[next_index]
-                    
-                processing_items.append({
-                    "chapter_number": position + 1,
-                    "concept_index": concept_index,
-                    "concept_details": concept_details,
-                    "related_file_content": related_file_content,
-                    "project_name": project_name,
-                    "complete_chapter_index": complete_chapter_index,
-                    "chapter_metadata": chapter_metadata,
-                    "previous_chapter_info": previous_chapter_info,
-                    "next_chapter_info": next_chapter_info,
-                    "target_language": target_language,
-                    "caching_enabled": caching_enabled,
-                })
-            else:
+            if not 0 <= concept_index < len(concepts_data):
                 print(f"Warning: Invalid concept index {concept_index} in sequence. Skipping.")
+                continue
+            concept_details = concepts_data[concept_index]
+            chapter_checkpoint_key = WorkflowCheckpointStore.chapter_key(position + 1, concept_details, target_language, complete_chapter_index)
+            reused_chapter_content = (
+                previous_generated_chapters[position]
+                if chapters_to_regenerate is not None and position not in chapters_to_regenerate
+                and position < len(previous_generated_chapters or [])
+                else None
+            )
+            checkpointed_chapter_content = (
+                self.checkpoint_store.load_chapter(position + 1, chapter_checkpoint_key)
+                if self.checkpoint_store and reused_chapter_content is None else None
+            )
+            needs_generation = (
+                reused_chapter_content is None and checkpointed_chapter_content is None and concept_index not in drafted_concepts
+            )
+            chapter_plans.append((position, concept_index, chapter_checkpoint_key, reused_chapter_content, checkpointed_chapter_content, needs_generation))
+            
+        chapters_needing_generation = sum(1 for *_, needs_generation in chapter_plans if needs_generation)
+        lexical_index = build_chapter_lexical_index(workspace_config) if chapters_needing_generation else None
+        
+        tutorial_outline = None
+        if self.chapter_workers > 1 and chapters_needing_generation:
+            tutorial_outline = self._build_tutorial_outline(
+                chapter_sequence, concepts_data, chapter_metadata, project_name, target_language, caching_enabled
+            )
+            
+        processing_items = []
+        for position, concept_index, chapter_checkpoint_key, reused_chapter_content, checkpointed_chapter_content, needs_generation in chapter_plans:
+            concept_details = concepts_data[concept_index]
+            speculative_draft = speculative_drafts[str(concept_index)]["content"] if concept_index in drafted_concepts else None
+            related_file_content = select_chapter_source_context(workspace_config, concept_details, lexical_index) if needs_generation else {}
+            
+            previous_chapter_info = None
+            if position > 0:
+                prev_index = chapter_sequence[position - 1]
+                previous_chapter_info = chapter_metadata[prev_index]
                 
+            next_chapter_info = None
+            if position < len(chapter_sequence) - 1:
+                next_index = chapter_sequence[position + 1]
+                next_chapter_info = chapter_metadata[next_index]
+                
+            processing_items.append({
+                "chapter_number": position + 1,
+                "concept_index": concept_index,
+                "concept_details": concept_details,
+                "related_file_content": related_file_content,
+                "project_name": project_name,
+                "complete_chapter_index": complete_chapter_index,
+                "chapter_metadata": chapter_metadata,
+                "previous_chapter_info": previous_chapter_info,
+                "next_chapter_info": next_chapter_info,
+                "target_language": target_language,
+                "caching_enabled": caching_enabled,
+                "tutorial_outline": tutorial_outline,
+                "chapter_checkpoint_key": chapter_checkpoint_key,
+                "reused_chapter_content": reused_chapter_content,
+                "checkpointed_chapter_content": checkpointed_chapter_content,
+                "speculative_draft": speculative_draft,
+            })
+            
         print(f"Preparing to generate {len(processing_items)} tutorial chapters...")
         print(f"📝 Starting batch chapter generation for {len(processing_items)} chapters...")
         return processing_items
         
+    def _build_tutorial_outline(self, chapter_sequence, concepts_data, chapter_metadata, project_name, target_language, caching_enabled):
+        outline_entries = []
+        for concept_index in chapter_sequence:
+            if concept_index not in chapter_metadata:
+                continue
+            chapter_info = chapter_metadata[concept_index]
+            description_preview = " ".join(concepts_data[concept_index]["description"].split())[:300]
+            outline_entries.append(f"{chapter_info['num']}. {chapter_info['name'].strip()}: {description_preview}")
+            
+        language_note = ""
+        if target_language.lower() != "english":
+            language_note = f" Write the outlines in {target_language.capitalize()}."
+            
+        outline_prompt = f"""
+The tutorial for project `{project_name}` has these chapters, which will be written independently and in parallel:
+
+{chr(10).join(outline_entries)}
+
+To keep the chapters consistent, write a short outline for every chapter: 2-4 bullet points covering what it teaches, the key terms it introduces, and which earlier chapters it builds on.{language_note}
+
+Format as YAML:
+
+```yaml
+- chapter: 1
+  outline: |
+    - Introduces ...
+    - Key terms: ...
+- chapter: 2
+  outline: |
+    - Builds on chapter 1 ...
+```"""
+
+        try:
+            ai_response = query_language_model(outline_prompt, use_cache=caching_enabled)
+            outline_by_chapter = parse_structured_response(ai_response, lambda parsed_data: {
+                parse_index_reference(entry["chapter"], len(chapter_sequence) + 1): str(entry["outline"]).strip()
+                for entry in coerce_list(parsed_data)
+                if isinstance(entry, dict) and "chapter" in entry and "outline" in entry
+            })
+        except Exception as outline_error:
+            print(f"Warning: Could not generate tutorial outline, using concept descriptions instead - {outline_error}")
+            outline_by_chapter = {}
+            
+        outline_sections = []
+        for concept_index in chapter_sequence:
+            if concept_index not in chapter_metadata:
+                continue
+            chapter_info = chapter_metadata[concept_index]
+            chapter_outline = outline_by_chapter.get(chapter_info["num"])
+            if not chapter_outline:
+                chapter_outline = "- " + " ".join(concepts_data[concept_index]["description"].split())[:300]
+            outline_sections.append(f"Chapter {chapter_info['num']}: [{chapter_info['name'].strip()}]({chapter_info['filename']})\n{chapter_outline}")
+            
+        return "\n\n".join(outline_sections)
+        
+    def _exec(self, items):
+        if self.chapter_workers <= 1 or not items:
+            return super()._exec(items)
+            
+        print(f"Generating {len(items)} chapters with {self.chapter_workers} parallel workers...")
+        with ThreadPoolExecutor(max_workers=self.chapter_workers) as chapter_pool:
+            return list(chapter_pool.map(attribute_to_current_stage(lambda item: Node._exec(self, item)), items))
+            
+            
     def exec(self, chapter_item):
         concept_name = chapter_item["concept_details"]["name"]
         concept_description = chapter_item["concept_details"]["description"]
@@ -514,17 +1253,46 @@ class ContentGenerator(BatchNode):
         project_name = chapter_item.get("project_name")
         target_language = chapter_item.get("target_language", "english")
         caching_enabled = chapter_item.get("caching_enabled", True)
+        drafting = chapter_item.get("drafting", False)
         
-        print(f"Generating chapter {chapter_number} for concept: {concept_name} using AI...")
-        print(f"⏳ Progress: Chapter {chapter_number} of {len(self.completed_chapters) + len(chapter_item['chapter_metadata'])} chapters")
-        
+        if chapter_item.get("reused_chapter_content") is not None:
+            print(f"Reusing unchanged chapter {chapter_number}: {concept_name}")
+            self._record_completed_chapter(chapter_item, chapter_item["reused_chapter_content"])
+            return chapter_item["reused_chapter_content"]
+            
+        if chapter_item.get("checkpointed_chapter_content") is not None:
+            print(f"Reusing checkpointed chapter {chapter_number}: {concept_name}")
+            self._record_completed_chapter(chapter_item, chapter_item["checkpointed_chapter_content"])
+            return chapter_item["checkpointed_chapter_content"]
+            
+        if chapter_item.get("speculative_draft") is not None:
+            print(f"Finalizing speculative draft for chapter {chapter_number}: {concept_name}")
+            return self._complete_chapter(chapter_item, self._finalize_speculative_draft(chapter_item))
+            
+        if drafting:
+            print(f"Drafting chapter for concept: {concept_name} using AI...")
+        else:
+            print(f"Generating chapter {chapter_number} for concept: {concept_name} using AI...")
+            print(f"⏳ Progress: Chapter {chapter_number} of {len(self.completed_chapters) + len(chapter_item['chapter_metadata'])} chapters")
+            
         file_context_section = "\n\n".join(
             f"--- File: {index_path.split('# ')[1] if '# ' in index_path else index_path} ---\n{content}"
             for index_path, content in chapter_item["related_file_content"].items()
         )
         
-        previous_chapters_context = "\n---\n".join(self.completed_chapters)
-        
+        if drafting:
+            previous_context_title = "Previous Chapters Context"
+            previous_chapters_context = "The chapter order is not known yet, so this chapter must stand on its own."
+        elif chapter_item.get("tutorial_outline"):
+            previous_context_title = "Outline of All Chapters"
+            previous_chapters_context = chapter_item["tutorial_outline"]
+        elif self.rolling_context:
+            previous_context_title = "Summary of Previous Chapters"
+            previous_chapters_context = self.rolling_context.render()
+        else:
+            previous_context_title = "Previous Chapters Context"
+            previous_chapters_context = "\n---\n".join(self.completed_chapters)
+            
         language_directive = ""
         concept_language_note = ""
         structure_language_note = ""
@@ -547,8 +1315,19 @@ class ContentGenerator(BatchNode):
             link_language_note = f" (Use the {lang_cap} chapter title from structure above)"
             tone_language_note = f" (appropriate for {lang_cap} readers)"
             
+        if drafting:
+            chapter_position_note = "This chapter is drafted before the chapter order is known."
+            chapter_heading_example = f"# {concept_name}"
+            opening_guideline = "- Do not mention chapter numbers or refer to a previous chapter; navigation between chapters is added once the order is known."
+            closing_guideline = f"- End chapter with brief conclusion summarizing what was learned{instruction_language_note}. Do not link to or announce a next chapter."
+        else:
+            chapter_position_note = f"This is Chapter {chapter_number}."
+            chapter_heading_example = f"# Chapter {chapter_number}: {concept_name}"
+            opening_guideline = f"- If not the first chapter, start with smooth transition from previous chapter{instruction_language_note}, referencing it with proper Markdown link using its name{link_language_note}."
+            closing_guideline = f"- End chapter with brief conclusion summarizing what was learned{instruction_language_note} and providing transition to next chapter{instruction_language_note}. If there is a next chapter, use proper Markdown link: [Next Chapter Title](next_chapter_filename){link_language_note}."
+            
         chapter_generation_prompt = f"""
-{language_directive}Create a comprehensive, beginner-friendly tutorial chapter (in Markdown format) for project `{project_name}` about the concept: "{concept_name}". This is Chapter {chapter_number}.
+{language_directive}Create a comprehensive, beginner-friendly tutorial chapter (in Markdown format) for project `{project_name}` about the concept: "{concept_name}". {chapter_position_note}
 
 Concept Information{concept_language_note}:
 - Name: {concept_name}
@@ -558,16 +1337,16 @@ Concept Information{concept_language_note}:
 Full Tutorial Structure{structure_language_note}:
 {chapter_item["complete_chapter_index"]}
 
-Previous Chapters Context{previous_context_note}:
+{previous_context_title}{previous_context_note}:
 {previous_chapters_context if previous_chapters_context else "This is the first chapter."}
 
 Relevant Source Code (Code syntax unchanged):
 {file_context_section if file_context_section else "No specific code examples provided for this concept."}
 
 Chapter Generation Guidelines (Generate all content in {target_language.capitalize()} unless specified otherwise):
-- Begin with clear heading (e.g., `# Chapter {chapter_number}: {concept_name}`). Use the provided concept name.
+- Begin with clear heading (e.g., `{chapter_heading_example}`). Use the provided concept name.
 
-- If not the first chapter, start with smooth transition from previous chapter{instruction_language_note}, referencing it with proper Markdown link using its name{link_language_note}.
+{opening_guideline}
 
 - Start with high-level motivation explaining what problem this concept solves{instruction_language_note}. Begin with a concrete use case example. Guide the reader to understand how to solve this use case. Keep it minimal and beginner-friendly.
 
@@ -587,7 +1366,7 @@ Chapter Generation Guidelines (Generate all content in {target_language.capitali
 
 - Extensively use analogies and examples throughout{instruction_language_note} to help beginners understand.
 
-- End chapter with brief conclusion summarizing what was learned{instruction_language_note} and providing transition to next chapter{instruction_language_note}. If there is a next chapter, use proper Markdown link: [Next Chapter Title](next_chapter_filename){link_language_note}.
+{closing_guideline}
 
 - Ensure tone is welcoming and accessible for newcomers{tone_language_note}.
 
@@ -597,30 +1376,113 @@ Provide the comprehensive, beginner-friendly Markdown output (DON'T include ```m
 """
 
         chapter_content = query_language_model(chapter_generation_prompt, use_cache=(caching_enabled and self.cur_retry == 0))
+        if drafting:
+            return chapter_content.strip()
+        return self._complete_chapter(chapter_item, normalize_chapter_heading(chapter_content, chapter_number, concept_name))
         
-        expected_heading = f"# Chapter {chapter_number}: {concept_name}"
-        if not chapter_content.strip().startswith(f"# Chapter {chapter_number}"):
-            content_lines = chapter_content.strip().split("\n")
-            if content_lines and content_lines[0].strip().startswith("#"):
-                content_lines[0] = expected_heading
-                chapter_content = "\n".join(content_lines)
-            else:
-                chapter_content = f"{expected_heading}\n\n{chapter_content}"
-                
-        self.completed_chapters.append(chapter_content)
+    def _finalize_speculative_draft(self, chapter_item):
+        chapter_metadata = chapter_item["chapter_metadata"]
+        
+        def resolve_placeholder_link(link_match):
+            linked_chapter = chapter_metadata.get(int(link_match.group(2)))
+            if not linked_chapter:
+                return link_match.group(1)
+            return f"[{link_match.group(1)}]({linked_chapter['filename']})"
+            
+        chapter_content = SPECULATIVE_LINK_PATTERN.sub(resolve_placeholder_link, chapter_item["speculative_draft"])
+        chapter_content = normalize_chapter_heading(
+            chapter_content, chapter_item["chapter_number"], chapter_item["concept_details"]["name"]
+        )
+        
+        heading_line, _, chapter_body = chapter_content.partition("\n")
+        finalized_lines = [heading_line, ""]
+        previous_chapter_info = chapter_item.get("previous_chapter_info")
+        if previous_chapter_info:
+            finalized_lines += [
+                f"*Previously: [Chapter {previous_chapter_info['num']}: {previous_chapter_info['name'].strip()}]({previous_chapter_info['filename']})*", ""
+            ]
+        finalized_lines.append(chapter_body.strip())
+        
+        next_chapter_info = chapter_item.get("next_chapter_info")
+        if next_chapter_info:
+            finalized_lines += [
+                "", f"Next: [Chapter {next_chapter_info['num']}: {next_chapter_info['name'].strip()}]({next_chapter_info['filename']})"
+            ]
+        return "\n".join(finalized_lines)
+        
+    def _complete_chapter(self, chapter_item, chapter_content):
+        if self.checkpoint_store:
+            self.checkpoint_store.save_chapter(chapter_item["chapter_number"], chapter_item["chapter_checkpoint_key"], chapter_content)
+        self._record_completed_chapter(chapter_item, chapter_content)
         return chapter_content
         
+    def _record_completed_chapter(self, chapter_item, chapter_content):
+        self.completed_chapters.append(chapter_content)
+        if self.rolling_context and not chapter_item.get("tutorial_outline"):
+            self.rolling_context.add_chapter(chapter_content)
+            
     def post(self, workspace_config, preparation_result, execution_result_list):
         workspace_config["generated_chapters"] = execution_result_list
         del self.completed_chapters
+        del self.rolling_context
         print(f"Successfully generated {len(execution_result_list)} tutorial chapters.")
         print(f"✅ Chapter generation complete: {len(execution_result_list)} chapters ready for assembly")
 
+class SpeculativeChapterDrafter(ContentGenerator):
+    checkpoint_keys = ("speculative_chapter_drafts",)
+    
+    def prep(self, workspace_config):
+        self.completed_chapters = []
+        self.rolling_context = None
+        self.checkpoint_store = None
+        self.chapter_workers = max(1, workspace_config.get("chapter_generation_workers", 1))
+        if not workspace_config.get("speculative_chapter_generation", False):
+            return []
+            
+        concepts_data = workspace_config["identified_concepts"]
+        placeholder_structure = "\n".join(
+            f"- [{concept['name'].strip()}]({speculative_chapter_filename(concept_index)})"
+            for concept_index, concept in enumerate(concepts_data)
+        )
+        lexical_index = build_chapter_lexical_index(workspace_config)
+        
+        drafting_items = []
+        for concept_index, concept_details in enumerate(concepts_data):
+            drafting_items.append({
+                "drafting": True,
+                "chapter_number": concept_index + 1,
+                "concept_index": concept_index,
+                "concept_details": concept_details,
+                "related_file_content": select_chapter_source_context(workspace_config, concept_details, lexical_index),
+                "project_name": workspace_config["project_identifier"],
+                "complete_chapter_index": placeholder_structure,
+                "chapter_metadata": {},
+                "target_language": workspace_config.get("target_language", "english"),
+                "caching_enabled": workspace_config.get("enable_ai_caching", True),
+            })
+            
+        print(f"📝 Drafting {len(drafting_items)} chapters while the chapter order is determined...")
+        return drafting_items
+        
+    def exec_fallback(self, chapter_item, exc):
+        print(f"Warning: Could not draft chapter for {chapter_item['concept_details']['name']}, it will be generated after ordering - {exc}")
+        return None
+        
+    def post(self, workspace_config, preparation_result, execution_result_list):
+        workspace_config["speculative_chapter_drafts"] = {
+            str(chapter_item["concept_index"]): {"concept_name": chapter_item["concept_details"]["name"], "content": draft_content}
+            for chapter_item, draft_content in zip(preparation_result, execution_result_list)
+            if draft_content
+        }
+        if preparation_result:
+            print(f"Drafted {len(workspace_config['speculative_chapter_drafts'])} of {len(preparation_result)} chapters ahead of ordering.")
+
 class DocumentationAssembler(Node):
+    checkpoint_keys = ("final_documentation_path",)
+    
     def prep(self, workspace_config):
         project_name = workspace_config["project_identifier"]
-        output_directory = workspace_config.get("documentation_output_path", "output")
-        final_output_path = os.path.join(output_directory, project_name)
+        final_output_path = documentation_output_directory(workspace_config)
         repository_url = workspace_config.get("source_repository")
         
         relationships_data = workspace_config["concept_relationships"]
@@ -662,8 +1524,7 @@ class DocumentationAssembler(Node):
         for position, concept_index in enumerate(chapter_sequence):
             if 0 <= concept_index < len(concepts_data) and position < len(chapter_contents):
                 concept_name = concepts_data[concept_index]["name"]
-                sanitized_name = "".join(c if c.isalnum() else "_" for c in concept_name).lower()
-                chapter_filename = f"{position+1:02d}_{sanitized_name}.md"
+                chapter_filename = chapter_output_filename(position + 1, concept_name)
                 index_content += f"{position+1}. [{concept_name}]({chapter_filename})\n"
                 
                 chapter_content = chapter_contents[position]
@@ -677,10 +1538,20 @@ class DocumentationAssembler(Node):
                 
         index_content += f"\n\n---\n\nGenerated by [AI Codebase Knowledge Builder](https://github.com/The-Pocket/Tutorial-Codebase-Knowledge)"
         
+        documentation_manifest = {
+            "settings_fingerprint": WorkflowCheckpointStore.compute_fingerprint(workspace_config),
+            "file_fingerprints": build_file_fingerprints(workspace_config["discovered_files"]),
+            "identified_concepts": concepts_data,
+            "concept_relationships": relationships_data,
+            "chapter_sequence": chapter_sequence,
+            "generated_chapters": chapter_contents,
+        }
+        
         return {
             "final_output_path": final_output_path,
             "index_content": index_content,
             "chapter_files": chapter_file_list,
+            "documentation_manifest": documentation_manifest,
         }
         
     def exec(self, preparation_result):
@@ -691,19 +1562,227 @@ class DocumentationAssembler(Node):
         print(f"Assembling final documentation in directory: {output_path}")
         os.makedirs(output_path, exist_ok=True)
         
-        index_file_path = os.path.join(output_path, "index.md")
-        with open(index_file_path, "w", encoding="utf-8") as index_file:
-            index_file.write(index_content)
-        print(f"  - Created {index_file_path}")
+        output_files = [{"filename": "index.md", "content": index_content}] + chapter_files
+        unchanged_count = 0
         
-        for chapter_info in chapter_files:
-            chapter_file_path = os.path.join(output_path, chapter_info["filename"])
-            with open(chapter_file_path, "w", encoding="utf-8") as chapter_file:
-                chapter_file.write(chapter_info["content"])
-            print(f"  - Created {chapter_file_path}")
+        for file_info in output_files:
+            output_file_path = os.path.join(output_path, file_info["filename"])
+            if os.path.exists(output_file_path):
+                with open(output_file_path, "r", encoding="utf-8") as existing_file:
+                    if existing_file.read() == file_info["content"]:
+                        unchanged_count += 1
+                        continue
+            with open(output_file_path, "w", encoding="utf-8") as output_file:
+                output_file.write(file_info["content"])
+            record_transfer(bytes_out=len(file_info["content"].encode("utf-8")))
+            print(f"  - Created {output_file_path}")
+            
+        if unchanged_count:
+            print(f"  - Left {unchanged_count} unchanged files in place")
+            
+        manifest_path = os.path.join(output_path, DOCUMENTATION_MANIFEST_NAME)
+        with open(manifest_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(preparation_result["documentation_manifest"], manifest_file, ensure_ascii=False)
             
         return output_path
         
     def post(self, workspace_config, preparation_result, execution_result):
         workspace_config["final_documentation_path"] = execution_result
         print(f"\nDocumentation generation completed! Files available at: {execution_result}")
+
+class LanguageFanoutGenerator(BatchNode):
+    checkpoint_keys = ("language_documentation_paths",)
+    
+    def prep(self, workspace_config):
+        additional_languages = (workspace_config.get("target_languages") or [])[1:]
+        self.fanout_mode = workspace_config.get("language_fanout_mode", "generate")
+        if not additional_languages:
+            return []
+            
+        print(f"🌍 Producing {len(additional_languages)} additional languages ({', '.join(additional_languages)}) in {self.fanout_mode} mode...")
+        return [self._build_language_workspace(workspace_config, language) for language in additional_languages]
+        
+    def _build_language_workspace(self, workspace_config, language):
+        workspace_config.setdefault("lexical_index_cache", {})
+        language_workspace = dict(workspace_config)
+        language_workspace.update({
+            "target_language": language,
+            "primary_identified_concepts": workspace_config["identified_concepts"],
+            "primary_generated_chapters": workspace_config.get("generated_chapters") or [],
+            "speculative_chapter_drafts": {},
+            "previous_generated_chapters": None,
+            "chapters_to_regenerate": None,
+            "generated_chapters": [],
+            "final_documentation_path": None,
+            "structure_localized": False,
+        })
+        if workspace_config.get("chapters_to_regenerate") is None:
+            return language_workspace
+            
+        manifest_path = os.path.join(documentation_output_directory(language_workspace), DOCUMENTATION_MANIFEST_NAME)
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+                previous_manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            return language_workspace
+            
+        chapter_sequence = workspace_config["chapter_sequence"]
+        if previous_manifest.get("chapter_sequence") == chapter_sequence and len(previous_manifest.get("generated_chapters", [])) == len(chapter_sequence):
+            language_workspace.update({
+                "identified_concepts": previous_manifest["identified_concepts"],
+                "concept_relationships": previous_manifest["concept_relationships"],
+                "previous_generated_chapters": previous_manifest["generated_chapters"],
+                "chapters_to_regenerate": workspace_config["chapters_to_regenerate"],
+                "structure_localized": True,
+            })
+        return language_workspace
+        
+    def _exec(self, items):
+        if len(items) <= 1:
+            return super()._exec(items)
+            
+        with ThreadPoolExecutor(max_workers=len(items)) as language_pool:
+            return list(language_pool.map(attribute_to_current_stage(lambda item: Node._exec(self, item)), items))
+            
+    def exec(self, language_workspace):
+        target_language = language_workspace["target_language"]
+        if not language_workspace["structure_localized"]:
+            self._localize_structure(language_workspace)
+            
+        if self.fanout_mode == "translate":
+            self._translate_chapters(language_workspace)
+        else:
+            ContentGenerator(max_retries=5, wait=20)._run(language_workspace)
+            
+        DocumentationAssembler()._run(language_workspace)
+        print(f"✅ {target_language.capitalize()} documentation ready: {language_workspace['final_documentation_path']}")
+        return language_workspace["final_documentation_path"]
+        
+    def _localize_structure(self, language_workspace):
+        target_language = language_workspace["target_language"]
+        concepts_data = language_workspace["identified_concepts"]
+        relationships_data = language_workspace["concept_relationships"]
+        
+        source_structure = {
+            "summary": relationships_data["summary"],
+            "concepts": [
+                {"index": concept_index, "name": concept["name"].strip(), "description": concept["description"].strip()}
+                for concept_index, concept in enumerate(concepts_data)
+            ],
+            "labels": [
+                {"index": relationship_index, "label": relationship["label"]}
+                for relationship_index, relationship in enumerate(relationships_data["details"])
+            ],
+        }
+        localization_prompt = f"""
+Translate the tutorial structure below for project `{language_workspace["project_identifier"]}` into {target_language.capitalize()}. Translate only the values of `summary`, `name`, `description` and `label`; keep every `index`, the YAML keys and any code identifiers unchanged.
+
+```yaml
+{yaml.safe_dump(source_structure, allow_unicode=True, sort_keys=False, width=1000)}```
+
+Return the translated structure in the same YAML format inside a ```yaml fenced block."""
+
+        try:
+            localized_summary, localized_concepts, localized_labels = query_structured_output(
+                localization_prompt,
+                lambda parsed_data: self._normalize_localized_structure(parsed_data, len(concepts_data), len(relationships_data["details"])),
+                use_cache=language_workspace.get("enable_ai_caching", True)
+            )
+        except Exception as localization_error:
+            print(f"Warning: Could not translate concept names into {target_language.capitalize()}, keeping the original names - {localization_error}")
+            return
+            
+        language_workspace["identified_concepts"] = [
+            {**concept, **localized_concepts.get(concept_index, {})} for concept_index, concept in enumerate(concepts_data)
+        ]
+        language_workspace["concept_relationships"] = {
+            **relationships_data,
+            "summary": localized_summary or relationships_data["summary"],
+            "details": [
+                {**relationship, "label": localized_labels.get(relationship_index, relationship["label"])}
+                for relationship_index, relationship in enumerate(relationships_data["details"])
+            ],
+        }
+        
+    def _normalize_localized_structure(self, parsed_data, concept_count, label_count):
+        if not isinstance(parsed_data, dict) or not isinstance(parsed_data.get("concepts"), list):
+            raise StructuredOutputError("Expected a mapping with a `concepts` list")
+            
+        localized_concepts = {}
+        for entry in parsed_data["concepts"]:
+            concept_index = parse_index_reference(entry.get("index"), concept_count) if isinstance(entry, dict) else None
+            if concept_index is not None and entry.get("name"):
+                localized_concepts[concept_index] = {"name": str(entry["name"]).strip()}
+                if entry.get("description"):
+                    localized_concepts[concept_index]["description"] = str(entry["description"]).strip()
+        if len(localized_concepts) != concept_count:
+            raise StructuredOutputError(f"Expected {concept_count} translated concepts, got {len(localized_concepts)}")
+            
+        localized_labels = {}
+        for entry in parsed_data.get("labels") or []:
+            label_index = parse_index_reference(entry.get("index"), label_count) if isinstance(entry, dict) else None
+            if label_index is not None and entry.get("label"):
+                localized_labels[label_index] = str(entry["label"]).strip()
+                
+        return str(parsed_data.get("summary") or "").strip(), localized_concepts, localized_labels
+        
+    def _translate_chapters(self, language_workspace):
+        target_language = language_workspace["target_language"]
+        caching_enabled = language_workspace.get("enable_ai_caching", True)
+        chapter_sequence = language_workspace["chapter_sequence"]
+        primary_concepts = language_workspace["primary_identified_concepts"]
+        localized_concepts = language_workspace["identified_concepts"]
+        primary_chapters = language_workspace["primary_generated_chapters"]
+        previous_chapters = language_workspace.get("previous_generated_chapters") or []
+        chapters_to_regenerate = language_workspace.get("chapters_to_regenerate")
+        
+        filename_mapping = {}
+        localized_index_entries = []
+        for position, concept_index in enumerate(chapter_sequence):
+            localized_filename = chapter_output_filename(position + 1, localized_concepts[concept_index]["name"])
+            filename_mapping[chapter_output_filename(position + 1, primary_concepts[concept_index]["name"])] = localized_filename
+            localized_index_entries.append(f"{position + 1}. [{localized_concepts[concept_index]['name'].strip()}]({localized_filename})")
+            
+        def translate_chapter(position):
+            concept_index = chapter_sequence[position]
+            if chapters_to_regenerate is not None and position not in chapters_to_regenerate and position < len(previous_chapters):
+                print(f"Reusing unchanged {target_language.capitalize()} chapter {position + 1}")
+                return previous_chapters[position]
+                
+            source_chapter = primary_chapters[position]
+            for primary_filename, localized_filename in filename_mapping.items():
+                source_chapter = source_chapter.replace(f"]({primary_filename})", f"]({localized_filename})")
+                
+            translation_prompt = f"""
+Translate the following tutorial chapter for project `{language_workspace["project_identifier"]}` into {target_language.capitalize()}.
+
+- Keep the Markdown structure, heading levels, mermaid diagrams and code blocks intact. Translate code comments and diagram labels where appropriate, but never code syntax.
+- Keep every link target (the part in parentheses) exactly as written; translate only the link text.
+- When referring to other chapters, use these chapter titles:
+{chr(10).join(localized_index_entries)}
+- Output *only* the translated Markdown (DON'T include ```markdown``` tags).
+
+Chapter to translate:
+
+{source_chapter}
+"""
+            print(f"Translating chapter {position + 1} into {target_language.capitalize()}...")
+            for attempt in range(CHAPTER_TRANSLATION_ATTEMPTS):
+                try:
+                    translated_chapter = query_language_model(translation_prompt, use_cache=(caching_enabled and attempt == 0))
+                    break
+                except Exception as translation_error:
+                    if attempt == CHAPTER_TRANSLATION_ATTEMPTS - 1:
+                        raise translation_error
+                    print(f"Retrying translation of chapter {position + 1} after error: {translation_error}")
+            return normalize_chapter_heading(translated_chapter, position + 1, localized_concepts[concept_index]["name"])
+            
+        translation_workers = max(1, language_workspace.get("chapter_generation_workers", 1))
+        with ThreadPoolExecutor(max_workers=translation_workers) as translation_pool:
+            language_workspace["generated_chapters"] = list(translation_pool.map(attribute_to_current_stage(translate_chapter), range(len(primary_chapters))))
+            
+    def post(self, workspace_config, preparation_result, execution_result_list):
+        workspace_config["language_documentation_paths"] = {
+            language_workspace["target_language"]: documentation_path
+            for language_workspace, documentation_path in zip(preparation_result, execution_result_list)
+        }
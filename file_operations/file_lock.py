@@ -0,0 +1,82 @@
+import os
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Union
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+class InterProcessFileLock:
+    def __init__(self, lock_file_path: Union[str, Path], shared: bool = False, blocking: bool = True, poll_interval: float = 0.1):
+        self.lock_file_path = Path(lock_file_path)
+        self.shared = shared
+        self.blocking = blocking
+        self.poll_interval = poll_interval
+        self.lock_handle = None
+        
+    def acquire(self) -> bool:
+        self.lock_file_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_handle = open(self.lock_file_path, "a+")
+        
+        while True:
+            try:
+                self._lock_handle(lock_handle)
+                self.lock_handle = lock_handle
+                return True
+            except OSError:
+                if not self.blocking:
+                    lock_handle.close()
+                    return False
+                time.sleep(self.poll_interval)
+                
+    def release(self) -> None:
+        if self.lock_handle is None:
+            return
+            
+        try:
+            if fcntl:
+                fcntl.flock(self.lock_handle.fileno(), fcntl.LOCK_UN)
+            else:
+                self.lock_handle.seek(0)
+                msvcrt.locking(self.lock_handle.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self.lock_handle.close()
+            self.lock_handle = None
+            
+    def _lock_handle(self, lock_handle) -> None:
+        if fcntl:
+            lock_mode = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+            fcntl.flock(lock_handle.fileno(), lock_mode | fcntl.LOCK_NB)
+        else:
+            lock_handle.seek(0)
+            msvcrt.locking(lock_handle.fileno(), msvcrt.LK_NBLCK, 1)
+            
+    def __enter__(self):
+        self.acquire()
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+        return False
+
+def merge_into_json_file(json_file_path: Union[str, Path], new_entries: Dict[str, Any]) -> Dict[str, Any]:
+    json_file_path = Path(json_file_path)
+    with InterProcessFileLock(json_file_path.with_name(json_file_path.name + ".lock")):
+        merged_entries = {}
+        if json_file_path.exists():
+            try:
+                with open(json_file_path, "r", encoding="utf-8") as json_file:
+                    merged_entries = json.load(json_file)
+            except ValueError:
+                merged_entries = {}
+        merged_entries.update(new_entries)
+        
+        temporary_path = json_file_path.with_name(f"{json_file_path.name}.{os.getpid()}.tmp")
+        with open(temporary_path, "w", encoding="utf-8") as json_file:
+            json.dump(merged_entries, json_file, indent=2, ensure_ascii=False)
+        os.replace(temporary_path, json_file_path)
+    return merged_entries
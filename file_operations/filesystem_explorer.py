@@ -2,6 +2,7 @@ import os
 import fnmatch
 from typing import Dict, Set, Union, Any
 from pathlib import Path
+from file_operations.large_file_outliner import outline_file
 
 class LocalFileSystemExplorer:
     def __init__(self, root_directory: str):
@@ -14,11 +15,13 @@ class LocalFileSystemExplorer:
         inclusion_patterns: Set[str] = None,
         exclusion_patterns: Set[str] = None,
         max_file_size: int = 1024 * 1024,
-        use_relative_paths: bool = False
+        use_relative_paths: bool = False,
+        oversized_file_mode: str = "skip"
     ) -> Dict[str, Any]:
         
         discovered_files = {}
         skipped_files = []
+        outlined_files = []
         
         pattern_checker = FilePatternChecker(inclusion_patterns, exclusion_patterns)
         
@@ -34,6 +37,12 @@ class LocalFileSystemExplorer:
                 
             if file_size > max_file_size:
                 relative_path = file_path.relative_to(self.root_path)
+                if oversized_file_mode == "outline" and pattern_checker.matches_criteria(str(relative_path), file_path.name):
+                    print(f"Outlining {relative_path}: size {file_size} exceeds limit {max_file_size}")
+                    final_path = str(relative_path) if use_relative_paths else str(file_path)
+                    discovered_files[final_path] = outline_file(str(file_path))
+                    outlined_files.append((str(relative_path), file_size))
+                    continue
                 skipped_files.append((str(relative_path), file_size))
                 print(f"Skipping {relative_path}: size {file_size} exceeds limit {max_file_size}")
                 continue
@@ -59,7 +68,8 @@ class LocalFileSystemExplorer:
             "stats": {
                 "total_files": len(discovered_files),
                 "skipped_files": len(skipped_files),
-                "skipped_details": skipped_files
+                "skipped_details": skipped_files,
+                "outlined_details": outlined_files
             }
         }
 
@@ -90,7 +100,8 @@ def explore_local_directory(
     include_patterns: Union[str, Set[str]] = None,
     exclude_patterns: Union[str, Set[str]] = None,
     max_file_size: int = 1024 * 1024,
-    use_relative_paths: bool = False
+    use_relative_paths: bool = False,
+    oversized_file_mode: str = "skip"
 ) -> Dict[str, Any]:
     
     if isinstance(include_patterns, str):
@@ -104,7 +115,8 @@ def explore_local_directory(
             inclusion_patterns=include_patterns,
             exclusion_patterns=exclude_patterns,
             max_file_size=max_file_size,
-            use_relative_paths=use_relative_paths
+            use_relative_paths=use_relative_paths,
+            oversized_file_mode=oversized_file_mode
         )
     except Exception as exploration_error:
         return {
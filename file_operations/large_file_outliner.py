@@ -0,0 +1,93 @@
+import os
+import re
+from typing import IO, Iterable, List
+
+DEFINITION_PATTERNS = {
+    ".py": re.compile(r"^\s*(?:async\s+def|def|class)\s+\w+"),
+    ".pyi": re.compile(r"^\s*(?:async\s+def|def|class)\s+\w+"),
+    ".pyx": re.compile(r"^\s*(?:async\s+def|def|cdef|cpdef|class)\s+\w+"),
+    ".go": re.compile(r"^(?:func|type)\s+"),
+    ".java": re.compile(r"^\s*(?:(?:public|private|protected|abstract|final|static|synchronized)\s+)+[\w<>\[\], ?]*\s*\w+\s*[({]|^\s*(?:public\s+)?(?:class|interface|enum|record)\s+\w+"),
+    ".md": re.compile(r"^#{1,3}\s+"),
+    ".rst": re.compile(r"^[=\-~^]{4,}\s*$"),
+}
+SCRIPT_DEFINITION_PATTERN = re.compile(r"^\s*(?:export\s+)?(?:default\s+)?(?:async\s+)?(?:function\s*\*?\s*\w+|class\s+\w+|(?:const|let|var)\s+\w+\s*=\s*(?:async\s+)?(?:\([^)]*\)|\w+)\s*=>|interface\s+\w+|type\s+\w+\s*=)")
+NATIVE_DEFINITION_PATTERN = re.compile(r"^(?!\s)(?!return\b|else\b|if\b|while\b|for\b|switch\b)(?:typedef\s+)?(?:struct|class|enum|union)\s+\w+|^(?!\s)(?!return\b|else\b|if\b|while\b|for\b|switch\b|#)[\w:*&<>, ]+?[\s*&]+[\w:~]+\s*\([^;]*$")
+IMPORT_PATTERN = re.compile(r"^\s*(?:import\s|from\s+\S+\s+import\s|#\s*include\s|package\s|using\s|const\s+\w+\s*=\s*require\()")
+HEADER_COMMENT_PATTERN = re.compile(r'^\s*(?:#(?!include)|//|/\*|\*|"""|\'\'\'|<!--)')
+MAX_HEADER_LINES = 30
+MAX_LINE_CHARS = 200
+
+def definition_pattern_for(file_path: str):
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension in DEFINITION_PATTERNS:
+        return DEFINITION_PATTERNS[extension]
+    if extension in (".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"):
+        return SCRIPT_DEFINITION_PATTERN
+    if extension in (".c", ".cc", ".cpp", ".h", ".hpp"):
+        return NATIVE_DEFINITION_PATTERN
+    return None
+
+def outline_text_lines(file_path: str, text_lines: Iterable[str], file_size: int, max_outline_chars: int = 20000) -> str:
+    definition_pattern = definition_pattern_for(file_path)
+    header_lines: List[str] = []
+    import_lines: List[str] = []
+    definition_lines: List[str] = []
+    outline_size = 0
+    omitted_definitions = 0
+    in_header = True
+    open_docstring_quote = None
+    previous_line = ""
+    
+    for line_number, raw_line in enumerate(text_lines, start=1):
+        line_text = raw_line.rstrip("\r\n")
+        stripped_line = line_text.strip()
+        
+        if in_header:
+            starts_docstring = stripped_line[:3] in ('"""', "'''")
+            inside_docstring = bool(open_docstring_quote)
+            if open_docstring_quote or starts_docstring:
+                if open_docstring_quote and open_docstring_quote in stripped_line:
+                    open_docstring_quote = None
+                elif starts_docstring and stripped_line.count(stripped_line[:3]) == 1:
+                    open_docstring_quote = stripped_line[:3]
+                    
+            if (not stripped_line or starts_docstring or inside_docstring or HEADER_COMMENT_PATTERN.match(line_text)) and len(header_lines) < MAX_HEADER_LINES:
+                if stripped_line:
+                    header_lines.append(line_text[:MAX_LINE_CHARS])
+                    outline_size += len(header_lines[-1])
+                previous_line = line_text
+                continue
+            in_header = False
+            
+        if IMPORT_PATTERN.match(line_text):
+            if outline_size < max_outline_chars:
+                import_lines.append(stripped_line[:MAX_LINE_CHARS])
+                outline_size += len(import_lines[-1])
+        elif definition_pattern and definition_pattern.match(line_text):
+            definition_text = previous_line.strip() if definition_pattern is DEFINITION_PATTERNS[".rst"] else line_text.rstrip()
+            if outline_size < max_outline_chars:
+                definition_lines.append(f"L{line_number}: {definition_text[:MAX_LINE_CHARS]}")
+                outline_size += len(definition_lines[-1])
+            else:
+                omitted_definitions += 1
+        previous_line = line_text
+        
+    outline_sections = [f"[Outline of large file ({file_size} bytes) - full source omitted]"]
+    if header_lines:
+        outline_sections.append("\n".join(header_lines))
+    if import_lines:
+        outline_sections.append("\n".join(import_lines))
+    if definition_lines:
+        outline_sections.append("\n".join(definition_lines))
+    if omitted_definitions:
+        outline_sections.append(f"... {omitted_definitions} more definitions omitted")
+    return "\n\n".join(outline_sections) + "\n"
+
+def outline_file(file_path: str, max_outline_chars: int = 20000) -> str:
+    with open(file_path, "r", encoding="utf-8", errors="ignore") as file_handle:
+        return outline_text_lines(file_path, file_handle, os.path.getsize(file_path), max_outline_chars)
+
+def outline_byte_stream(file_path: str, byte_stream: IO[bytes], file_size: int, max_outline_chars: int = 20000) -> str:
+    decoded_lines = (line_bytes.decode("utf-8", errors="ignore") for line_bytes in iter(byte_stream.readline, b""))
+    return outline_text_lines(file_path, decoded_lines, file_size, max_outline_chars)
@@ -0,0 +1,175 @@
+import os
+import re
+import time
+import shutil
+import base64
+import hashlib
+import git
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+from file_operations.file_lock import InterProcessFileLock
+
+class RepositoryMirrorCache:
+    def __init__(self, cache_directory: str = None, max_cache_bytes: int = None, refresh_interval_seconds: int = 60):
+        self.cache_root = Path(cache_directory or os.getenv("MIRROR_CACHE_DIR", "repository_mirrors"))
+        self.max_cache_bytes = max_cache_bytes or int(os.getenv("MIRROR_CACHE_MAX_BYTES", 5 * 1024 ** 3))
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.mirrors_directory = self.cache_root / "mirrors"
+        self.worktrees_directory = self.cache_root / "worktrees"
+        self.locks_directory = self.cache_root / "locks"
+        
+    @contextmanager
+    def checkout(self, repository_url: str, reference: str = None, auth_token: str = None) -> Iterator[Tuple[str, str]]:
+        mirror_key = self._mirror_key(repository_url)
+        
+        with InterProcessFileLock(self.locks_directory / f"{mirror_key}.lock"):
+            mirror_path = self._refresh_mirror(repository_url, mirror_key, reference, auth_token)
+            commit_sha = self._resolve_commit(mirror_path, reference)
+            
+            worktree_name = f"{mirror_key}-{commit_sha[:12]}"
+            worktree_path = self.worktrees_directory / worktree_name
+            worktree_lock = InterProcessFileLock(self.locks_directory / f"{worktree_name}.lock", shared=True)
+            worktree_lock.acquire()
+            
+            try:
+                if not worktree_path.exists():
+                    print(f"Checking out {commit_sha[:12]} into cached worktree...")
+                    self.worktrees_directory.mkdir(parents=True, exist_ok=True)
+                    mirror_repository = git.Repo(mirror_path)
+                    mirror_repository.git.worktree("prune")
+                    mirror_repository.git.worktree("add", "--detach", str(worktree_path.resolve()), commit_sha)
+            except Exception:
+                worktree_lock.release()
+                raise
+                
+        self._mark_used(worktree_name)
+        self._mark_used(mirror_key)
+        
+        try:
+            self.evict_least_recently_used()
+            yield str(worktree_path), commit_sha
+        finally:
+            worktree_lock.release()
+            
+    def evict_least_recently_used(self) -> List[str]:
+        evicted_entries = []
+        
+        with InterProcessFileLock(self.locks_directory / "eviction.lock"):
+            cache_size = self._directory_size(self.mirrors_directory) + self._directory_size(self.worktrees_directory)
+            if cache_size <= self.max_cache_bytes:
+                return evicted_entries
+                
+            for entry_path in self._entries_by_last_use():
+                if cache_size <= self.max_cache_bytes:
+                    break
+                    
+                entry_lock = InterProcessFileLock(self.locks_directory / f"{entry_path.name}.lock", blocking=False)
+                if not entry_lock.acquire():
+                    continue
+                    
+                try:
+                    if entry_path.parent == self.mirrors_directory and self._has_worktrees(entry_path.name):
+                        continue
+                        
+                    entry_size = self._directory_size(entry_path)
+                    shutil.rmtree(entry_path, ignore_errors=True)
+                    (self.locks_directory / f"{entry_path.name}.used").unlink(missing_ok=True)
+                    cache_size -= entry_size
+                    evicted_entries.append(entry_path.name)
+                    print(f"Evicted cached repository entry {entry_path.name} ({entry_size} bytes)")
+                finally:
+                    entry_lock.release()
+                    
+        return evicted_entries
+        
+    def _refresh_mirror(self, repository_url: str, mirror_key: str, reference: str, auth_token: str) -> Path:
+        mirror_path = self.mirrors_directory / mirror_key
+        marker_path = self.locks_directory / f"{mirror_key}.fetched"
+        git_environment = self._authentication_environment(auth_token)
+        
+        if not mirror_path.exists():
+            print(f"Creating mirror of {repository_url} in repository cache...")
+            self.mirrors_directory.mkdir(parents=True, exist_ok=True)
+            git.Repo.clone_from(repository_url, str(mirror_path), mirror=True, env=git_environment)
+            marker_path.touch()
+            return mirror_path
+            
+        mirror_repository = git.Repo(mirror_path)
+        
+        if reference and re.fullmatch(r"[0-9a-f]{40}", reference) and self._commit_exists(mirror_repository, reference):
+            return mirror_path
+            
+        if marker_path.exists() and time.time() - marker_path.stat().st_mtime < self.refresh_interval_seconds:
+            return mirror_path
+            
+        print(f"Refreshing cached mirror of {repository_url}...")
+        mirror_repository.git.fetch("--prune", "origin", env=git_environment)
+        marker_path.touch()
+        return mirror_path
+        
+    def _resolve_commit(self, mirror_path: Path, reference: str) -> str:
+        mirror_repository = git.Repo(mirror_path)
+        return mirror_repository.git.rev_parse("--verify", f"{reference or 'HEAD'}^{{commit}}")
+        
+    def _commit_exists(self, mirror_repository: git.Repo, commit_sha: str) -> bool:
+        try:
+            mirror_repository.git.cat_file("-e", f"{commit_sha}^{{commit}}")
+            return True
+        except git.GitCommandError:
+            return False
+            
+    def _has_worktrees(self, mirror_key: str) -> bool:
+        if not self.worktrees_directory.exists():
+            return False
+        return any(worktree.name.startswith(f"{mirror_key}-") for worktree in self.worktrees_directory.iterdir())
+        
+    def _entries_by_last_use(self) -> List[Path]:
+        cache_entries = []
+        for parent_directory in (self.worktrees_directory, self.mirrors_directory):
+            if parent_directory.exists():
+                cache_entries.extend(entry for entry in parent_directory.iterdir() if entry.is_dir())
+                
+        def last_used(entry_path: Path) -> float:
+            marker_path = self.locks_directory / f"{entry_path.name}.used"
+            return marker_path.stat().st_mtime if marker_path.exists() else 0.0
+            
+        return sorted(cache_entries, key=last_used)
+        
+    def _mark_used(self, entry_name: str) -> None:
+        self.locks_directory.mkdir(parents=True, exist_ok=True)
+        marker_path = self.locks_directory / f"{entry_name}.used"
+        marker_path.touch()
+        os.utime(marker_path, None)
+        
+    @staticmethod
+    def _mirror_key(repository_url: str) -> str:
+        normalized_url = repository_url.strip().rstrip('/')
+        if normalized_url.endswith('.git'):
+            normalized_url = normalized_url[:-4]
+        readable_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", normalized_url.split(':')[-1].split('/')[-1])
+        url_digest = hashlib.sha256(normalized_url.lower().encode("utf-8")).hexdigest()[:12]
+        return f"{readable_name}-{url_digest}"
+        
+    @staticmethod
+    def _authentication_environment(auth_token: str) -> Dict[str, str]:
+        git_environment = {"GIT_TERMINAL_PROMPT": "0"}
+        if auth_token:
+            encoded_credentials = base64.b64encode(f"x-access-token:{auth_token}".encode("utf-8")).decode("ascii")
+            git_environment.update({
+                "GIT_CONFIG_COUNT": "1",
+                "GIT_CONFIG_KEY_0": "http.extraHeader",
+                "GIT_CONFIG_VALUE_0": f"Authorization: Basic {encoded_credentials}",
+            })
+        return git_environment
+        
+    @staticmethod
+    def _directory_size(directory_path: Path) -> int:
+        total_size = 0
+        for root_dir, directories, file_names in os.walk(directory_path):
+            for file_name in file_names:
+                try:
+                    total_size += os.lstat(os.path.join(root_dir, file_name)).st_size
+                except OSError:
+                    continue
+        return total_size
@@ -2,19 +2,92 @@ import requests
 import base64
 import os
 import tempfile
+import tarfile
 import git
 import time
 import fnmatch
-from typing import Union, Set, List, Dict, Tuple, Any
-from urllib.parse import urlparse
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Union, Set, List, Dict, Tuple, Any, Iterator
+from urllib.parse import urlparse, quote
 from pathlib import Path
+from file_operations.repository_mirror_cache import RepositoryMirrorCache
+from file_operations.large_file_outliner import outline_byte_stream, outline_file, outline_text_lines
+
+class GitHubResponseCache:
+    def __init__(self, cache_file_name: str = None):
+        self.cache_file_path = Path(cache_file_name or os.getenv("GITHUB_CACHE_FILE", "github_response_cache.json"))
+        self.cached_responses = {}
+        self.cache_lock = threading.Lock()
+        self._load_existing_cache()
+        
+    def _load_existing_cache(self) -> None:
+        if self.cache_file_path.exists():
+            try:
+                with open(self.cache_file_path, "r", encoding="utf-8") as cache_file:
+                    self.cached_responses = json.load(cache_file)
+            except Exception as cache_error:
+                print(f"Warning: Failed to load GitHub response cache - {cache_error}")
+                self.cached_responses = {}
+                
+    def get_cached_entry(self, request_url: str) -> Union[Dict[str, Any], None]:
+        with self.cache_lock:
+            return self.cached_responses.get(request_url)
+            
+    def store_entry(self, request_url: str, etag: str, last_modified: str, payload: Any) -> None:
+        with self.cache_lock:
+            self.cached_responses[request_url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "payload": payload
+            }
+            try:
+                with open(self.cache_file_path, "w", encoding="utf-8") as cache_file:
+                    json.dump(self.cached_responses, cache_file)
+            except Exception as save_error:
+                print(f"Warning: Failed to save GitHub response cache - {save_error}")
 
 class GitHubAPIClient:
-    def __init__(self, authentication_token: str = None):
+    def __init__(
+        self,
+        authentication_token: str = None,
+        api_base_url: str = None,
+        raw_content_base_url: str = None,
+        max_concurrent_downloads: int = 8,
+        max_rate_limit_wait: int = 900,
+        response_cache: GitHubResponseCache = None,
+        rate_limit_pacing_threshold: int = 100
+    ):
         self.auth_token = authentication_token
-        self.api_base_url = "https://api.github.com"
+        self.api_base_url = (api_base_url or os.getenv("GITHUB_API_URL", "https://api.github.com")).rstrip('/')
+        self.raw_content_base_url = (raw_content_base_url or os.getenv("GITHUB_RAW_URL", "https://raw.githubusercontent.com")).rstrip('/')
+        self.max_concurrent_downloads = max(1, max_concurrent_downloads)
+        self.max_rate_limit_wait = max_rate_limit_wait
+        self.response_cache = response_cache
+        self.rate_limit_pacing_threshold = rate_limit_pacing_threshold
+        self.rate_limit_remaining = None
+        self.rate_limit_reset = None
+        self.next_request_time = 0.0
+        self.rate_limit_lock = threading.Lock()
         self.session = requests.Session()
         
+        transient_retry_policy = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"])
+        )
+        pooled_adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.max_concurrent_downloads,
+            max_retries=transient_retry_policy
+        )
+        self.session.mount("https://", pooled_adapter)
+        self.session.mount("http://", pooled_adapter)
+        
         if self.auth_token:
             self.session.headers.update({"Authorization": f"token {self.auth_token}"})
             
@@ -22,15 +95,134 @@ class GitHubAPIClient:
         api_endpoint = f"{self.api_base_url}/repos/{owner}/{repository}/contents/{directory_path}"
         request_params = {"ref": ref}
         
-        response = self.session.get(api_endpoint, params=request_params)
+        return self._fetch_json_listing(api_endpoint, request_params)
+        
+    def fetch_repository_tree(self, owner: str, repository: str, ref: str = "main") -> Dict[str, Any]:
+        api_endpoint = f"{self.api_base_url}/repos/{owner}/{repository}/git/trees/{ref}"
+        request_params = {"recursive": "1"}
+        
+        return self._fetch_json_listing(api_endpoint, request_params)
+        
+    def open_repository_archive(self, owner: str, repository: str, ref: str = "main") -> requests.Response:
+        api_endpoint = f"{self.api_base_url}/repos/{owner}/{repository}/tarball/{ref}"
+        
+        response = self._send_request(api_endpoint, stream=True)
         response.raise_for_status()
+        response.raw.decode_content = True
         
-        return response.json()
+        return response
+        
+    def build_raw_file_url(self, owner: str, repository: str, ref: str, file_path: str) -> str:
+        return f"{self.raw_content_base_url}/{owner}/{repository}/{ref}/{quote(file_path)}"
         
     def download_file_content(self, download_url: str) -> bytes:
-        response = self.session.get(download_url)
+        response = self._send_request(download_url)
         response.raise_for_status()
         return response.content
+        
+    def stream_file_lines(self, download_url: str) -> Iterator[str]:
+        with self._send_request(download_url, stream=True) as response:
+            response.raise_for_status()
+            for line_bytes in response.iter_lines():
+                yield line_bytes.decode("utf-8", errors="ignore")
+                
+    def download_files_concurrently(self, download_urls: List[str]) -> List[Union[bytes, Exception]]:
+        def download_or_capture(download_url: str) -> Union[bytes, Exception]:
+            try:
+                return self.download_file_content(download_url)
+            except Exception as download_error:
+                return download_error
+                
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_downloads) as download_pool:
+            return list(download_pool.map(download_or_capture, download_urls))
+            
+    def _fetch_json_listing(self, api_endpoint: str, request_params: Dict[str, str]) -> Any:
+        cache_key = requests.Request("GET", api_endpoint, params=request_params).prepare().url
+        cached_entry = self.response_cache.get_cached_entry(cache_key) if self.response_cache else None
+        
+        conditional_headers = {}
+        if cached_entry:
+            if cached_entry.get("etag"):
+                conditional_headers["If-None-Match"] = cached_entry["etag"]
+            if cached_entry.get("last_modified"):
+                conditional_headers["If-Modified-Since"] = cached_entry["last_modified"]
+                
+        response = self._send_request(api_endpoint, params=request_params, headers=conditional_headers)
+        
+        if response.status_code == 304 and cached_entry:
+            return cached_entry["payload"]
+            
+        response.raise_for_status()
+        payload = response.json()
+        
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self.response_cache and (etag or last_modified):
+            self.response_cache.store_entry(cache_key, etag, last_modified, payload)
+            
+        return payload
+        
+    def _send_request(self, request_url: str, **request_options) -> requests.Response:
+        while True:
+            self._pace_against_rate_limit()
+            response = self.session.get(request_url, **request_options)
+            self._record_rate_limit(response)
+            
+            wait_seconds = self._rate_limit_wait_seconds(response)
+            if wait_seconds is None:
+                return response
+            if wait_seconds > self.max_rate_limit_wait:
+                print(f"GitHub rate limit resets in {wait_seconds:.0f}s, beyond the {self.max_rate_limit_wait}s wait limit")
+                return response
+                
+            print(f"GitHub rate limit reached, waiting {wait_seconds:.0f}s before retrying...")
+            response.close()
+            time.sleep(wait_seconds)
+            
+    def _pace_against_rate_limit(self) -> None:
+        with self.rate_limit_lock:
+            current_time = time.time()
+            if self.rate_limit_remaining is None or self.rate_limit_reset is None or self.rate_limit_reset <= current_time:
+                return
+                
+            seconds_until_reset = self.rate_limit_reset - current_time + 1
+            if self.rate_limit_remaining <= 0:
+                scheduled_time = current_time + min(seconds_until_reset, self.max_rate_limit_wait)
+                print(f"GitHub request budget exhausted, pausing {scheduled_time - current_time:.0f}s until reset...")
+            elif self.rate_limit_remaining < self.rate_limit_pacing_threshold:
+                request_spacing = seconds_until_reset / self.rate_limit_remaining
+                scheduled_time = max(current_time, self.next_request_time)
+                self.next_request_time = scheduled_time + request_spacing
+            else:
+                return
+                
+        time.sleep(max(0.0, scheduled_time - current_time))
+        
+    def _record_rate_limit(self, response: requests.Response) -> None:
+        remaining_header = response.headers.get("X-RateLimit-Remaining", "")
+        reset_header = response.headers.get("X-RateLimit-Reset", "")
+        if not (remaining_header.isdigit() and reset_header.isdigit()):
+            return
+            
+        with self.rate_limit_lock:
+            self.rate_limit_remaining = int(remaining_header)
+            self.rate_limit_reset = int(reset_header)
+            
+    @staticmethod
+    def _rate_limit_wait_seconds(response: requests.Response) -> Union[float, None]:
+        if response.status_code not in (403, 429):
+            return None
+            
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+            
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset_timestamp = response.headers.get("X-RateLimit-Reset", "")
+            if reset_timestamp.isdigit():
+                return max(0.0, int(reset_timestamp) - time.time()) + 1
+                
+        return None
 
 class RepositoryURLParser:
     @staticmethod
@@ -79,12 +271,46 @@ class FilePatternMatcher:
 
 class SSHRepositoryCloner:
     @staticmethod
-    def clone_ssh_repository(ssh_url: str, target_directory: str) -> None:
+    def clone_ssh_repository(ssh_url: str, target_directory: str, sparse_patterns: List[str] = None, clone_depth: int = 1) -> None:
+        clone_options = {"no_checkout": True, "single_branch": True, "filter": "blob:none"}
+        if clone_depth:
+            clone_options["depth"] = clone_depth
+            
         try:
-            git.Repo.clone_from(ssh_url, target_directory)
+            cloned_repository = git.Repo.clone_from(ssh_url, target_directory, **clone_options)
         except Exception as clone_error:
             raise RuntimeError(f"SSH repository cloning failed: {clone_error}")
             
+        if sparse_patterns:
+            try:
+                cloned_repository.git.sparse_checkout("set", "--no-cone", *sparse_patterns)
+            except Exception as sparse_error:
+                print(f"Sparse checkout unavailable, checking out the full tree: {sparse_error}")
+                
+        try:
+            cloned_repository.git.checkout(cloned_repository.head.reference.name)
+        except Exception as checkout_error:
+            raise RuntimeError(f"SSH repository checkout failed: {checkout_error}")
+            
+    @staticmethod
+    def build_sparse_patterns(pattern_matcher: FilePatternMatcher) -> List[str]:
+        if not pattern_matcher.inclusion_patterns:
+            return []
+            
+        sparse_patterns = sorted(pattern_matcher.inclusion_patterns)
+        for exclusion_pattern in sorted(pattern_matcher.exclusion_patterns):
+            if not exclusion_pattern.endswith("/*"):
+                continue
+            directory_pattern = exclusion_pattern[:-2]
+            if "/" in directory_pattern.lstrip("*") or not directory_pattern.strip("*"):
+                continue
+            if directory_pattern.startswith("*"):
+                sparse_patterns.append(f"!**/{directory_pattern}/**")
+            else:
+                sparse_patterns.append(f"!/{directory_pattern}/**")
+                
+        return sparse_patterns
+        
     @staticmethod
     def is_ssh_url(repository_url: str) -> bool:
         return repository_url.startswith("git@") or repository_url.endswith(".git")
@@ -95,7 +321,12 @@ def scan_github_repository(
     max_file_size: int = 1024 * 1024,
     use_relative_paths: bool = False,
     include_patterns: Union[str, Set[str]] = None,
-    exclude_patterns: Union[str, Set[str]] = None
+    exclude_patterns: Union[str, Set[str]] = None,
+    download_mode: str = "tree",
+    max_concurrent_downloads: int = 8,
+    use_response_cache: bool = True,
+    use_mirror_cache: bool = False,
+    oversized_file_mode: str = "skip"
 ) -> Dict[str, Any]:
     
     if isinstance(include_patterns, str):
@@ -104,122 +335,324 @@ def scan_github_repository(
         exclude_patterns = {exclude_patterns}
         
     pattern_matcher = FilePatternMatcher(include_patterns, exclude_patterns)
+    outline_oversized = oversized_file_mode == "outline"
     
-    if SSHRepositoryCloner.is_ssh_url(repo_url):
-        return _scan_ssh_repository(repo_url, max_file_size, pattern_matcher, use_relative_paths)
+    if use_mirror_cache:
+        return _scan_mirrored_repository(repo_url, token, max_file_size, pattern_matcher, use_relative_paths, outline_oversized)
+    elif SSHRepositoryCloner.is_ssh_url(repo_url):
+        return _scan_ssh_repository(repo_url, max_file_size, pattern_matcher, use_relative_paths, outline_oversized)
+    elif download_mode == "archive":
+        return _scan_archive_repository(repo_url, token, max_file_size, pattern_matcher, use_relative_paths, outline_oversized)
     else:
-        return _scan_https_repository(repo_url, token, max_file_size, pattern_matcher, use_relative_paths)
+        return _scan_https_repository(repo_url, token, max_file_size, pattern_matcher, use_relative_paths, max_concurrent_downloads, use_response_cache, outline_oversized)
 
-def _scan_ssh_repository(ssh_url: str, max_file_size: int, pattern_matcher: FilePatternMatcher, use_relative_paths: bool) -> Dict[str, Any]:
+def _scan_ssh_repository(ssh_url: str, max_file_size: int, pattern_matcher: FilePatternMatcher, use_relative_paths: bool, outline_oversized: bool = False) -> Dict[str, Any]:
     with tempfile.TemporaryDirectory() as temp_directory:
         print(f"Cloning SSH repository {ssh_url} to temporary directory...")
         
         try:
-            SSHRepositoryCloner.clone_ssh_repository(ssh_url, temp_directory)
+            SSHRepositoryCloner.clone_ssh_repository(
+                ssh_url,
+                temp_directory,
+                sparse_patterns=SSHRepositoryCloner.build_sparse_patterns(pattern_matcher)
+            )
         except Exception as clone_error:
             return {"files": {}, "stats": {"error": str(clone_error)}}
             
-        discovered_files = {}
-        skipped_files = []
+        return _collect_checkout_files(temp_directory, max_file_size, pattern_matcher, use_relative_paths, outline_oversized)
+
+def _scan_mirrored_repository(repo_url: str, auth_token: str, max_file_size: int, pattern_matcher: FilePatternMatcher, use_relative_paths: bool, outline_oversized: bool = False) -> Dict[str, Any]:
+    clone_url = repo_url
+    reference = None
+    subdirectory = ""
+    
+    if not SSHRepositoryCloner.is_ssh_url(repo_url):
+        try:
+            url_components = RepositoryURLParser.parse_github_url(repo_url)
+        except Exception as parse_error:
+            return {"files": {}, "stats": {"error": f"URL parsing failed: {parse_error}"}}
+            
+        clone_url = f"https://github.com/{url_components['owner']}/{url_components['repository']}.git"
+        if '/tree/' in repo_url:
+            reference = url_components["reference"]
+        subdirectory = url_components["subdirectory"]
         
-        for root_dir, directories, file_names in os.walk(temp_directory):
-            for file_name in file_names:
-                absolute_path = os.path.join(root_dir, file_name)
-                relative_path = os.path.relpath(absolute_path, temp_directory)
+    try:
+        with RepositoryMirrorCache().checkout(clone_url, reference, auth_token) as (worktree_path, commit_sha):
+            print(f"Scanning cached worktree of {clone_url} at {commit_sha[:12]}...")
+            scan_root = os.path.join(worktree_path, subdirectory) if subdirectory else worktree_path
+            return _collect_checkout_files(scan_root, max_file_size, pattern_matcher, use_relative_paths, outline_oversized)
+    except Exception as mirror_error:
+        return {"files": {}, "stats": {"error": f"Mirror cache checkout failed: {mirror_error}"}}
+
+def _collect_checkout_files(checkout_directory: str, max_file_size: int, pattern_matcher: FilePatternMatcher, use_relative_paths: bool, outline_oversized: bool = False) -> Dict[str, Any]:
+    discovered_files = {}
+    skipped_files = []
+    outlined_files = []
+    
+    for root_dir, directories, file_names in os.walk(checkout_directory):
+        directories[:] = sorted(directory for directory in directories if directory != ".git")
+        for file_name in sorted(file_names):
+            if file_name == ".git":
+                continue
+            absolute_path = os.path.join(root_dir, file_name)
+            relative_path = os.path.relpath(absolute_path, checkout_directory)
+            
+            try:
+                file_size = os.path.getsize(absolute_path)
+            except OSError:
+                continue
                 
-                try:
-                    file_size = os.path.getsize(absolute_path)
-                except OSError:
-                    continue
-                    
-                if file_size > max_file_size:
-                    skipped_files.append((relative_path, file_size))
-                    print(f"Skipping {relative_path}: size {file_size} exceeds limit {max_file_size}")
-                    continue
-                    
-                if not pattern_matcher.should_include_file(relative_path, file_name):
-                    continue
-                    
-                try:
-                    with open(absolute_path, 'r', encoding='utf-8') as file_handle:
-                        file_content = file_handle.read()
-                        
+            if file_size > max_file_size:
+                if outline_oversized and pattern_matcher.should_include_file(relative_path, file_name):
+                    print(f"Outlining {relative_path}: size {file_size} exceeds limit {max_file_size}")
                     final_path = relative_path if use_relative_paths else absolute_path
-                    discovered_files[final_path] = file_content
-                    
-                except Exception as read_error:
-                    print(f"Error reading {relative_path}: {read_error}")
+                    discovered_files[final_path] = outline_file(absolute_path)
+                    outlined_files.append((relative_path, file_size))
+                    continue
+                skipped_files.append((relative_path, file_size))
+                print(f"Skipping {relative_path}: size {file_size} exceeds limit {max_file_size}")
+                continue
+                
+            if not pattern_matcher.should_include_file(relative_path, file_name):
+                continue
+                
+            try:
+                with open(absolute_path, 'r', encoding='utf-8') as file_handle:
+                    file_content = file_handle.read()
                     
-        return {
-            "files": discovered_files,
-            "stats": {
-                "total_files": len(discovered_files),
-                "skipped_files": len(skipped_files),
-                "skipped_details": skipped_files
-            }
+                final_path = relative_path if use_relative_paths else absolute_path
+                discovered_files[final_path] = file_content
+                
+            except Exception as read_error:
+                print(f"Error reading {relative_path}: {read_error}")
+                
+    return {
+        "files": discovered_files,
+        "stats": {
+            "total_files": len(discovered_files),
+            "skipped_files": len(skipped_files),
+            "skipped_details": skipped_files,
+            "outlined_details": outlined_files
         }
+    }
 
-def _scan_https_repository(https_url: str, auth_token: str, max_file_size: int, pattern_matcher: FilePatternMatcher, use_relative_paths: bool) -> Dict[str, Any]:
+def _scan_https_repository(https_url: str, auth_token: str, max_file_size: int, pattern_matcher: FilePatternMatcher, use_relative_paths: bool, max_concurrent_downloads: int = 8, use_response_cache: bool = True, outline_oversized: bool = False) -> Dict[str, Any]:
     try:
         url_components = RepositoryURLParser.parse_github_url(https_url)
     except Exception as parse_error:
         return {"files": {}, "stats": {"error": f"URL parsing failed: {parse_error}"}}
         
-    github_client = GitHubAPIClient(auth_token)
+    github_client = GitHubAPIClient(
+        auth_token,
+        max_concurrent_downloads=max_concurrent_downloads,
+        response_cache=GitHubResponseCache() if use_response_cache else None
+    )
+    
+    try:
+        file_entries = _list_repository_files(github_client, url_components)
+    except Exception as listing_error:
+        return {"files": {}, "stats": {"error": f"Repository listing failed: {listing_error}"}}
+        
     discovered_files = {}
     skipped_files = []
+    outlined_files = []
+    subdirectory = url_components["subdirectory"]
     
-    def scan_directory_recursive(directory_path: str = ""):
+    selected_entries = []
+    oversized_entries = []
+    for file_entry in sorted(file_entries, key=lambda entry: entry["path"]):
+        file_path = file_entry["path"]
+        file_name = file_path.rsplit('/', 1)[-1]
+        file_size = file_entry["size"]
+        
+        if file_size > max_file_size:
+            if outline_oversized and pattern_matcher.should_include_file(file_path, file_name):
+                oversized_entries.append(file_entry)
+                continue
+            skipped_files.append((file_path, file_size))
+            print(f"Skipping {file_path}: size {file_size} exceeds limit {max_file_size}")
+            continue
+            
+        if not pattern_matcher.should_include_file(file_path, file_name):
+            continue
+            
+        selected_entries.append(file_entry)
+        
+    print(f"Downloading {len(selected_entries)} files with {github_client.max_concurrent_downloads} concurrent workers...")
+    download_results = github_client.download_files_concurrently(
+        [file_entry["download_url"] for file_entry in selected_entries]
+    )
+    
+    for file_entry in oversized_entries:
+        print(f"Outlining {file_entry['path']}: size {file_entry['size']} exceeds limit {max_file_size}")
         try:
-            contents = github_client.fetch_repository_contents(
-                url_components["owner"],
-                url_components["repository"],
-                directory_path,
-                url_components["reference"]
+            file_outline = outline_text_lines(
+                file_entry["path"], github_client.stream_file_lines(file_entry["download_url"]), file_entry["size"]
             )
+            selected_entries.append(file_entry)
+            download_results.append(file_outline.encode('utf-8'))
+            outlined_files.append((file_entry["path"], file_entry["size"]))
+        except Exception as outline_error:
+            print(f"Error outlining {file_entry['path']}: {outline_error}")
             
-            for content_item in contents:
-                if content_item["type"] == "file":
-                    file_path = content_item["path"]
-                    file_name = content_item["name"]
-                    file_size = content_item["size"]
+    for file_entry, download_result in zip(selected_entries, download_results):
+        file_path = file_entry["path"]
+        
+        try:
+            if isinstance(download_result, Exception):
+                raise download_result
+            file_content = download_result.decode('utf-8')
+            
+            final_path = file_path
+            if use_relative_paths and subdirectory:
+                if file_path.startswith(subdirectory):
+                    final_path = file_path[len(subdirectory):].lstrip('/')
+                    
+            discovered_files[final_path] = file_content
+            
+        except Exception as download_error:
+            print(f"Error downloading {file_path}: {download_error}")
+            
+    return {
+        "files": discovered_files,
+        "stats": {
+            "total_files": len(discovered_files),
+            "skipped_files": len(skipped_files),
+            "skipped_details": skipped_files,
+            "outlined_details": outlined_files
+        }
+    }
+
+def _scan_archive_repository(https_url: str, auth_token: str, max_file_size: int, pattern_matcher: FilePatternMatcher, use_relative_paths: bool, outline_oversized: bool = False) -> Dict[str, Any]:
+    try:
+        url_components = RepositoryURLParser.parse_github_url(https_url)
+    except Exception as parse_error:
+        return {"files": {}, "stats": {"error": f"URL parsing failed: {parse_error}"}}
+        
+    github_client = GitHubAPIClient(auth_token)
+    discovered_files = {}
+    skipped_files = []
+    outlined_files = []
+    subdirectory = url_components["subdirectory"].strip('/')
+    
+    print(f"Streaming archive of {url_components['owner']}/{url_components['repository']}@{url_components['reference']}...")
+    
+    try:
+        with github_client.open_repository_archive(
+            url_components["owner"],
+            url_components["repository"],
+            url_components["reference"]
+        ) as archive_response:
+            with tarfile.open(fileobj=archive_response.raw, mode="r|*") as repository_archive:
+                for archive_member in repository_archive:
+                    if not archive_member.isfile():
+                        continue
+                        
+                    name_parts = archive_member.name.split('/', 1)
+                    if len(name_parts) < 2:
+                        continue
+                    file_path = name_parts[1]
+                    file_name = file_path.rsplit('/', 1)[-1]
                     
-                    if file_size > max_file_size:
-                        skipped_files.append((file_path, file_size))
-                        print(f"Skipping {file_path}: size {file_size} exceeds limit {max_file_size}")
+                    if subdirectory and not file_path.startswith(subdirectory + '/'):
                         continue
                         
+                    outline_member = False
+                    if archive_member.size > max_file_size:
+                        if not (outline_oversized and pattern_matcher.should_include_file(file_path, file_name)):
+                            skipped_files.append((file_path, archive_member.size))
+                            print(f"Skipping {file_path}: size {archive_member.size} exceeds limit {max_file_size}")
+                            continue
+                        print(f"Outlining {file_path}: size {archive_member.size} exceeds limit {max_file_size}")
+                        outline_member = True
+                        
                     if not pattern_matcher.should_include_file(file_path, file_name):
                         continue
                         
                     try:
-                        file_content_bytes = github_client.download_file_content(content_item["download_url"])
-                        file_content = file_content_bytes.decode('utf-8')
-                        
+                        member_stream = repository_archive.extractfile(archive_member)
+                        if outline_member:
+                            file_content = outline_byte_stream(file_path, member_stream, archive_member.size)
+                            outlined_files.append((file_path, archive_member.size))
+                        else:
+                            file_content = member_stream.read().decode('utf-8')
+                            
                         final_path = file_path
-                        if use_relative_paths and url_components["subdirectory"]:
-                            if file_path.startswith(url_components["subdirectory"]):
-                                final_path = file_path[len(url_components["subdirectory"]):].lstrip('/')
-                                
+                        if use_relative_paths and subdirectory:
+                            final_path = file_path[len(subdirectory):].lstrip('/')
+                            
                         discovered_files[final_path] = file_content
                         
-                    except Exception as download_error:
-                        print(f"Error downloading {file_path}: {download_error}")
+                    except Exception as read_error:
+                        print(f"Error reading {file_path} from archive: {read_error}")
                         
-                elif content_item["type"] == "dir":
-                    scan_directory_recursive(content_item["path"])
-                    
-        except Exception as scan_error:
-            print(f"Error scanning directory {directory_path}: {scan_error}")
-            
-    initial_path = url_components["subdirectory"]
-    scan_directory_recursive(initial_path)
-    
+    except Exception as archive_error:
+        return {"files": discovered_files, "stats": {"error": f"Archive download failed: {archive_error}"}}
+        
     return {
         "files": discovered_files,
         "stats": {
             "total_files": len(discovered_files),
             "skipped_files": len(skipped_files),
-            "skipped_details": skipped_files
+            "skipped_details": skipped_files,
+            "outlined_details": outlined_files
         }
     }
+
+def _list_repository_files(github_client: GitHubAPIClient, url_components: Dict[str, str]) -> List[Dict[str, Any]]:
+    owner = url_components["owner"]
+    repository = url_components["repository"]
+    reference = url_components["reference"]
+    subdirectory = url_components["subdirectory"].strip('/')
+    
+    tree_listing = github_client.fetch_repository_tree(owner, repository, reference)
+    
+    if tree_listing.get("truncated"):
+        print("Repository tree listing was truncated by the GitHub API, falling back to per-directory listing...")
+        return _list_repository_files_by_directory(github_client, url_components)
+        
+    file_entries = []
+    for tree_item in tree_listing.get("tree", []):
+        if tree_item.get("type") != "blob":
+            continue
+            
+        item_path = tree_item["path"]
+        if subdirectory and item_path != subdirectory and not item_path.startswith(subdirectory + '/'):
+            continue
+            
+        file_entries.append({
+            "path": item_path,
+            "size": tree_item.get("size", 0),
+            "download_url": github_client.build_raw_file_url(owner, repository, reference, item_path)
+        })
+        
+    return file_entries
+
+def _list_repository_files_by_directory(github_client: GitHubAPIClient, url_components: Dict[str, str]) -> List[Dict[str, Any]]:
+    file_entries = []
+    
+    def scan_directory_recursive(directory_path: str = ""):
+        try:
+            contents = github_client.fetch_repository_contents(
+                url_components["owner"],
+                url_components["repository"],
+                directory_path,
+                url_components["reference"]
+            )
+            
+            for content_item in contents:
+                if content_item["type"] == "file":
+                    file_entries.append({
+                        "path": content_item["path"],
+                        "size": content_item["size"],
+                        "download_url": content_item["download_url"]
+                    })
+                elif content_item["type"] == "dir":
+                    scan_directory_recursive(content_item["path"])
+                    
+        except Exception as scan_error:
+            print(f"Error scanning directory {directory_path}: {scan_error}")
+            
+    scan_directory_recursive(url_components["subdirectory"])
+    return file_entries
@@ -0,0 +1,135 @@
+import copy
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from pocketflow import BaseNode, BatchNode
+
+class StageCancelledError(BaseException):
+    pass
+
+class PipelineStage:
+    def __init__(self, name: str, node: BaseNode, dependencies: List[str], bypass_condition: Optional[Tuple[str, str]] = None):
+        self.name = name
+        self.node = node
+        self.dependencies = dependencies
+        self.bypass_condition = bypass_condition
+
+class StageGraphExecutor:
+    def __init__(self, checkpoint_store=None, completed_stages=None, profiler=None, max_workers: int = 4):
+        self.checkpoint_store = checkpoint_store
+        self.completed_stages = set(completed_stages or [])
+        self.profiler = profiler
+        self.max_workers = max(1, max_workers)
+        self.stages: Dict[str, PipelineStage] = {}
+        self.cancellation_event = threading.Event()
+        
+    def add_stage(self, node: BaseNode, depends_on: Iterable[BaseNode] = (), bypassed_by: Optional[Tuple[BaseNode, str]] = None) -> BaseNode:
+        stage_name = type(node).__name__
+        if stage_name in self.stages:
+            raise ValueError(f"Stage {stage_name} was added twice")
+        dependency_names = [type(dependency).__name__ for dependency in depends_on]
+        if bypassed_by:
+            dependency_names.append(type(bypassed_by[0]).__name__)
+        unknown_dependencies = [name for name in dependency_names if name not in self.stages]
+        if unknown_dependencies:
+            raise ValueError(f"Stage {stage_name} depends on stages that were not added before it: {unknown_dependencies}")
+            
+        bypass_condition = (type(bypassed_by[0]).__name__, bypassed_by[1]) if bypassed_by else None
+        self.stages[stage_name] = PipelineStage(stage_name, node, list(dict.fromkeys(dependency_names)), bypass_condition)
+        return node
+        
+    def cancel(self) -> None:
+        self.cancellation_event.set()
+        
+    def run(self, shared: Dict[str, Any]) -> Optional[str]:
+        pending_stages = list(self.stages)
+        finished_actions: Dict[str, Optional[str]] = {}
+        running_stages = {}
+        first_error = None
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pipeline-stage") as stage_pool:
+            try:
+                while pending_stages or running_stages:
+                    ready_stages = [] if self.cancellation_event.is_set() else self._ready_stages(pending_stages, finished_actions)
+                    while ready_stages:
+                        for stage_name in ready_stages:
+                            pending_stages.remove(stage_name)
+                            bypass_condition = self.stages[stage_name].bypass_condition
+                            if bypass_condition and finished_actions.get(bypass_condition[0]) == bypass_condition[1]:
+                                print(f"Skipping {stage_name} ({bypass_condition[0]} returned '{bypass_condition[1]}')")
+                                finished_actions[stage_name] = None
+                            else:
+                                running_stages[stage_pool.submit(self._run_stage, self.stages[stage_name], shared)] = stage_name
+                        ready_stages = self._ready_stages(pending_stages, finished_actions)
+                        
+                    if not running_stages:
+                        break
+                        
+                    completed_futures, _ = wait(running_stages, return_when=FIRST_COMPLETED)
+                    for completed_future in completed_futures:
+                        stage_name = running_stages.pop(completed_future)
+                        try:
+                            finished_actions[stage_name] = completed_future.result()
+                        except BaseException as stage_error:
+                            if first_error is None:
+                                first_error = stage_error
+                                print(f"Stage {stage_name} failed, cancelling remaining stages: {stage_error}")
+                            self.cancel()
+            except BaseException:
+                self.cancel()
+                raise
+                
+        if first_error is not None:
+            raise first_error
+        if self.cancellation_event.is_set():
+            raise StageCancelledError(f"Pipeline cancelled before stages {pending_stages} could run")
+        if pending_stages:
+            raise RuntimeError(f"Stages {pending_stages} have dependencies that never completed")
+        return finished_actions.get(list(self.stages)[-1]) if self.stages else None
+        
+    def _ready_stages(self, pending_stages: List[str], finished_actions: Dict[str, Optional[str]]) -> List[str]:
+        return [
+            stage_name for stage_name in pending_stages
+            if all(dependency in finished_actions for dependency in self.stages[stage_name].dependencies)
+        ]
+        
+    def _run_stage(self, stage: PipelineStage, shared: Dict[str, Any]) -> Optional[str]:
+        stage_node = copy.copy(stage.node)
+        stage_node.set_params({})
+        self._instrument_node(stage_node, stage.name)
+        
+        if self.profiler:
+            with self.profiler.stage(stage.name) as stage_arguments:
+                stage_action = self._execute_stage(stage_node, stage.name, shared)
+                stage_arguments["action"] = stage_action
+            return stage_action
+        return self._execute_stage(stage_node, stage.name, shared)
+        
+    def _execute_stage(self, stage_node: BaseNode, stage_name: str, shared: Dict[str, Any]) -> Optional[str]:
+        if self.checkpoint_store and stage_name in self.completed_stages:
+            print(f"Restoring {stage_name} output from checkpoint")
+            return self.checkpoint_store.restore_stage(stage_name, shared)
+            
+        stage_action = stage_node._run(shared)
+        if self.checkpoint_store:
+            self.checkpoint_store.save_stage(
+                stage_name, shared, getattr(stage_node, "checkpoint_keys", ()), stage_action
+            )
+        return stage_action
+        
+    def _instrument_node(self, stage_node: BaseNode, stage_name: str) -> None:
+        def wrap_phase(phase_name, phase_method, category):
+            def instrumented_phase(*phase_arguments):
+                if self.cancellation_event.is_set():
+                    raise StageCancelledError(f"{stage_name} cancelled before {phase_name}")
+                if not self.profiler:
+                    return phase_method(*phase_arguments)
+                with self.profiler.attribute_thread(stage_name), self.profiler.span(f"{stage_name}.{phase_name}", category):
+                    return phase_method(*phase_arguments)
+            return instrumented_phase
+            
+        stage_node.prep = wrap_phase("prep", stage_node.prep, "node")
+        stage_node._exec = wrap_phase("exec", stage_node._exec, "node")
+        stage_node.post = wrap_phase("post", stage_node.post, "node")
+        if isinstance(stage_node, BatchNode):
+            stage_node.exec = wrap_phase("item", stage_node.exec, "batch_item")
@@ -1,35 +1,85 @@
-from pocketflow import Flow
+from pathlib import Path
 from documentation_processors import (
     CodebaseRetriever,
+    FileSummarizer,
+    ChangeDetector,
     ConceptIdentifier,
     RelationshipAnalyzer,
     ChapterOrganizer,
+    SpeculativeChapterDrafter,
     ContentGenerator,
-    DocumentationAssembler
+    DocumentationAssembler,
+    LanguageFanoutGenerator
 )
+from workflow_checkpoints import WorkflowCheckpointStore
+from pipeline_executor import StageGraphExecutor
+from pipeline_profiler import PipelineProfiler, activate_profiler
 
 class DocumentationWorkflow:
     def __init__(self):
         self.processing_pipeline = None
         
-    def create_processing_pipeline(self):
+    def create_processing_pipeline(self, checkpoint_store=None, completed_stages=None, profiler=None, stage_workers=4, language_fanout_mode="generate"):
         codebase_retriever = CodebaseRetriever()
+        file_summarizer = FileSummarizer(max_retries=3, wait=5)
+        change_detector = ChangeDetector()
         concept_identifier = ConceptIdentifier(max_retries=5, wait=20)
         relationship_analyzer = RelationshipAnalyzer(max_retries=5, wait=20)
         chapter_organizer = ChapterOrganizer(max_retries=5, wait=20)
+        chapter_drafter = SpeculativeChapterDrafter(max_retries=2, wait=10)
         content_generator = ContentGenerator(max_retries=5, wait=20)
         documentation_assembler = DocumentationAssembler()
+        language_fanout = LanguageFanoutGenerator()
         
-        codebase_retriever >> concept_identifier
-        concept_identifier >> relationship_analyzer
-        relationship_analyzer >> chapter_organizer
-        chapter_organizer >> content_generator
-        content_generator >> documentation_assembler
+        self.processing_pipeline = StageGraphExecutor(
+            checkpoint_store=checkpoint_store,
+            completed_stages=completed_stages,
+            profiler=profiler,
+            max_workers=stage_workers
+        )
+        structure_reused = (change_detector, "reuse_structure")
         
-        self.processing_pipeline = Flow(start=codebase_retriever)
+        self.processing_pipeline.add_stage(codebase_retriever)
+        self.processing_pipeline.add_stage(file_summarizer, depends_on=[codebase_retriever])
+        self.processing_pipeline.add_stage(change_detector, depends_on=[codebase_retriever])
+        self.processing_pipeline.add_stage(concept_identifier, depends_on=[change_detector], bypassed_by=structure_reused)
+        self.processing_pipeline.add_stage(chapter_drafter, depends_on=[concept_identifier, file_summarizer], bypassed_by=structure_reused)
+        self.processing_pipeline.add_stage(relationship_analyzer, depends_on=[concept_identifier, file_summarizer], bypassed_by=structure_reused)
+        self.processing_pipeline.add_stage(chapter_organizer, depends_on=[relationship_analyzer], bypassed_by=structure_reused)
+        self.processing_pipeline.add_stage(content_generator, depends_on=[chapter_organizer, chapter_drafter, file_summarizer])
+        self.processing_pipeline.add_stage(documentation_assembler, depends_on=[content_generator])
+        if language_fanout_mode == "translate":
+            self.processing_pipeline.add_stage(language_fanout, depends_on=[content_generator])
+        else:
+            self.processing_pipeline.add_stage(language_fanout, depends_on=[chapter_organizer, file_summarizer])
         return self.processing_pipeline
         
     def execute(self, workspace_configuration):
-        pipeline = self.create_processing_pipeline()
-        pipeline.run(workspace_configuration)
+        checkpoint_store = None
+        completed_stages = []
+        checkpoint_directory = workspace_configuration.get("checkpoint_directory")
+        
+        if checkpoint_directory:
+            checkpoint_store = WorkflowCheckpointStore(checkpoint_directory)
+            completed_stages = checkpoint_store.start_run(
+                workspace_configuration, workspace_configuration.get("resume_from_checkpoint", False)
+            )
+            
+        profile_output_path = workspace_configuration.get("profile_output_path")
+        profiler = PipelineProfiler() if profile_output_path else None
+        pipeline = self.create_processing_pipeline(
+            checkpoint_store, completed_stages, profiler, workspace_configuration.get("pipeline_stage_workers", 4),
+            workspace_configuration.get("language_fanout_mode", "generate")
+        )
+        
+        activate_profiler(profiler)
+        try:
+            pipeline.run(workspace_configuration)
+        finally:
+            activate_profiler(None)
+            if profiler:
+                profiler.write_trace(profile_output_path)
+                profile_summary = profiler.format_summary()
+                Path(profile_output_path).with_suffix(".txt").write_text(profile_summary + "\n", encoding="utf-8")
+                print(f"\nPipeline profile (trace: {profile_output_path}):\n{profile_summary}")
         return workspace_configuration
@@ -0,0 +1,205 @@
+import os
+import sys
+import json
+import time
+import threading
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+STAGE_CATEGORY = "stage"
+
+def peak_resident_memory_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    peak_usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_usage if sys.platform == "darwin" else peak_usage * 1024
+
+def format_byte_count(byte_count: Optional[int]) -> str:
+    if byte_count is None:
+        return "n/a"
+    for unit in ("B", "KB", "MB"):
+        if byte_count < 1024:
+            return f"{byte_count:.0f}{unit}" if unit == "B" else f"{byte_count:.1f}{unit}"
+        byte_count /= 1024
+    return f"{byte_count:.1f}GB"
+
+class PipelineProfiler:
+    def __init__(self):
+        self.origin_time = time.perf_counter()
+        self.origin_cpu_time = time.process_time()
+        self.process_id = os.getpid()
+        self.trace_events = []
+        self.stage_statistics: Dict[str, Dict[str, Any]] = {}
+        self.active_stages = []
+        self.thread_stage = threading.local()
+        self.profiler_lock = threading.Lock()
+        
+    @contextmanager
+    def span(self, span_name: str, category: str, **span_arguments):
+        start_wall = time.perf_counter()
+        start_cpu = time.thread_time()
+        try:
+            yield span_arguments
+        finally:
+            end_wall = time.perf_counter()
+            cpu_seconds = time.thread_time() - start_cpu
+            span_arguments["cpu_ms"] = round(cpu_seconds * 1000, 3)
+            trace_event = {
+                "name": span_name,
+                "cat": category,
+                "ph": "X",
+                "ts": round((start_wall - self.origin_time) * 1e6, 1),
+                "dur": round((end_wall - start_wall) * 1e6, 1),
+                "pid": self.process_id,
+                "tid": threading.get_ident(),
+                "args": span_arguments,
+            }
+            with self.profiler_lock:
+                self.trace_events.append(trace_event)
+                
+    def _stage_totals(self, stage_name: str) -> Dict[str, Any]:
+        return self.stage_statistics.setdefault(
+            stage_name, {"wall_seconds": 0.0, "cpu_seconds": 0.0, "bytes_in": 0, "bytes_out": 0, "rss_growth": None, "model_calls": 0}
+        )
+        
+    @contextmanager
+    def stage(self, stage_name: str, **span_arguments):
+        with self.profiler_lock:
+            stage_totals = self._stage_totals(stage_name)
+            start_stage_cpu = stage_totals["cpu_seconds"]
+            self.active_stages.append(stage_name)
+        start_wall = time.perf_counter()
+        start_peak_rss = peak_resident_memory_bytes()
+        stage_arguments = span_arguments
+        try:
+            with self.attribute_thread(stage_name), self.span(stage_name, STAGE_CATEGORY, **span_arguments) as stage_arguments:
+                yield stage_arguments
+        finally:
+            with self.profiler_lock:
+                stage_totals["wall_seconds"] += time.perf_counter() - start_wall
+                end_peak_rss = peak_resident_memory_bytes()
+                if start_peak_rss is not None and end_peak_rss is not None:
+                    stage_totals["rss_growth"] = (stage_totals["rss_growth"] or 0) + end_peak_rss - start_peak_rss
+                stage_arguments.update(
+                    cpu_ms=round((stage_totals["cpu_seconds"] - start_stage_cpu) * 1000, 3),
+                    bytes_in=stage_totals["bytes_in"], bytes_out=stage_totals["bytes_out"], rss_growth_bytes=stage_totals["rss_growth"]
+                )
+                self.active_stages.remove(stage_name)
+                
+    @contextmanager
+    def attribute_thread(self, stage_name: str):
+        previous_stage = getattr(self.thread_stage, "name", None)
+        switches_stage = previous_stage != stage_name
+        if switches_stage:
+            self._charge_thread_cpu(previous_stage)
+        self.thread_stage.name = stage_name
+        try:
+            yield
+        finally:
+            if switches_stage:
+                self._charge_thread_cpu(stage_name)
+            self.thread_stage.name = previous_stage
+            
+    def _charge_thread_cpu(self, stage_name: Optional[str]) -> None:
+        current_thread_cpu = time.thread_time()
+        charged_seconds = current_thread_cpu - getattr(self.thread_stage, "cpu_mark", current_thread_cpu)
+        self.thread_stage.cpu_mark = current_thread_cpu
+        if stage_name is None:
+            return
+        with self.profiler_lock:
+            self._stage_totals(stage_name)["cpu_seconds"] += charged_seconds
+            
+    def current_stage(self) -> Optional[str]:
+        thread_stage_name = getattr(self.thread_stage, "name", None)
+        if thread_stage_name:
+            return thread_stage_name
+        with self.profiler_lock:
+            return self.active_stages[0] if len(self.active_stages) == 1 else None
+            
+    def record_transfer(self, bytes_in: int = 0, bytes_out: int = 0, model_call: bool = False) -> None:
+        stage_name = self.current_stage()
+        with self.profiler_lock:
+            stage_totals = self.stage_statistics.get(stage_name)
+            if stage_totals is None:
+                return
+            stage_totals["bytes_in"] += bytes_in
+            stage_totals["bytes_out"] += bytes_out
+            stage_totals["model_calls"] += int(model_call)
+            
+    def write_trace(self, trace_path: str) -> None:
+        trace_file_path = Path(trace_path)
+        trace_file_path.parent.mkdir(parents=True, exist_ok=True)
+        metadata_events = [
+            {"name": "process_name", "ph": "M", "pid": self.process_id, "tid": 0, "args": {"name": "codestory pipeline"}},
+        ]
+        with self.profiler_lock:
+            trace_events = sorted(self.trace_events, key=lambda event: event["ts"])
+        with open(trace_file_path, "w", encoding="utf-8") as trace_file:
+            json.dump({"traceEvents": metadata_events + trace_events, "displayTimeUnit": "ms"}, trace_file, default=str)
+            
+    def format_summary(self) -> str:
+        total_wall = time.perf_counter() - self.origin_time
+        summary_lines = [
+            f"{'Stage':<24}{'Wall s':>9}{'CPU s':>9}{'Calls':>7}{'Bytes in':>11}{'Bytes out':>11}{'RSS growth':>12}",
+        ]
+        for stage_name, stage_totals in self.stage_statistics.items():
+            summary_lines.append(
+                f"{stage_name:<24}{stage_totals['wall_seconds']:>9.2f}{stage_totals['cpu_seconds']:>9.2f}{stage_totals['model_calls']:>7}"
+                f"{format_byte_count(stage_totals['bytes_in']):>11}{format_byte_count(stage_totals['bytes_out']):>11}"
+                f"{format_byte_count(stage_totals['rss_growth']):>12}"
+            )
+            
+        span_totals = {}
+        with self.profiler_lock:
+            for trace_event in self.trace_events:
+                if trace_event["cat"] != STAGE_CATEGORY:
+                    span_count, span_duration = span_totals.get((trace_event["cat"], trace_event["name"]), (0, 0.0))
+                    span_totals[(trace_event["cat"], trace_event["name"])] = (span_count + 1, span_duration + trace_event["dur"] / 1e6)
+        if span_totals:
+            summary_lines.append("")
+            summary_lines.append(f"{'Span':<40}{'Count':>7}{'Total s':>10}{'Mean ms':>10}")
+            for (category, span_name), (span_count, span_duration) in sorted(span_totals.items(), key=lambda item: -item[1][1]):
+                summary_lines.append(f"{category + ':' + span_name:<40}{span_count:>7}{span_duration:>10.2f}{1000 * span_duration / span_count:>10.1f}")
+                
+        summary_lines.append("")
+        summary_lines.append("CPU s sums the thread CPU time of the stage and of the pool workers attributed to it.")
+        summary_lines.append("RSS growth is how far the process peak RSS rose while the stage ran; concurrent stages can share it.")
+        summary_lines.append(f"Total wall time: {total_wall:.2f}s, process CPU time: {time.process_time() - self.origin_cpu_time:.2f}s, peak RSS: {format_byte_count(peak_resident_memory_bytes())}")
+        return "\n".join(summary_lines)
+
+_active_profiler: Optional[PipelineProfiler] = None
+
+def activate_profiler(profiler: Optional[PipelineProfiler]) -> None:
+    global _active_profiler
+    _active_profiler = profiler
+
+def get_active_profiler() -> Optional[PipelineProfiler]:
+    return _active_profiler
+
+def profile_span(span_name: str, category: str, **span_arguments):
+    profiler = _active_profiler
+    if profiler is None:
+        return nullcontext(span_arguments)
+    return profiler.span(span_name, category, **span_arguments)
+
+def attribute_to_current_stage(task: Callable) -> Callable:
+    profiler = _active_profiler
+    stage_name = profiler.current_stage() if profiler is not None else None
+    if stage_name is None:
+        return task
+        
+    def attributed_task(*task_arguments, **task_keyword_arguments):
+        with profiler.attribute_thread(stage_name):
+            return task(*task_arguments, **task_keyword_arguments)
+    return attributed_task
+
+def record_transfer(bytes_in: int = 0, bytes_out: int = 0, model_call: bool = False) -> None:
+    profiler = _active_profiler
+    if profiler is not None:
+        profiler.record_transfer(bytes_in, bytes_out, model_call)
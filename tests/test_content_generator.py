@@ -0,0 +1,73 @@
+import contextlib
+import io
+import json
+
+import pytest
+
+from ai_interface.model_connector import install_model_connector
+from ai_interface.simulated_connector import SimulatedModelConnector
+from pipeline_orchestrator import DocumentationWorkflow
+from tutorial_builder import parse_command_arguments, initialize_workspace_configuration
+
+def _write_project(project_directory):
+    project_directory.mkdir()
+    for file_number in range(4):
+        (project_directory / f"module_{file_number}.py").write_text(
+            f"def handler_{file_number}(value):\n    return value + {file_number}\n", encoding="utf-8"
+        )
+
+def _run_workflow(project_directory, output_directory, extra_arguments):
+    simulated_connector = SimulatedModelConnector(concept_count=4)
+    previous_connector = install_model_connector(simulated_connector)
+    parsed_args = parse_command_arguments([
+        "--dir", str(project_directory), "--output", str(output_directory), "--no-cache",
+        "--chapter-workers", "4", "--retrieval-context-chars", "20000", *extra_arguments,
+    ])
+    run_log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(run_log):
+            workspace_config = initialize_workspace_configuration(parsed_args, None)
+            DocumentationWorkflow().execute(workspace_config)
+    finally:
+        install_model_connector(previous_connector)
+    return simulated_connector.request_count, run_log.getvalue()
+
+def test_unchanged_incremental_run_skips_outline_and_lexical_index(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_project(tmp_path / "project")
+    first_calls, _ = _run_workflow(tmp_path / "project", tmp_path / "output", ["--incremental"])
+    
+    second_calls, second_log = _run_workflow(tmp_path / "project", tmp_path / "output", ["--incremental"])
+    
+    assert first_calls > 0
+    assert second_calls == 0
+    assert "Built lexical index" not in second_log
+
+def test_resume_with_checkpointed_chapters_skips_outline_and_lexical_index(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_project(tmp_path / "project")
+    _run_workflow(tmp_path / "project", tmp_path / "output", ["--resume"])
+    run_state_path = next((tmp_path / "output" / ".runs").glob("*/run_state.json"))
+    run_state = json.loads(run_state_path.read_text(encoding="utf-8"))
+    run_state["completed_stages"] = [
+        stage_name for stage_name in run_state["completed_stages"]
+        if stage_name not in ("ContentGenerator", "DocumentationAssembler", "LanguageFanoutGenerator")
+    ]
+    run_state_path.write_text(json.dumps(run_state), encoding="utf-8")
+    
+    resumed_calls, resumed_log = _run_workflow(tmp_path / "project", tmp_path / "output", ["--resume"])
+    
+    assert resumed_calls == 0
+    assert "Reusing checkpointed chapter" in resumed_log
+    assert "Built lexical index" not in resumed_log
+
+def test_lexical_index_is_built_once_for_drafts_chapters_and_languages(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_project(tmp_path / "project")
+    
+    _, run_log = _run_workflow(tmp_path / "project", tmp_path / "output", ["--speculative-chapters", "--languages", "english,hindi,telugu"])
+    
+    assert run_log.count("Built lexical index") == 1
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,81 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import pipeline_profiler
+from pipeline_profiler import PipelineProfiler, activate_profiler, attribute_to_current_stage, record_transfer
+
+STAGE_CPU_SECONDS = 0.1
+
+def _run_stage_with_pool(profiler, stage_name, call_count, stage_barrier):
+    with profiler.attribute_thread(stage_name), profiler.stage(stage_name):
+        stage_barrier.wait()
+        with ThreadPoolExecutor(max_workers=2) as worker_pool:
+            list(worker_pool.map(attribute_to_current_stage(lambda _: record_transfer(model_call=True)), range(call_count)))
+
+def test_pool_worker_calls_are_attributed_to_their_stage_while_stages_overlap():
+    profiler = PipelineProfiler()
+    stage_barrier = threading.Barrier(2)
+    activate_profiler(profiler)
+    try:
+        with ThreadPoolExecutor(max_workers=2) as stage_pool:
+            stage_futures = [
+                stage_pool.submit(_run_stage_with_pool, profiler, "ContentGenerator", 3, stage_barrier),
+                stage_pool.submit(_run_stage_with_pool, profiler, "FileSummarizer", 5, stage_barrier),
+            ]
+            for stage_future in stage_futures:
+                stage_future.result()
+    finally:
+        activate_profiler(None)
+        
+    assert profiler.stage_statistics["ContentGenerator"]["model_calls"] == 3
+    assert profiler.stage_statistics["FileSummarizer"]["model_calls"] == 5
+
+def _burn_thread_cpu(cpu_seconds):
+    start_cpu = time.thread_time()
+    while time.thread_time() - start_cpu < cpu_seconds:
+        pass
+
+def _run_stage_burning_cpu(profiler, stage_name, stage_barrier):
+    with profiler.stage(stage_name):
+        stage_barrier.wait()
+        _burn_thread_cpu(STAGE_CPU_SECONDS)
+        with ThreadPoolExecutor(max_workers=1) as worker_pool:
+            worker_pool.submit(attribute_to_current_stage(_burn_thread_cpu), STAGE_CPU_SECONDS).result()
+
+def test_overlapping_stages_are_charged_only_their_own_thread_cpu():
+    profiler = PipelineProfiler()
+    stage_barrier = threading.Barrier(2)
+    activate_profiler(profiler)
+    try:
+        with ThreadPoolExecutor(max_workers=2) as stage_pool:
+            stage_futures = [
+                stage_pool.submit(_run_stage_burning_cpu, profiler, stage_name, stage_barrier)
+                for stage_name in ("ContentGenerator", "FileSummarizer")
+            ]
+            for stage_future in stage_futures:
+                stage_future.result()
+    finally:
+        activate_profiler(None)
+        
+    stage_cpu_seconds = [profiler.stage_statistics[stage_name]["cpu_seconds"] for stage_name in ("ContentGenerator", "FileSummarizer")]
+    for cpu_seconds in stage_cpu_seconds:
+        assert 2 * STAGE_CPU_SECONDS <= cpu_seconds < 3 * STAGE_CPU_SECONDS
+    assert sum(stage_cpu_seconds) <= time.process_time() - profiler.origin_cpu_time
+
+@pytest.mark.skipif(pipeline_profiler.resource is None, reason="peak RSS needs the resource module")
+def test_summary_reports_rss_growth_per_stage():
+    profiler = PipelineProfiler()
+    expected_growth = 32 * 1024 * 1024
+    buffer_size_past_previous_peak = pipeline_profiler.peak_resident_memory_bytes() + expected_growth
+    with profiler.stage("ContentGenerator"):
+        growth_buffer = b"x" * buffer_size_past_previous_peak
+    del growth_buffer
+    
+    assert "RSS growth" in profiler.format_summary().splitlines()[0]
+    assert profiler.stage_statistics["ContentGenerator"]["rss_growth"] >= expected_growth * 0.9
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
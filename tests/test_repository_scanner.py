@@ -0,0 +1,140 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+
+from file_operations.repository_scanner import scan_github_repository
+
+REPOSITORY_FILES = {
+    "src/app.py": "def main():\n    return 1\n",
+    "src/util.py": "def helper():\n    return 2\n",
+    "src/nested/deep.py": "VALUE = 3\n",
+    "docs/readme.txt": "Not selected by the include pattern\n",
+    "big.py": "x = 1\n" * 100,
+}
+MAX_FILE_SIZE = 200
+
+class FakeGitHubServer:
+    def __init__(self, truncated_tree: bool = False):
+        self.truncated_tree = truncated_tree
+        self.requested_paths = []
+        self.requests_lock = threading.Lock()
+        self.http_server = ThreadingHTTPServer(("127.0.0.1", 0), self._build_handler())
+        self.base_url = f"http://127.0.0.1:{self.http_server.server_address[1]}"
+        self.server_thread = threading.Thread(target=self.http_server.serve_forever, daemon=True)
+        
+    def __enter__(self):
+        self.server_thread.start()
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.http_server.shutdown()
+        self.http_server.server_close()
+        return False
+        
+    def requests_matching(self, path_prefix: str):
+        return [path for path in self.requested_paths if path.startswith(path_prefix)]
+        
+    def _tree_payload(self):
+        return {
+            "truncated": self.truncated_tree,
+            "tree": [{"path": "src", "type": "tree"}, {"path": "src/nested", "type": "tree"}, {"path": "docs", "type": "tree"}] + [
+                {"path": file_path, "type": "blob", "size": len(file_content)}
+                for file_path, file_content in REPOSITORY_FILES.items()
+            ],
+        }
+        
+    def _contents_payload(self, directory_path: str):
+        directory_prefix = f"{directory_path}/" if directory_path else ""
+        listed_items = {}
+        for file_path, file_content in REPOSITORY_FILES.items():
+            if not file_path.startswith(directory_prefix):
+                continue
+            remaining_parts = file_path[len(directory_prefix):].split("/")
+            if len(remaining_parts) == 1:
+                listed_items[file_path] = {
+                    "type": "file", "path": file_path, "size": len(file_content),
+                    "download_url": f"{self.base_url}/owner/project/main/{file_path}",
+                }
+            else:
+                child_directory = directory_prefix + remaining_parts[0]
+                listed_items[child_directory] = {"type": "dir", "path": child_directory, "size": 0, "download_url": None}
+        return list(listed_items.values())
+        
+    def _build_handler(self):
+        fake_server = self
+        
+        class FakeGitHubHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                request_path = urlsplit(self.path).path
+                with fake_server.requests_lock:
+                    fake_server.requested_paths.append(request_path)
+                    
+                if request_path == "/repos/owner/project/git/trees/main":
+                    return self._send(json.dumps(fake_server._tree_payload()), "application/json")
+                if request_path.startswith("/repos/owner/project/contents"):
+                    directory_path = request_path[len("/repos/owner/project/contents"):].strip("/")
+                    return self._send(json.dumps(fake_server._contents_payload(directory_path)), "application/json")
+                if request_path.startswith("/owner/project/main/"):
+                    file_path = request_path[len("/owner/project/main/"):]
+                    if file_path in REPOSITORY_FILES:
+                        return self._send(REPOSITORY_FILES[file_path], "text/plain")
+                self.send_error(404)
+                
+            def _send(self, body: str, content_type: str):
+                encoded_body = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(encoded_body)))
+                self.end_headers()
+                self.wfile.write(encoded_body)
+                
+            def log_message(self, *log_arguments):
+                pass
+                
+        return FakeGitHubHandler
+
+def _scan(fake_server: FakeGitHubServer, monkeypatch):
+    monkeypatch.setenv("GITHUB_API_URL", fake_server.base_url)
+    monkeypatch.setenv("GITHUB_RAW_URL", fake_server.base_url)
+    return scan_github_repository(
+        "https://github.com/owner/project",
+        max_file_size=MAX_FILE_SIZE,
+        include_patterns={"*.py"},
+        use_response_cache=False,
+    )
+
+SELECTED_FILES = {"src/app.py", "src/util.py", "src/nested/deep.py"}
+
+def test_tree_scan_uses_one_recursive_listing_and_one_fetch_per_selected_blob(monkeypatch):
+    with FakeGitHubServer() as fake_server:
+        scan_result = _scan(fake_server, monkeypatch)
+        
+    assert set(scan_result["files"]) == SELECTED_FILES
+    assert all(scan_result["files"][file_path] == REPOSITORY_FILES[file_path] for file_path in SELECTED_FILES)
+    assert fake_server.requests_matching("/repos/owner/project/git/trees/") == ["/repos/owner/project/git/trees/main"]
+    assert fake_server.requests_matching("/repos/owner/project/contents") == []
+    assert sorted(fake_server.requests_matching("/owner/project/main/")) == sorted(
+        f"/owner/project/main/{file_path}" for file_path in SELECTED_FILES
+    )
+    assert len(fake_server.requested_paths) == 1 + len(SELECTED_FILES)
+    assert scan_result["stats"]["skipped_details"] == [("big.py", len(REPOSITORY_FILES["big.py"]))]
+
+def test_truncated_tree_falls_back_to_per_directory_listing(monkeypatch):
+    with FakeGitHubServer(truncated_tree=True) as fake_server:
+        scan_result = _scan(fake_server, monkeypatch)
+        
+    assert set(scan_result["files"]) == SELECTED_FILES
+    assert fake_server.requests_matching("/repos/owner/project/git/trees/") == ["/repos/owner/project/git/trees/main"]
+    assert sorted(fake_server.requests_matching("/repos/owner/project/contents")) == [
+        "/repos/owner/project/contents/",
+        "/repos/owner/project/contents/docs",
+        "/repos/owner/project/contents/src",
+        "/repos/owner/project/contents/src/nested",
+    ]
+    assert len(fake_server.requests_matching("/owner/project/main/")) == len(SELECTED_FILES)
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from code_analysis import source_compactor
+from code_analysis.source_compactor import CompactionCache, compact_file_collection, compact_source
+
+NUMPY_DOCSTRING_SOURCE = '''def scale(values, factor):
+    """Scale every value.
+    
+    Parameters
+    ----------
+    values : list of float
+        Values to scale.
+        
+    Returns
+    -------
+    list of float
+    """
+    # ------------------------------------------
+    return [value * factor for value in values]
+
+RULE_TEMPLATE = """
+# ==========
+-- ----------
+"""
+'''
+
+def test_numpy_docstring_underlines_survive_compaction():
+    compacted_source = compact_source("stats.py", NUMPY_DOCSTRING_SOURCE)
+    
+    assert "    Parameters\n    ----------\n" in compacted_source
+    assert "    Returns\n    -------\n" in compacted_source
+    assert "# ------------------------------------------" not in compacted_source
+
+def test_banner_like_lines_inside_python_strings_are_kept():
+    compacted_source = compact_source("stats.py", NUMPY_DOCSTRING_SOURCE)
+    
+    assert 'RULE_TEMPLATE = """\n# ==========\n-- ----------\n"""' in compacted_source
+
+@pytest.mark.parametrize("file_path, banner_line, kept_line", [
+    ("query.sql", "-- ------------------", "SELECT 1;"),
+    ("widget.js", "// ==================", "const total = a - b;"),
+    ("widget.js", "/* ***************** */", "const total = a - b;"),
+    ("build.sh", "# ~~~~~~~~~~~~~~~~~~", "echo done"),
+])
+def test_banner_prefixes_follow_the_file_language(file_path, banner_line, kept_line):
+    compacted_source = compact_source(file_path, f"{banner_line}\n{kept_line}\n")
+    
+    assert compacted_source == f"{kept_line}\n"
+
+@pytest.mark.parametrize("file_path", ["widget.js", "build.sh", "notes.py"])
+def test_dash_rules_are_not_banners_outside_dash_comment_languages(file_path):
+    source_text = "value = 1\n-- ------------------\n"
+    
+    assert "-- ------------------" in compact_source(file_path, source_text)
+
+def test_compacted_sources_are_reused_across_runs_from_the_cache_file(tmp_path, monkeypatch):
+    cache_file_path = tmp_path / "source_compaction_cache.json"
+    monkeypatch.setenv("SOURCE_COMPACTION_CACHE", str(cache_file_path))
+    file_collection = [("stats.py", NUMPY_DOCSTRING_SOURCE), ("query.sql", "-- ------------------\nSELECT 1;\n")]
+    first_collection, _ = compact_file_collection(file_collection, compaction_cache=CompactionCache())
+    assert len(json.loads(cache_file_path.read_text(encoding="utf-8"))) == 2
+    
+    def fail_compaction(*compaction_arguments):
+        raise AssertionError("cached source was compacted again")
+    monkeypatch.setattr(source_compactor, "compact_source", fail_compaction)
+    second_collection, _ = compact_file_collection(file_collection, compaction_cache=CompactionCache())
+    
+    assert second_collection == first_collection
+
+def test_cache_key_depends_on_trivial_body_setting():
+    assert CompactionCache.content_hash("stats.py", NUMPY_DOCSTRING_SOURCE, False) != CompactionCache.content_hash(
+        "stats.py", NUMPY_DOCSTRING_SOURCE, True
+    )
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
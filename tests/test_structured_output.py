@@ -0,0 +1,59 @@
+import pytest
+
+from ai_interface import structured_output
+from ai_interface.structured_output import StructuredOutputError, coerce_list, query_structured_output
+
+TRUNCATED_RESPONSE = """```yaml
+- name: First
+  files: [0, 1]
+- name: Second
+  files: [2
+```"""
+
+REPAIRED_RESPONSE = """```yaml
+- name: First
+  files: [0, 1]
+- name: Second
+  files: [2]
+```"""
+
+def _install_responses(monkeypatch, responses):
+    sent_prompts = []
+    
+    def fake_query(prompt, use_cache=True):
+        sent_prompts.append(prompt)
+        next_response = responses[len(sent_prompts) - 1]
+        if isinstance(next_response, Exception):
+            raise next_response
+        return next_response
+        
+    monkeypatch.setattr(structured_output, "query_language_model", fake_query)
+    return sent_prompts
+
+def test_truncated_output_is_repaired_before_dropping_lines(monkeypatch, capsys):
+    sent_prompts = _install_responses(monkeypatch, [TRUNCATED_RESPONSE, REPAIRED_RESPONSE])
+    
+    parsed_entries = query_structured_output("List the concepts", coerce_list)
+    
+    assert [entry["name"] for entry in parsed_entries] == ["First", "Second"]
+    assert len(sent_prompts) == 2
+    assert "dropping" not in capsys.readouterr().out
+
+def test_truncation_is_accepted_and_logged_when_repair_fails(monkeypatch, capsys):
+    sent_prompts = _install_responses(monkeypatch, [TRUNCATED_RESPONSE, RuntimeError("model unavailable")])
+    
+    parsed_entries = query_structured_output("List the concepts", coerce_list)
+    
+    assert [entry["name"] for entry in parsed_entries] == ["First", "Second"]
+    assert "files" not in parsed_entries[1]
+    assert len(sent_prompts) == 2
+    assert "dropping its last 1 line(s)" in capsys.readouterr().out
+
+def test_unparseable_output_still_raises(monkeypatch):
+    _install_responses(monkeypatch, ["no structure here", "still none"])
+    
+    with pytest.raises(StructuredOutputError):
+        query_structured_output("List the concepts", coerce_list)
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,59 @@
+import contextlib
+import io
+
+import pytest
+
+from tutorial_builder import parse_command_arguments, initialize_workspace_configuration
+from workflow_checkpoints import WorkflowCheckpointStore
+
+COMPLETED_STAGES = ["CodebaseRetriever", "ConceptIdentifier"]
+
+def _build_config(project_directory, output_directory, extra_arguments=()):
+    parsed_args = parse_command_arguments(["--dir", str(project_directory), "--output", str(output_directory), "--resume", *extra_arguments])
+    with contextlib.redirect_stdout(io.StringIO()):
+        return initialize_workspace_configuration(parsed_args, None)
+
+def _record_completed_run(checkpoint_store, workspace_config):
+    checkpoint_store.start_run(workspace_config, resume=False)
+    for stage_name in COMPLETED_STAGES:
+        checkpoint_store.save_stage(stage_name, workspace_config, [], None)
+
+def test_resume_with_unchanged_settings_restores_completed_stages(tmp_path):
+    workspace_config = _build_config(tmp_path / "project", tmp_path / "output")
+    checkpoint_store = WorkflowCheckpointStore(workspace_config["checkpoint_directory"])
+    _record_completed_run(checkpoint_store, workspace_config)
+    
+    resumed_config = _build_config(tmp_path / "project", tmp_path / "output")
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert checkpoint_store.start_run(resumed_config, resume=True) == COMPLETED_STAGES
+
+@pytest.mark.parametrize("changed_arguments", [
+    ["--graph-structure"],
+    ["--symbol-context"],
+    ["--compact-sources"],
+    ["--compact-sources", "--drop-trivial-bodies"],
+    ["--outline-large-files"],
+    ["--retrieval-context-chars", "20000"],
+    ["--context-budget", "1000"],
+    ["--concept-context-budget", "1000"],
+    ["--file-summaries"],
+    ["--previous-context-chars", "0"],
+    ["--speculative-chapters"],
+    ["--chapter-workers", "4"],
+    ["--languages", "english,hindi"],
+    ["--languages", "english,hindi", "--language-mode", "translate"],
+    ["--name", "renamed"],
+])
+def test_changed_output_setting_invalidates_completed_stages(tmp_path, changed_arguments):
+    workspace_config = _build_config(tmp_path / "project", tmp_path / "output")
+    checkpoint_store = WorkflowCheckpointStore(workspace_config["checkpoint_directory"])
+    _record_completed_run(checkpoint_store, workspace_config)
+    
+    changed_config = _build_config(tmp_path / "project", tmp_path / "output", changed_arguments)
+    assert WorkflowCheckpointStore.compute_fingerprint(changed_config) != WorkflowCheckpointStore.compute_fingerprint(workspace_config)
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert checkpoint_store.start_run(changed_config, resume=True) == []
+    assert not (checkpoint_store.stages_directory / "CodebaseRetriever.json").exists()
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
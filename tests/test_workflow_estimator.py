@@ -0,0 +1,48 @@
+import contextlib
+import io
+
+import pytest
+
+from ai_interface.model_connector import install_model_connector
+from ai_interface.simulated_connector import SimulatedModelConnector
+from pipeline_orchestrator import DocumentationWorkflow
+from tutorial_builder import parse_command_arguments, initialize_workspace_configuration
+from workflow_estimator import estimate_workflow
+
+def _write_project(project_directory, file_count):
+    project_directory.mkdir()
+    for file_number in range(file_count):
+        (project_directory / f"module_{file_number}.py").write_text(
+            f"def handler_{file_number}(value):\n    return value + {file_number}\n", encoding="utf-8"
+        )
+
+def _build_config(project_directory, output_directory, max_abstractions):
+    parsed_args = parse_command_arguments([
+        "--dir", str(project_directory), "--output", str(output_directory),
+        "--max-abstractions", str(max_abstractions), "--no-cache",
+    ])
+    with contextlib.redirect_stdout(io.StringIO()):
+        return initialize_workspace_configuration(parsed_args, None)
+
+def _run_simulated(workspace_config, max_abstractions):
+    previous_connector = install_model_connector(SimulatedModelConnector(concept_count=max_abstractions))
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            DocumentationWorkflow().execute(workspace_config)
+    finally:
+        install_model_connector(previous_connector)
+    return len(workspace_config["generated_chapters"])
+
+@pytest.mark.parametrize("file_count, max_abstractions", [(8, 6), (3, 10)])
+def test_estimate_chapter_count_matches_simulated_run(tmp_path, monkeypatch, file_count, max_abstractions):
+    monkeypatch.chdir(tmp_path)
+    _write_project(tmp_path / "project", file_count)
+    
+    estimate = estimate_workflow(_build_config(tmp_path / "project", tmp_path / "estimate", max_abstractions))
+    simulated_chapter_count = _run_simulated(_build_config(tmp_path / "project", tmp_path / "output", max_abstractions), max_abstractions)
+    
+    assert estimate["file_count"] == file_count
+    assert estimate["chapter_count"] == simulated_chapter_count == min(max_abstractions, file_count)
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -4,6 +4,8 @@ import argparse
 import os
 from dotenv import load_dotenv
 from pipeline_orchestrator import DocumentationWorkflow
+from workflow_checkpoints import default_run_directory
+from workflow_estimator import estimate_workflow, format_estimate
 
 load_dotenv()
 
@@ -32,8 +34,11 @@ class DocumentationGenerator:
         workflow = DocumentationWorkflow()
         workflow.execute(self.workspace_settings)
         return self.workspace_settings.get("documentation_output_path", "")
+        
+    def estimate_documentation(self) -> Dict:
+        return estimate_workflow(self.workspace_settings)
 
-def parse_command_arguments():
+def parse_command_arguments(argument_list: Optional[List[str]] = None):
     argument_parser = argparse.ArgumentParser(
         description="Create comprehensive documentation for any software project"
     )
@@ -77,16 +82,48 @@ def parse_command_arguments():
         default=100000, 
         help="Maximum individual file size in bytes (default: 100KB)"
     )
+    argument_parser.add_argument(
+        "--download-mode",
+        choices=["tree", "archive"],
+        default="tree",
+        help="How to fetch remote repositories: per-file via the Git Trees API, or one streamed tarball (default: tree)"
+    )
+    argument_parser.add_argument(
+        "--download-workers",
+        type=int,
+        default=8,
+        help="Number of concurrent file downloads for remote repositories (default: 8)"
+    )
+    argument_parser.add_argument(
+        "--mirror-cache",
+        action="store_true",
+        help="Reuse a local git mirror of the repository across runs (see MIRROR_CACHE_DIR)"
+    )
     argument_parser.add_argument(
         "--language", 
         default="english", 
         help="Natural language for generated documentation (default: english)"
     )
+    argument_parser.add_argument(
+        "--languages",
+        help="Comma-separated languages (e.g. english,hindi,telugu); the analysis runs once in the first language and each language is written to its own subdirectory"
+    )
+    argument_parser.add_argument(
+        "--language-mode",
+        choices=["generate", "translate"],
+        default="generate",
+        help="With --languages, write each additional language's chapters from the source (generate) or translate the first language's chapters (translate) (default: generate)"
+    )
     argument_parser.add_argument(
         "--no-cache", 
         action="store_true", 
         help="Disable AI response caching for fresh results"
     )
+    argument_parser.add_argument(
+        "--no-github-cache",
+        action="store_true",
+        help="Disable the ETag cache for GitHub API listings"
+    )
     argument_parser.add_argument(
         "--max-abstractions", 
         type=int, 
@@ -94,7 +131,117 @@ def parse_command_arguments():
         help="Maximum number of core concepts to identify (default: 10)"
     )
     
-    return argument_parser.parse_args()
+    argument_parser.add_argument(
+        "--concept-context-budget",
+        type=int,
+        default=500000,
+        help="Characters of source per concept-identification prompt before switching to chunked map-reduce analysis (default: 500000)"
+    )
+    argument_parser.add_argument(
+        "--analysis-workers",
+        type=int,
+        default=4,
+        help="Number of parallel AI calls used for chunked concept identification (default: 4)"
+    )
+    argument_parser.add_argument(
+        "--file-summaries",
+        action="store_true",
+        help="Generate cached per-file digests and use them in place of full source when prompts exceed the context budget"
+    )
+    argument_parser.add_argument(
+        "--context-budget",
+        type=int,
+        default=200000,
+        help="Characters of source per relationship/chapter prompt before large files are replaced by digests (default: 200000)"
+    )
+    argument_parser.add_argument(
+        "--chapter-workers",
+        type=int,
+        default=1,
+        help="Generate chapters in parallel with this many workers, guided by a precomputed outline (default: 1, sequential)"
+    )
+    argument_parser.add_argument(
+        "--speculative-chapters",
+        action="store_true",
+        help="Start drafting chapters as soon as concepts are identified, then fill in chapter numbers and navigation links once the order is known"
+    )
+    argument_parser.add_argument(
+        "--stage-workers",
+        type=int,
+        default=4,
+        help="Run independent pipeline stages (e.g. file digests and concept identification) concurrently on this many workers (default: 4)"
+    )
+    argument_parser.add_argument(
+        "--previous-context-chars",
+        type=int,
+        default=12000,
+        help="Cap on the rolling summary of earlier chapters sent with each chapter prompt; 0 sends every previous chapter in full (default: 12000)"
+    )
+    argument_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Record stage and chapter checkpoints, and continue the previous checkpointed run for this source from its last completed stage and chapter"
+    )
+    argument_parser.add_argument(
+        "--run-dir",
+        help="Directory for stage and chapter checkpoints; checkpoints are only written with --resume or --run-dir (default with --resume: <output>/.runs/<source>)"
+    )
+    argument_parser.add_argument(
+        "--symbol-context",
+        action="store_true",
+        help="Feed concept analysis a symbol/import outline of each file and give chapters only the relevant definitions from large files"
+    )
+    argument_parser.add_argument(
+        "--graph-structure",
+        action="store_true",
+        help="Derive concept relationships and chapter order from the import graph, asking the AI only to label edges and confirm the order"
+    )
+    argument_parser.add_argument(
+        "--retrieval-context-chars",
+        type=int,
+        default=0,
+        help="Select each chapter's source context by lexical (BM25) relevance within this character budget instead of using whole files (0 disables)"
+    )
+    argument_parser.add_argument(
+        "--compact-sources",
+        action="store_true",
+        help="Strip license headers, comment banners and redundant whitespace from source files before they are placed in prompts"
+    )
+    argument_parser.add_argument(
+        "--drop-trivial-bodies",
+        action="store_true",
+        help="With --compact-sources, also collapse Python function bodies made only of trivial statements"
+    )
+    argument_parser.add_argument(
+        "--outline-large-files",
+        action="store_true",
+        help="Include files above --max-size as a streamed structural outline (definitions, imports, header docs) instead of skipping them"
+    )
+    argument_parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        metavar="TRACE_PATH",
+        help="Record per-stage timing, CPU, bytes and peak memory; writes a Chrome trace (default: <output>/pipeline_profile.json) plus a text summary"
+    )
+    argument_parser.add_argument(
+        "--estimate",
+        action="store_true",
+        help="Dry run: scan the source and build every stage's prompts without calling the AI, then report calls, tokens, cache hits, cost and projected time"
+    )
+    argument_parser.add_argument(
+        "--model-rpm",
+        type=int,
+        default=0,
+        help="Requests-per-minute limit of the AI API, used when projecting wall time (default: 0, unlimited)"
+    )
+    argument_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse the previous run's concepts and ordering when no files were added or removed, regenerating only chapters whose files changed"
+    )
+    
+    return argument_parser.parse_args(argument_list)
 
 def setup_authentication(parsed_args):
     api_token = None
@@ -105,6 +252,7 @@ def setup_authentication(parsed_args):
     return api_token
 
 def initialize_workspace_configuration(parsed_args, api_token):
+    target_languages = [language.strip() for language in (parsed_args.languages or parsed_args.language).split(",") if language.strip()]
     return {
         "source_repository": parsed_args.repo,
         "local_filesystem_path": parsed_args.dir,
@@ -114,10 +262,38 @@ def initialize_workspace_configuration(parsed_args, api_token):
         "included_file_patterns": set(parsed_args.include) if parsed_args.include else SUPPORTED_FILE_EXTENSIONS,
         "excluded_file_patterns": set(parsed_args.exclude) if parsed_args.exclude else IGNORED_DIRECTORIES,
         "maximum_file_size_bytes": parsed_args.max_size,
-        "target_language": parsed_args.language,
+        "oversized_file_mode": "outline" if parsed_args.outline_large_files else "skip",
+        "remote_download_mode": parsed_args.download_mode,
+        "remote_download_workers": parsed_args.download_workers,
+        "enable_mirror_cache": parsed_args.mirror_cache,
+        "target_language": target_languages[0],
+        "target_languages": target_languages,
+        "language_fanout_mode": parsed_args.language_mode,
         "enable_ai_caching": not parsed_args.no_cache,
+        "enable_github_cache": not parsed_args.no_github_cache,
         "maximum_concept_count": parsed_args.max_abstractions,
+        "concept_context_budget_chars": parsed_args.concept_context_budget,
+        "concept_map_workers": parsed_args.analysis_workers,
+        "enable_file_summaries": parsed_args.file_summaries,
+        "file_context_budget_chars": parsed_args.context_budget,
+        "chapter_generation_workers": parsed_args.chapter_workers,
+        "speculative_chapter_generation": parsed_args.speculative_chapters,
+        "previous_context_max_chars": parsed_args.previous_context_chars,
+        "pipeline_stage_workers": parsed_args.stage_workers,
+        "checkpoint_directory": parsed_args.run_dir or (default_run_directory(
+            parsed_args.output, parsed_args.repo or os.path.abspath(parsed_args.dir)
+        ) if parsed_args.resume else None),
+        "resume_from_checkpoint": parsed_args.resume,
+        "incremental_regeneration": parsed_args.incremental,
+        "use_symbol_context": parsed_args.symbol_context,
+        "structure_mode": "graph" if parsed_args.graph_structure else "llm",
+        "retrieval_context_budget_chars": parsed_args.retrieval_context_chars,
+        "compact_prompt_sources": parsed_args.compact_sources,
+        "drop_trivial_function_bodies": parsed_args.drop_trivial_bodies,
+        "model_requests_per_minute": parsed_args.model_rpm,
+        "profile_output_path": (parsed_args.profile or os.path.join(parsed_args.output, "pipeline_profile.json")) if parsed_args.profile is not None else None,
         "discovered_files": [],
+        "file_summaries": [],
         "identified_concepts": [],
         "concept_relationships": {},
         "chapter_sequence": [],
@@ -127,7 +303,7 @@ def initialize_workspace_configuration(parsed_args, api_token):
 
 def display_generation_status(configuration):
     source_description = configuration["source_repository"] or configuration["local_filesystem_path"]
-    language_name = configuration["target_language"].capitalize()
+    language_name = ", ".join(language.capitalize() for language in configuration["target_languages"])
     caching_status = "Disabled" if not configuration["enable_ai_caching"] else "Enabled"
     max_chapters = configuration["maximum_concept_count"]
     
@@ -146,6 +322,11 @@ def execute_documentation_generation():
     
     documentation_builder = DocumentationGenerator()
     documentation_builder.configure_workspace(workspace_config)
+    
+    if command_arguments.estimate:
+        print(f"\n📐 Estimate (no AI calls were made):\n{format_estimate(documentation_builder.estimate_documentation())}")
+        return None
+        
     output_location = documentation_builder.build_documentation()
     
     return output_location
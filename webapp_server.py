@@ -41,6 +41,7 @@ class GenerationRequest(BaseModel):
     max_file_size: int = 150000
     max_abstractions: int = 10
     use_cache: bool = True
+    use_mirror_cache: bool = False
 
 class GenerationStatus(BaseModel):
     task_id: str
@@ -122,6 +123,7 @@ async def run_generation(task_id: str, request: GenerationRequest):
             "maximum_file_size_bytes": request.max_file_size,
             "target_language": request.language,
             "enable_ai_caching": request.use_cache,
+            "enable_mirror_cache": request.use_mirror_cache,
             "maximum_concept_count": request.max_abstractions,
             "discovered_files": [],
             "identified_concepts": [],
@@ -0,0 +1,108 @@
+import os
+import re
+import json
+import shutil
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+FINGERPRINT_KEYS = (
+    "source_repository", "local_filesystem_path", "project_identifier", "included_file_patterns", "excluded_file_patterns",
+    "maximum_file_size_bytes", "oversized_file_mode", "target_language", "target_languages", "language_fanout_mode",
+    "maximum_concept_count", "concept_context_budget_chars", "enable_file_summaries", "file_context_budget_chars",
+    "retrieval_context_budget_chars", "previous_context_max_chars", "speculative_chapter_generation", "use_symbol_context",
+    "structure_mode", "compact_prompt_sources", "drop_trivial_function_bodies",
+)
+
+def default_run_directory(output_directory: str, source_location: str) -> str:
+    normalized_source = (source_location or "").rstrip("/\\")
+    readable_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", os.path.basename(normalized_source) or "project")
+    source_digest = hashlib.sha256(normalized_source.encode("utf-8")).hexdigest()[:10]
+    return os.path.join(output_directory, ".runs", f"{readable_name}-{source_digest}")
+
+class WorkflowCheckpointStore:
+    def __init__(self, run_directory: str):
+        self.run_directory = Path(run_directory)
+        self.stages_directory = self.run_directory / "stages"
+        self.chapters_directory = self.run_directory / "chapters"
+        self.state_file_path = self.run_directory / "run_state.json"
+        self.state_lock = threading.Lock()
+        
+    @staticmethod
+    def compute_fingerprint(workspace_config: Dict[str, Any]) -> str:
+        fingerprint_source = {}
+        for key in FINGERPRINT_KEYS:
+            value = workspace_config.get(key)
+            fingerprint_source[key] = sorted(value) if isinstance(value, (set, frozenset)) else value
+        fingerprint_source["parallel_chapter_generation"] = (workspace_config.get("chapter_generation_workers") or 1) > 1
+        return hashlib.sha256(json.dumps(fingerprint_source, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        
+    def start_run(self, workspace_config: Dict[str, Any], resume: bool) -> List[str]:
+        fingerprint = self.compute_fingerprint(workspace_config)
+        run_state = self._load_run_state()
+        
+        if resume and run_state.get("fingerprint") == fingerprint:
+            completed_stages = run_state.get("completed_stages", [])
+            print(f"Resuming run from {self.run_directory} ({len(completed_stages)} completed stages)")
+            return completed_stages
+            
+        if resume and run_state:
+            print("Warning: Previous run used different settings, starting a fresh run")
+            
+        shutil.rmtree(self.stages_directory, ignore_errors=True)
+        shutil.rmtree(self.chapters_directory, ignore_errors=True)
+        self._write_json(self.state_file_path, {"fingerprint": fingerprint, "completed_stages": []})
+        return []
+        
+    def save_stage(self, stage_name: str, workspace_config: Dict[str, Any], output_keys: List[str], stage_action: Optional[str]) -> None:
+        stage_outputs = {key: workspace_config.get(key) for key in output_keys}
+        self._write_json(self.stages_directory / f"{stage_name}.json", {"action": stage_action, "outputs": stage_outputs})
+        
+        with self.state_lock:
+            run_state = self._load_run_state()
+            completed_stages = run_state.setdefault("completed_stages", [])
+            if stage_name not in completed_stages:
+                completed_stages.append(stage_name)
+            self._write_json(self.state_file_path, run_state)
+            
+    def restore_stage(self, stage_name: str, workspace_config: Dict[str, Any]) -> Optional[str]:
+        with open(self.stages_directory / f"{stage_name}.json", "r", encoding="utf-8") as stage_file:
+            stage_record = json.load(stage_file)
+        workspace_config.update(stage_record["outputs"])
+        return stage_record["action"]
+        
+    @staticmethod
+    def chapter_key(*chapter_inputs: Any) -> str:
+        return hashlib.sha256(json.dumps(chapter_inputs, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+        
+    def load_chapter(self, chapter_number: int, chapter_key: str) -> Optional[str]:
+        chapter_path = self.chapters_directory / f"{chapter_number:02d}_{chapter_key}.md"
+        if not chapter_path.exists():
+            return None
+        return chapter_path.read_text(encoding="utf-8")
+        
+    def save_chapter(self, chapter_number: int, chapter_key: str, chapter_content: str) -> None:
+        self.chapters_directory.mkdir(parents=True, exist_ok=True)
+        chapter_path = self.chapters_directory / f"{chapter_number:02d}_{chapter_key}.md"
+        temporary_path = chapter_path.with_suffix(".tmp")
+        temporary_path.write_text(chapter_content, encoding="utf-8")
+        os.replace(temporary_path, chapter_path)
+        
+    def _load_run_state(self) -> Dict[str, Any]:
+        if not self.state_file_path.exists():
+            return {}
+        try:
+            with open(self.state_file_path, "r", encoding="utf-8") as state_file:
+                return json.load(state_file)
+        except Exception as state_error:
+            print(f"Warning: Failed to load run checkpoint state - {state_error}")
+            return {}
+            
+    @staticmethod
+    def _write_json(file_path: Path, payload: Any) -> None:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = file_path.with_suffix(".tmp")
+        with open(temporary_path, "w", encoding="utf-8") as output_file:
+            json.dump(payload, output_file, ensure_ascii=False)
+        os.replace(temporary_path, file_path)
@@ -0,0 +1,179 @@
+import io
+import os
+import copy
+import math
+import shutil
+import tempfile
+import threading
+import contextlib
+from typing import Any, Dict
+from ai_interface.model_connector import ResponseCacheManager, install_model_connector
+from ai_interface.simulated_connector import SimulatedModelConnector
+from pipeline_orchestrator import DocumentationWorkflow
+from pipeline_profiler import PipelineProfiler, activate_profiler, get_active_profiler
+
+CHARS_PER_TOKEN = 4
+MODEL_BASE_LATENCY_SECONDS = 1.5
+MODEL_INPUT_TOKENS_PER_SECOND = 20000.0
+MODEL_OUTPUT_TOKENS_PER_SECOND = 100.0
+INPUT_PRICE_PER_MILLION_TOKENS = 0.10
+OUTPUT_PRICE_PER_MILLION_TOKENS = 0.40
+ESTIMATE_CHAPTER_PARAGRAPHS = 24
+STAGE_CONCURRENCY_SETTINGS = {
+    "FileSummarizer": ("file_summary_workers", 8),
+    "ConceptIdentifier": ("concept_map_workers", 4),
+    "SpeculativeChapterDrafter": ("chapter_generation_workers", 1),
+    "ContentGenerator": ("chapter_generation_workers", 1),
+    "LanguageFanoutGenerator": ("chapter_generation_workers", 1),
+}
+
+class EstimatingModelConnector:
+    def __init__(self, response_cache: ResponseCacheManager, concept_count: int):
+        self.response_cache = response_cache
+        self.simulated_connector = SimulatedModelConnector(concept_count=concept_count, chapter_paragraphs=ESTIMATE_CHAPTER_PARAGRAPHS)
+        self.stage_requests: Dict[str, Dict[str, int]] = {}
+        self.requests_lock = threading.Lock()
+        
+    def generate_response(self, user_prompt: str, enable_caching: bool = True) -> str:
+        cached_response = self.response_cache.get_cached_response(user_prompt) if enable_caching else None
+        generated_text = cached_response or self.simulated_connector.generate_response(user_prompt)
+        
+        active_profiler = get_active_profiler()
+        stage_name = (active_profiler.current_stage() if active_profiler else None) or "Other"
+        with self.requests_lock:
+            stage_totals = self.stage_requests.setdefault(
+                stage_name, {"calls": 0, "cache_hits": 0, "prompt_chars": 0, "billable_prompt_chars": 0, "response_chars": 0}
+            )
+            stage_totals["calls"] += 1
+            stage_totals["prompt_chars"] += len(user_prompt)
+            if cached_response:
+                stage_totals["cache_hits"] += 1
+            else:
+                stage_totals["billable_prompt_chars"] += len(user_prompt)
+                stage_totals["response_chars"] += len(generated_text)
+        return generated_text
+
+def _project_stage_seconds(model_calls: int, input_tokens: int, output_tokens: int, concurrency: int, requests_per_minute: int) -> float:
+    if not model_calls:
+        return 0.0
+    average_call_seconds = (
+        MODEL_BASE_LATENCY_SECONDS
+        + input_tokens / model_calls / MODEL_INPUT_TOKENS_PER_SECOND
+        + output_tokens / model_calls / MODEL_OUTPUT_TOKENS_PER_SECOND
+    )
+    concurrent_seconds = math.ceil(model_calls / max(1, concurrency)) * average_call_seconds
+    if requests_per_minute > 0:
+        return max(concurrent_seconds, 60.0 * (model_calls - 1) / requests_per_minute + average_call_seconds)
+    return concurrent_seconds
+
+def estimate_workflow(workspace_config: Dict[str, Any]) -> Dict[str, Any]:
+    estimate_config = copy.deepcopy(workspace_config)
+    estimate_directory = tempfile.mkdtemp(prefix="codestory-estimate-")
+    estimate_config.update({
+        "documentation_output_path": os.path.join(estimate_directory, "output"),
+        "checkpoint_directory": None,
+        "resume_from_checkpoint": False,
+        "incremental_regeneration": False,
+        "profile_output_path": None,
+    })
+    
+    summary_cache_path = os.getenv("FILE_SUMMARY_CACHE", "file_summary_cache.json")
+    scratch_summary_cache_path = os.path.join(estimate_directory, "file_summary_cache.json")
+    if os.path.exists(summary_cache_path):
+        shutil.copyfile(summary_cache_path, scratch_summary_cache_path)
+    previous_summary_cache_setting = os.environ.get("FILE_SUMMARY_CACHE")
+    os.environ["FILE_SUMMARY_CACHE"] = scratch_summary_cache_path
+    
+    print("Scanning the source and building prompts for every stage without calling the AI...")
+    estimating_connector = EstimatingModelConnector(ResponseCacheManager(), workspace_config.get("maximum_concept_count", 10))
+    previous_connector = install_model_connector(estimating_connector)
+    profiler = PipelineProfiler()
+    activate_profiler(profiler)
+    try:
+        stage_pipeline = DocumentationWorkflow().create_processing_pipeline(
+            profiler=profiler, stage_workers=1, language_fanout_mode=estimate_config.get("language_fanout_mode", "generate")
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            stage_pipeline.run(estimate_config)
+    finally:
+        activate_profiler(None)
+        install_model_connector(previous_connector)
+        if previous_summary_cache_setting is None:
+            os.environ.pop("FILE_SUMMARY_CACHE", None)
+        else:
+            os.environ["FILE_SUMMARY_CACHE"] = previous_summary_cache_setting
+        shutil.rmtree(estimate_directory, ignore_errors=True)
+        
+    requests_per_minute = workspace_config.get("model_requests_per_minute", 0)
+    stage_estimates = []
+    for stage_name, stage_statistics in profiler.stage_statistics.items():
+        stage_requests = estimating_connector.stage_requests.get(stage_name, {})
+        model_calls = stage_requests.get("calls", 0) - stage_requests.get("cache_hits", 0)
+        input_tokens = stage_requests.get("billable_prompt_chars", 0) // CHARS_PER_TOKEN
+        output_tokens = stage_requests.get("response_chars", 0) // CHARS_PER_TOKEN
+        concurrency_key, default_concurrency = STAGE_CONCURRENCY_SETTINGS.get(stage_name, (None, 1))
+        concurrency = workspace_config.get(concurrency_key, default_concurrency) if concurrency_key else 1
+        if stage_name == "LanguageFanoutGenerator":
+            concurrency *= max(1, len(workspace_config.get("target_languages") or []) - 1)
+            
+        stage_estimates.append({
+            "stage": stage_name,
+            "calls": stage_requests.get("calls", 0),
+            "cache_hits": stage_requests.get("cache_hits", 0),
+            "prompt_bytes": stage_requests.get("prompt_chars", 0),
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "concurrency": concurrency,
+            "local_seconds": stage_statistics["wall_seconds"],
+            "projected_seconds": stage_statistics["wall_seconds"] + _project_stage_seconds(
+                model_calls, input_tokens, output_tokens, concurrency, requests_per_minute
+            ),
+        })
+        
+    projected_by_stage = {stage["stage"]: stage["projected_seconds"] for stage in stage_estimates}
+    stage_finish_times = {}
+    for stage_name, pipeline_stage in stage_pipeline.stages.items():
+        dependency_finish = max((stage_finish_times[dependency] for dependency in pipeline_stage.dependencies), default=0.0)
+        stage_finish_times[stage_name] = dependency_finish + projected_by_stage.get(stage_name, 0.0)
+    if workspace_config.get("pipeline_stage_workers", 4) > 1:
+        projected_seconds = max(stage_finish_times.values(), default=0.0)
+    else:
+        projected_seconds = sum(projected_by_stage.values())
+        
+    total_input_tokens = sum(stage["input_tokens"] for stage in stage_estimates)
+    total_output_tokens = sum(stage["output_tokens"] for stage in stage_estimates)
+    return {
+        "file_count": len(estimate_config.get("discovered_files", [])),
+        "chapter_count": len(estimate_config.get("chapter_sequence", [])),
+        "stages": stage_estimates,
+        "total_calls": sum(stage["calls"] for stage in stage_estimates),
+        "total_cache_hits": sum(stage["cache_hits"] for stage in stage_estimates),
+        "total_input_tokens": total_input_tokens,
+        "total_output_tokens": total_output_tokens,
+        "projected_seconds": projected_seconds,
+        "projected_cost_usd": (
+            total_input_tokens * INPUT_PRICE_PER_MILLION_TOKENS + total_output_tokens * OUTPUT_PRICE_PER_MILLION_TOKENS
+        ) / 1_000_000,
+        "requests_per_minute": requests_per_minute,
+    }
+
+def format_estimate(estimate: Dict[str, Any]) -> str:
+    report_lines = [
+        f"{'Stage':<28}{'Calls':>7}{'Cached':>8}{'Prompt KB':>11}{'In tokens':>11}{'Out tokens':>12}{'Workers':>9}{'Time s':>9}",
+    ]
+    for stage in estimate["stages"]:
+        report_lines.append(
+            f"{stage['stage']:<28}{stage['calls']:>7}{stage['cache_hits']:>8}{stage['prompt_bytes'] / 1024:>11.1f}"
+            f"{stage['input_tokens']:>11}{stage['output_tokens']:>12}{stage['concurrency']:>9}{stage['projected_seconds']:>9.1f}"
+        )
+    rate_limit_note = f"{estimate['requests_per_minute']} requests/min limit" if estimate["requests_per_minute"] else "no rate limit"
+    report_lines += [
+        "",
+        f"Files analyzed: {estimate['file_count']}",
+        f"Chapters: {estimate['chapter_count']}",
+        f"Model calls: {estimate['total_calls']} ({estimate['total_cache_hits']} expected cache hits)",
+        f"Billable tokens: {estimate['total_input_tokens']} in, {estimate['total_output_tokens']} out (approx. {CHARS_PER_TOKEN} chars/token)",
+        f"Projected cost: ${estimate['projected_cost_usd']:.4f} at ${INPUT_PRICE_PER_MILLION_TOKENS}/M input and ${OUTPUT_PRICE_PER_MILLION_TOKENS}/M output tokens",
+        f"Projected wall time: {estimate['projected_seconds'] / 60:.1f} min ({rate_limit_note})",
+    ]
+    return "\n".join(report_lines)